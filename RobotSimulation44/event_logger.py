@@ -1,57 +1,339 @@
 # event_logger.py
-import os, sys, csv, threading
+import os, sys, csv, sqlite3, threading, queue, time, atexit
 from datetime import datetime
 
+import session_format
+from session_store import SessionStore
+
+# Session file format: "csv" (timestamp, task, metric, count rows) or "binary" (columnar .rslog, see session_format;
+# export with session_format.export_csv). LOG_COMPRESS zlib-compresses the binary chunks. Binary records reach the
+# disk a chunk at a time, so a crash can lose up to session_format.CHUNK_SECS + FLUSH_SECS of them.
+LOG_FORMAT = "csv"
+LOG_COMPRESS = True
+
+# Optional SQLite store (path, e.g. "logs/sessions.db") that every session is also written to, one transaction per
+# batch, for queries across sessions (see session_store). None: session files only.
+SESSION_DB = None
+
+# Rows waiting for the writer thread; a full queue drops the row (counted, reported when the session file is
+# finished) instead of stalling the caller
+QUEUE_ROWS = 10000
+
+# Rows written per batch, and how often (s) the session file is flushed to disk
+BATCH_ROWS = 500
+FLUSH_SECS = 1.0
+
+FIELDNAMES = ["timestamp", "task", "metric", "count"]
+
+# Writer thread commands (everything else on the queue is a (path, record) tuple)
+_CLOSE = "close"
+_STOP = "stop"
+_SCENARIO = "scenario"
+
+# Channels. A record is (channel, t, task, code, value, extra): t is monotonic secs since the session file started,
+# code an EV_* event code (metric records: the metric name), value/extra the event's details (colour, bin, ...)
+CH_METRIC = 0
+CH_ROBOT = 1
+CH_USER = 2
+CH_ALARM = 3
+CHANNEL_NAMES = {CH_METRIC: "metric", CH_ROBOT: "robot", CH_USER: "user", CH_ALARM: "alarm"}
+
+# Event codes (value, extra)
+EV_PLACED = 100         # robot put a box in the right bin (box colour, bin)
+EV_MISPLACED = 101      # robot put a box in the wrong bin (box colour, bin)
+EV_NEW_BATCH = 102      # packaging batch started (colour, boxes needed)
+EV_START = 200          # session control (pace, error rate)
+EV_STOP = 201
+EV_COMPLETE = 202
+EV_PICK = 210           # user picked up a misplaced box (box colour, from bin)
+EV_DROP_OK = 211        # user put it in the right bin (box colour, bin)
+EV_DROP_WRONG = 212     # user put it in another wrong bin (box colour, bin)
+EV_CLICK_EMPTY = 213    # user clicked a bin with nothing to fix (bin)
+EV_CANCEL_FADE = 214    # user clicked a fading container that still has an error (bin)
+EV_ALARM_ON = 300       # alarm started (age of the oldest open error, s)
+EV_ALARM_OFF = 301      # alarm stopped (secs it sounded)
+
+EVENT_NAMES = {
+    EV_PLACED: "placed",
+    EV_MISPLACED: "misplaced",
+    EV_NEW_BATCH: "new batch",
+    EV_START: "start",
+    EV_STOP: "stop",
+    EV_COMPLETE: "complete",
+    EV_PICK: "pick",
+    EV_DROP_OK: "drop correct",
+    EV_DROP_WRONG: "drop incorrect",
+    EV_CLICK_EMPTY: "click empty",
+    EV_CANCEL_FADE: "cancel fade",
+    EV_ALARM_ON: "on",
+    EV_ALARM_OFF: "off",
+}
+
+
 # Return base directory for logs (works in dev and PyInstaller)
 def _base_dir():
     if getattr(sys, "frozen", False):  # Running from .exe
         return os.path.dirname(sys.executable)
     return os.path.abspath(".")
 
+
+# Session-relative secs as the "mm:ss.mmm" CSV timestamp of an event
+def format_event_time(t):
+    m, s = divmod(t, 60.0)
+    return f"{int(m):02d}:{s:06.3f}"
+
+
+# CSV row (timestamp, task, metric, count) of a record. Metric samples keep the observer's timer label;
+# events are rendered here, on the writer thread, e.g. "user drop correct" / "red blue"
+def csv_row(record):
+    channel, t, task, code, value, extra = record
+    if channel == CH_METRIC:
+        return {"timestamp": extra, "task": task, "metric": code, "count": value}
+    name = f"{CHANNEL_NAMES.get(channel, channel)} {EVENT_NAMES.get(code, code)}"
+    if value is None:
+        count = ""
+    elif extra is None:
+        count = value
+    else:
+        count = f"{value} {extra}"
+    return {"timestamp": format_event_time(t), "task": task, "metric": name, "count": count}
+
+
 class EventLogger:
+    # Streams log rows to the current session file from a background writer thread. The session file is created
+    # with the first row after a dump_csv(), appended to in batches and flushed every FLUSH_SECS, so memory stays
+    # flat however long the session runs and a crash loses at most the last second of rows.
+    # Callers only queue a plain tuple per event (integer code, monotonic time); all formatting is on the writer.
     def __init__(self):
-        # Store log rows in memory
-        self._rows = []
+        self._queue = queue.Queue(maxsize=QUEUE_ROWS)
         self._lock = threading.Lock()
+        self._path = None       # file of the session being logged (None until its first row)
+        self._origin = 0.0      # monotonic time of that first row
+        self.dropped = 0        # rows lost to a full queue
+        self._dropped_reported = 0
+        self._issued = set()    # session paths handed out (the writer may not have created them yet)
+
+        self._writer = threading.Thread(target=self._run, name="EventLogger", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
-    # Add a row thread-safely
-    def _add(self, row):
+    # Add a record to the current session file (any thread). Queued under the lock, so a dump_csv() can't slip
+    # its close in between and have the writer reopen the file it just finished; never waits on the queue.
+    def _add(self, channel, task, code, value=None, extra=None):
+        now = time.monotonic()
         with self._lock:
-            self._rows.append(row)
+            path = self._session_path(now)
+            try:
+                self._queue.put_nowait((path, (channel, now - self._origin, task, code, value, extra)))
+            except queue.Full:
+                self.dropped += 1
+
+    # Path of the session being logged, starting a new one if there is none (caller holds the lock)
+    def _session_path(self, now):
+        if self._path is None:
+            self._path = self._new_path()
+            self._origin = now
+        return self._path
 
     # Log a single metric update
     def log_metric(self, timestamp, task, metric, count):
-        self._add({
-            "timestamp": timestamp,
-            "task": task,
-            "metric": metric,
-            "count": count
-        })
-
-    # Dump all logged rows to a CSV file
+        self._add(CH_METRIC, task, metric, count, timestamp)
+
+    # Robot action, e.g. log_robot("sorting", EV_MISPLACED, "red", "blue")
+    def log_robot(self, task, code, value=None, extra=None):
+        self._add(CH_ROBOT, task, code, value, extra)
+
+    # User action (clicks, picks, drops, session control)
+    def log_user(self, task, code, value=None, extra=None):
+        self._add(CH_USER, task, code, value, extra)
+
+    # Alarm started (secs: age of the oldest open error) or stopped (secs: how long it sounded)
+    def log_alarm(self, task, started, secs=None):
+        self._add(CH_ALARM, task, EV_ALARM_ON if started else EV_ALARM_OFF,
+                  round(secs, 3) if secs is not None else None)
+
+    # Scenario of the current session (ObserverControl parameters at Start); recorded in the SESSION_DB store and
+    # linked to that session's row
+    def log_scenario(self, name, params):
+        if not SESSION_DB:
+            return
+        with self._lock:
+            try:
+                self._queue.put_nowait((_SCENARIO, self._session_path(time.monotonic()), (name, params)))
+            except queue.Full:
+                self.dropped += 1
+
+    # End the current session file and return its path (None if nothing was logged); rows after this start a
+    # new file. Returns at once: the writer thread finishes the file (and moves it to path, if given) in the background.
     def dump_csv(self, path=None):
         with self._lock:
-            if not self._rows:
-                return None
-            rows = list(self._rows)
-            self._rows.clear()
-
-        # Determine path if not given
-        if path is None:
-            log_dir = os.path.join(_base_dir(), "logs")
-            os.makedirs(log_dir, exist_ok=True)
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            path = os.path.join(log_dir, f"session_{ts}.csv")
-
-        # Write CSV file
-        fieldnames = ["timestamp", "task", "metric", "count"]
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=fieldnames)
-            w.writeheader()
-            w.writerows(rows)
+            current, self._path = self._path, None
+        if current is None:
+            return None
+        # Outside the lock: every row for current is already queued, and a full queue only holds up this call
+        self._queue.put((_CLOSE, current, path))
+        return path or current
+
+    # Write out everything queued and stop the writer (at exit)
+    def close(self, timeout=5.0):
+        if not self._writer.is_alive():
+            return
+        self._queue.put((_STOP, None, None))
+        self._writer.join(timeout)
 
+    def _new_path(self):
+        log_dir = os.path.join(_base_dir(), "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ext = session_format.EXTENSION if LOG_FORMAT == "binary" else ".csv"
+        path = os.path.join(log_dir, f"session_{ts}{ext}")
+        n = 1
+        while os.path.exists(path) or path in self._issued:     # two sessions within one second
+            path = os.path.join(log_dir, f"session_{ts}_{n}{ext}")
+            n += 1
+        self._issued.add(path)
         return path
 
+    # Writer thread: drain the queue in batches into the open session file (and the SESSION_DB store)
+    def _run(self):
+        sink = None
+        open_path = None
+        dirty = False
+        last_flush = time.monotonic()
+        store = None
+        session_id = None
+        scenarios = {}      # session path -> scenario id, for sessions whose file isn't open yet
+
+        if SESSION_DB:
+            try:
+                store = SessionStore(SESSION_DB)
+            except sqlite3.Error as e:
+                print("[EventLogger] Cannot open session database:", e)
+
+        # Run a store call; a database error disables the store but never the session file
+        def db(fn, *args):
+            nonlocal store
+            if store is None:
+                return None
+            try:
+                return fn(store, *args)
+            except sqlite3.Error as e:
+                print("[EventLogger] Session database disabled:", e)
+                store = None
+                return None
+
+        def write(batch):
+            sink.write(batch)
+            if session_id is not None:
+                db(SessionStore.write, session_id, batch)
+
+        def finish():
+            nonlocal sink, open_path, dirty, session_id
+            if sink is not None:
+                sink.close()
+            if session_id is not None:
+                db(SessionStore.end_session, session_id)
+            sink = open_path = session_id = None
+            dirty = False
+            dropped = self.dropped
+            if dropped != self._dropped_reported:
+                print(f"[EventLogger] {dropped - self._dropped_reported} rows dropped: writer fell behind")
+                self._dropped_reported = dropped
+
+        while True:
+            try:
+                items = [self._queue.get(timeout=FLUSH_SECS)]
+            except queue.Empty:
+                items = []
+            while items and len(items) < BATCH_ROWS:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batch = []
+            for item in items:
+                if item[0] in (_CLOSE, _STOP, _SCENARIO):
+                    if batch:
+                        write(batch)
+                        batch = []
+                    cmd, path, target = item
+                    if cmd == _SCENARIO:
+                        scenario_id = db(SessionStore.add_scenario, *target)
+                        if path == open_path and session_id is not None:
+                            db(SessionStore.link_scenario, session_id, scenario_id)
+                        else:
+                            scenarios[path] = scenario_id
+                        continue
+                    if cmd == _STOP:
+                        finish()
+                        if store is not None:
+                            store.close()
+                        return
+                    scenarios.pop(path, None)
+                    if open_path == path:
+                        finish()
+                    if target and os.path.exists(path):
+                        os.replace(path, target)
+                    continue
+
+                path, record = item
+                if path != open_path:
+                    if batch:
+                        write(batch)
+                        batch = []
+                    finish()
+                    try:
+                        sink = _open_sink(path)
+                    except OSError as e:
+                        print("[EventLogger] Cannot write log:", e)
+                        continue
+                    open_path = path
+                    session_id = db(SessionStore.begin_session, path, scenarios.pop(path, None))
+                batch.append(record)
+            if batch:
+                write(batch)
+                dirty = True
+
+            # Periodic flush so a crash loses at most FLUSH_SECS of rows (binary: a chunk can come due with no new rows)
+            now = time.monotonic()
+            if (dirty or (sink is not None and sink.flush_due())) and now - last_flush >= FLUSH_SECS:
+                sink.flush()
+                dirty = False
+                last_flush = now
+
+
+class CsvSink:
+    # Appends records to a session CSV (timestamp, task, metric, count)
+    def __init__(self, path):
+        new_file = not os.path.exists(path)
+        self._f = open(path, "a", newline="", encoding="utf-8")
+        self._w = csv.DictWriter(self._f, fieldnames=FIELDNAMES)
+        if new_file:
+            self._w.writeheader()
+
+    def write(self, records):
+        self._w.writerows(csv_row(r) for r in records)
+
+    # Rows only need flushing after a write
+    def flush_due(self):
+        return False
+
+    def flush(self):
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self):
+        self.flush()
+        self._f.close()
+
+
+# Sink for a session file, by extension (.csv or the columnar .rslog)
+def _open_sink(path):
+    if path.endswith(session_format.EXTENSION):
+        return session_format.SessionWriter(path, compress=LOG_COMPRESS)
+    return CsvSink(path)
+
 
 # Singleton logger instance
 __singleton = None
@@ -2,6 +2,7 @@
 from PyQt5.QtWidgets import QVBoxLayout
 from PyQt5.QtCore import Qt
 from event_logger import get_logger 
+from simulation.summary import summary_rows
 
 # Controls layout management and task operations between user and observer systems
 class LayoutController:
@@ -86,6 +87,9 @@ class LayoutController:
             if hasattr(task, "complete"):
                 task.complete()
 
+        # Summary rows go into this session's log
+        self._log_summary()
+
         # Dump buffered events to CSV on Complete
         path = get_logger().dump_csv()
         if self.status_label:
@@ -101,6 +105,9 @@ class LayoutController:
             if hasattr(task, "stop"):
                 task.stop()
 
+        # Summary rows go into this session's log
+        self._log_summary()
+
         # Dump buffered events to CSV on Stop 
         path = get_logger().dump_csv()
         if self.status_label:
@@ -108,3 +115,13 @@ class LayoutController:
                 self.status_label.setText(f"Stopped. Log saved to: {path}")
             else:
                 self.status_label.setText("Stopped.")
+
+    # Add the tasks' end-of-session summaries to the event log (once per session, if Complete is followed by Stop)
+    def _log_summary(self):
+        summaries = self.task_manager.take_session_summary()
+        ts = self.observer_control.get_timestamp() if self.observer_control else ""
+        logger = get_logger()
+        for name, summary in summaries.items():
+            print(f"[Summary] {name}: {summary}")
+            for metric, value in summary_rows(summary):
+                logger.log_metric(ts, name, metric, value)
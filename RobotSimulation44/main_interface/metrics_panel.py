@@ -0,0 +1,154 @@
+# main_interface/metrics_panel.py
+from PyQt5.QtWidgets import QVBoxLayout, QLabel, QGroupBox, QCheckBox
+
+from main_interface.time_series import GRAPH_WINDOW_S, RingSeries, SessionHistory
+
+# Metric fields every task panel shows (suffixes of "<prefix>_<field>" keys) and their reset values
+PANEL_FIELDS = {
+    "total": 0,
+    "errors": 0,
+    "corrections": 0,
+    "error_rate": 0.0,
+    "correction_rate": 0.0,
+    "latency_p50": None,
+    "latency_p90": None,
+}
+
+
+# Secs with one decimal, or a dash before the first sample
+def _secs(v):
+    return f"{v:.1f}s" if v is not None else "-"
+
+
+class TaskPanel(QGroupBox):
+    # One task's column in the metrics dashboard: four labels plus the errors/corrections graph.
+    # MetricsManager routes "<prefix>_*" keys here, so a panel only does work when its own task reports.
+    # apply() only records values; labels and graph are brought up to date together in flush() on the redraw tick.
+    # Every apply() is a publish tick and adds a graph point, so the live window keeps moving while nothing changes.
+    def __init__(self, prefix, title, total_noun, graph):
+        super().__init__(title)
+        self.prefix = prefix
+        self.total_noun = total_noun   # e.g. "Sorted" -> "Total Sorted: 12"
+        self.values = dict(PANEL_FIELDS)
+        self._labels_dirty = False
+        self._graph_dirty = False
+
+        layout = QVBoxLayout()
+        self.total_label = QLabel()
+        self.errors_label = QLabel()
+        self.error_rate_label = QLabel()
+        self.correction_rate_label = QLabel()
+        self.latency_label = QLabel()
+        for lbl in [
+            self.total_label,
+            self.errors_label,
+            self.error_rate_label,
+            self.correction_rate_label,
+            self.latency_label,
+        ]:
+            layout.addWidget(lbl)
+
+        # field -> (label, text formatter); _shown keeps the value each label last rendered so unchanged ones are skipped
+        self._label_formats = {
+            "total": (self.total_label, lambda v: f"Total {self.total_noun}: {v}"),
+            "errors": (self.errors_label, lambda v: f"Total Errors: {v}"),
+            "error_rate": (self.error_rate_label, lambda v: f"Robot Error Rate: {v:.1f}%"),
+            "correction_rate": (self.correction_rate_label, lambda v: f"User Correction Rate: {v:.1f}%"),
+            "latency": (self.latency_label,
+                        lambda v: f"Correction Latency p50/p90: {_secs(v[0])} / {_secs(v[1])}"),
+        }
+        self._shown = {}
+
+        # Graph (plot backend widget), its live 30 s series and the decimated whole-session history
+        self.graph = graph
+        self.errors_data = RingSeries()
+        self.corrections_data = RingSeries()
+        self.errors_history = SessionHistory()
+        self.corrections_history = SessionHistory()
+        self.start_time = None
+        self.elapsed = 0.0
+
+        # Switch the graph between the live 30 s window and the whole session
+        self.session_view = QCheckBox("Whole session")
+        self.session_view.toggled.connect(self._on_view_toggled)
+        layout.addWidget(self.session_view)
+        layout.addWidget(self.graph)
+        self.setLayout(layout)
+
+        self._refresh_labels()
+
+    # Record {field: value} for this task at time now (s); returns True if anything needs a flush()
+    def apply(self, fields, now):
+        for field, value in fields.items():
+            if field in self.values and self.values[field] != value:
+                self.values[field] = value
+                self._labels_dirty = True
+
+        self._graph_dirty = True
+        if self.start_time is None:
+            self.start_time = now
+        self.elapsed = now - self.start_time
+        for series, history, value in ((self.errors_data, self.errors_history, self.values["errors"]),
+                                       (self.corrections_data, self.corrections_history, self.values["corrections"])):
+            series.append(self.elapsed, value)
+            series.evict_before(self.elapsed - GRAPH_WINDOW_S)
+            history.append(self.elapsed, value)
+        return True
+
+    # Replace the graph with (t, errors, corrections) samples, t in secs since the session start (replay seek)
+    def load_graph(self, samples):
+        for series in (self.errors_data, self.corrections_data, self.errors_history, self.corrections_history):
+            series.clear()
+        self.start_time = 0.0
+        self.elapsed = 0.0
+        for t, errors, corrections in samples:
+            self.errors_data.append(t, errors)
+            self.corrections_data.append(t, corrections)
+            self.errors_history.append(t, errors)
+            self.corrections_history.append(t, corrections)
+            self.elapsed = t
+        self.errors_data.evict_before(self.elapsed - GRAPH_WINDOW_S)
+        self.corrections_data.evict_before(self.elapsed - GRAPH_WINDOW_S)
+        self._graph_dirty = True
+
+    # Bring labels and graph up to date with everything applied since the last flush
+    def flush(self):
+        if self._labels_dirty:
+            self._labels_dirty = False
+            self._refresh_labels()
+        if self._graph_dirty:
+            self._graph_dirty = False
+            if self.session_view.isChecked():
+                self.graph.show_history(self.errors_history, self.corrections_history, self.elapsed)
+            else:
+                self.graph.show_series(self.errors_data, self.corrections_data, self.elapsed)
+
+    def _on_view_toggled(self, checked):
+        if self.start_time is None:
+            return
+        self._graph_dirty = True
+        self.flush()
+
+    # Back to zeros and an empty graph
+    def reset(self):
+        self.values = dict(PANEL_FIELDS)
+        self._labels_dirty = self._graph_dirty = False
+        self._refresh_labels()
+        self.errors_data.clear()
+        self.corrections_data.clear()
+        self.errors_history.clear()
+        self.corrections_history.clear()
+        self.start_time = None
+        self.elapsed = 0.0
+        self.graph.clear()
+
+    # setText only the labels whose value changed since they were last rendered
+    def _refresh_labels(self):
+        for field, (label, fmt) in self._label_formats.items():
+            if field == "latency":
+                value = (self.values["latency_p50"], self.values["latency_p90"])
+            else:
+                value = self.values[field]
+            if field not in self._shown or self._shown[field] != value:
+                self._shown[field] = value
+                label.setText(fmt(value))
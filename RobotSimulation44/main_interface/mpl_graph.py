@@ -0,0 +1,90 @@
+# main_interface/mpl_graph.py
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.ticker import MultipleLocator
+
+from main_interface.time_series import GRAPH_WINDOW_S, history_limits, live_limits
+
+# In blit mode the 30 s x window scrolls in steps of this many secs, so most refreshes keep the cached axes
+BLIT_SCROLL_STEP = 5
+
+
+class MplGraph(FigureCanvas):
+    # Matplotlib errors/corrections graph for one task (the "matplotlib" plot backend of MetricsManager).
+    # Blit mode: axes/grid/legend are cached and only the two lines are redrawn while the ranges hold.
+    def __init__(self, blit=True):
+        self.fig = Figure(figsize=(3, 2.5), facecolor="#f9f9f9")
+        super().__init__(self.fig)
+        self.fig.subplots_adjust(left=0.17, bottom=0.20, right=0.95)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.tick_params(labelsize=8)
+        self.ax.set_facecolor("#f9f9f9")
+        self.ax.set_xlabel("Time (secs)", fontsize=7)
+        self.ax.set_ylabel("Errors", fontsize=7)
+        self.error_line, = self.ax.plot([], [], color='red', label="Errors Made")
+        self.corrections_line, = self.ax.plot([], [], color='green', label="Errors Corrected")
+        self.ax.legend(fontsize=7, loc="upper center", bbox_to_anchor=(0.5, 1.17), ncol=2)
+        self.ax.set_ylim(0, 10)
+        self.ax.set_xlim(0, GRAPH_WINDOW_S)
+        self.ax.yaxis.set_major_locator(MultipleLocator(5))  # 0,5,10
+        self.ax.yaxis.set_minor_locator(MultipleLocator(1))  # grid every 1
+        self.ax.xaxis.set_major_locator(MultipleLocator(10))
+        self.ax.xaxis.set_minor_locator(MultipleLocator(1))
+        self.ax.grid(which='minor', linestyle='--', linewidth=0.5, alpha=0.5)
+        self.ax.grid(which='major', linestyle='--', linewidth=0.5, alpha=0.7)
+
+        self.use_blit = blit
+        self._background = None   # saved axes background (blit mode)
+        self._limits = None       # (min_y, max_y, min_x) the background was drawn with
+        if self.use_blit:
+            # Lines are left out of full draws (so they sit above the legend's lower edge);
+            # every full draw (resize, rescale, reset) re-saves the background and repaints them
+            self.error_line.set_animated(True)
+            self.corrections_line.set_animated(True)
+            self.mpl_connect("draw_event", self._on_full_draw)
+
+    def _on_full_draw(self, event):
+        self._background = self.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.error_line)
+        self.ax.draw_artist(self.corrections_line)
+
+    # Show both live RingSeries (30 s window), rescale the axes and draw
+    def show_series(self, errors, corrections, elapsed):
+        limits = live_limits(errors, corrections, elapsed, BLIT_SCROLL_STEP if self.use_blit else 0)
+        self._show(errors.xy(), corrections.xy(), limits)
+
+    # Show both SessionHistory objects over the whole session so far
+    def show_history(self, errors, corrections, elapsed):
+        self._show(errors.xy(), corrections.xy(), history_limits(errors, corrections, elapsed))
+
+    def _show(self, errors_xy, corrections_xy, limits):
+        self.error_line.set_data(*errors_xy)
+        self.corrections_line.set_data(*corrections_xy)
+
+        if self.use_blit and self._background is not None and self._limits == limits:
+            # Ranges unchanged: restore the cached axes and redraw just the lines
+            self.restore_region(self._background)
+            self.ax.draw_artist(self.error_line)
+            self.ax.draw_artist(self.corrections_line)
+            self.blit(self.ax.bbox)
+            return
+
+        self._set_limits(limits)
+        self.draw()
+
+    # Empty graph with the default ranges
+    def clear(self):
+        self.error_line.set_data([], [])
+        self.corrections_line.set_data([], [])
+        self._set_limits((0, 10, 0, GRAPH_WINDOW_S, 10, 5))
+        self.draw()
+
+    def _set_limits(self, limits):
+        min_y, max_y, min_x, max_x, x_step, y_step = limits
+        self._limits = limits
+        self.ax.set_ylim(min_y, max_y)
+        self.ax.yaxis.set_major_locator(MultipleLocator(y_step))
+        self.ax.yaxis.set_minor_locator(MultipleLocator(y_step / 5))
+        self.ax.set_xlim(min_x, max_x)
+        self.ax.xaxis.set_major_locator(MultipleLocator(x_step))
+        self.ax.xaxis.set_minor_locator(MultipleLocator(x_step / 10))
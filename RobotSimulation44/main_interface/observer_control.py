@@ -5,11 +5,14 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import QObject, pyqtSignal, Qt, QTimer, QTime 
 from event_logger import get_logger
+from main_interface.precheck_worker import PrecheckWorker
+from simulation.rng import new_seed
 import json
 
 class ObserverControl(QObject):
     # Signals to communicate with layout controller
     tasks_changed = pyqtSignal(list)
+    start_requested = pyqtSignal()   # Start clicked, before the new session begins (last one's log can be closed)
     start_pressed = pyqtSignal()
     complete_pressed = pyqtSignal()
     stop_pressed = pyqtSignal()
@@ -28,6 +31,14 @@ class ObserverControl(QObject):
         self.scenario_name_input = QLineEdit()
         self.scenario_name_input.setPlaceholderText("Enter scenario name...")
         scenario_row.addWidget(self.scenario_name_input)
+
+        # Optional fixed RNG seed (blank = new random seed each run)
+        scenario_row.addWidget(QLabel("Seed:"))
+        self.seed_input = QLineEdit()
+        self.seed_input.setPlaceholderText("random")
+        self.seed_input.setFixedWidth(90)
+        scenario_row.addWidget(self.seed_input)
+        self.session_seed = None
         self.control_bar.addLayout(scenario_row)
 
         # Row 1: Buttons (right aligned)
@@ -40,6 +51,7 @@ class ObserverControl(QObject):
         # Save / Load buttons
         self.save_button = QPushButton("Save Params")
         self.load_button = QPushButton("Load Params")
+        self.precheck_button = QPushButton("Pre-check")
 
         # User input for time limit
         self.time_limit_input = QLineEdit()
@@ -50,6 +62,7 @@ class ObserverControl(QObject):
         button_row.addWidget(self.stop_button)
         button_row.addWidget(self.save_button)
         button_row.addWidget(self.load_button)
+        button_row.addWidget(self.precheck_button)
         button_row.addWidget(self.time_limit_input)
         self.control_bar.addLayout(button_row)
 
@@ -229,13 +242,14 @@ class ObserverControl(QObject):
         self.inspection_checkbox.stateChanged.connect(self.update_tasks)
 
         # Connect start/stop buttons to emit signals
-        self.start_button.clicked.connect(lambda: self.start_pressed.emit())
+        self.start_button.clicked.connect(self._on_start_clicked)
         self.complete_button.clicked.connect(lambda: self.complete_pressed.emit())
         self.stop_button.clicked.connect(lambda: self.stop_pressed.emit())
 
         # Connect save/load buttons to corresponding functions
         self.save_button.clicked.connect(self.save_parameters)
         self.load_button.clicked.connect(self.load_parameters)
+        self.precheck_button.clicked.connect(self.precheck_parameters)
 
     # Update connection status text and color
     def set_connection_status(self, text, success=True):
@@ -295,6 +309,28 @@ class ObserverControl(QObject):
             active.append("inspection")
         return active
 
+    # Seed typed into the seed box, or None if blank/invalid
+    def get_seed(self):
+        try:
+            return int(self.seed_input.text().strip())
+        except ValueError:
+            return None
+
+    # Fix the seed for this run and write it into the session log; the session is linked to the current parameters
+    def begin_session(self):
+        params = self.get_scenario_params()
+        get_logger().log_scenario(params["scenario_name"], params)
+        seed = self.get_seed()
+        self.session_seed = seed if seed is not None else new_seed()
+        get_logger().log_metric(self.get_timestamp(), "general", "seed", self.session_seed)
+        print(f"Session seed: {self.session_seed}")
+        return self.session_seed
+
+    def _on_start_clicked(self):
+        self.start_requested.emit()
+        self.begin_session()
+        self.start_pressed.emit()
+
     # Return parameters for a specific task
     def get_params_for_task(self, task_name):
         task_name = task_name.lower()
@@ -303,6 +339,7 @@ class ObserverControl(QObject):
                 "pace": self.get_sort_pace(),
                 "bin_count": self.get_sort_bin_count(),
                 "error_rate": self.get_sort_error_rate(),
+                "seed": self.session_seed,
             }
         elif task_name == "packaging":
             return {
@@ -310,11 +347,13 @@ class ObserverControl(QObject):
                 "error_rate": self.get_pack_error_rate(),
                 "limit": self.get_pack_limit(),
                 "bin_count": self.get_pack_bin_count(), 
+                "seed": self.session_seed,
             }
         elif task_name == "inspection":
             return {
                 "pace": self.get_insp_pace(),
                 "error_rate": self.get_insp_error_rate(),
+                "seed": self.session_seed,
             }
         else:
             return {}
@@ -374,12 +413,13 @@ class ObserverControl(QObject):
     def get_timestamp(self):
         return self.timer_label.text()
 
-    # Save current parameters to JSON file
-    def save_parameters(self):
+    # Current parameters as saved to a scenario JSON file
+    def get_scenario_params(self):
         scenario_name = self.scenario_name_input.text().strip() or "Unnamed_Scenario"
-        params = {
+        return {
             "scenario_name": scenario_name,
             "time_limit": self.time_limit_input.text().strip() or "00:00",
+            "seed": self.get_seed(),
             "sorting": {
                 "enabled": self.sorting_checkbox.isChecked(),
                 "pace": self.sort_pace_dropdown.currentText(),
@@ -400,6 +440,11 @@ class ObserverControl(QObject):
             },
             "sounds": self.get_sounds_enabled()
         }
+
+    # Save current parameters to JSON file
+    def save_parameters(self):
+        params = self.get_scenario_params()
+        scenario_name = params["scenario_name"]
         default_filename = f"{scenario_name}.json"
         file_path, _ = QFileDialog.getSaveFileName(
             None, "Save Parameters", default_filename, "JSON Files (*.json)"
@@ -418,6 +463,8 @@ class ObserverControl(QObject):
             params = json.load(f)
         self.scenario_name_input.setText(params.get("scenario_name", ""))
         self.time_limit_input.setText(params.get("time_limit", "00:00"))
+        seed = params.get("seed")
+        self.seed_input.setText("" if seed is None else str(seed))
         if "sorting" in params:
             s = params["sorting"]
             self.sorting_checkbox.setChecked(s.get("enabled", False))
@@ -445,6 +492,27 @@ class ObserverControl(QObject):
         self.update_tasks()
         print(f"Parameters loaded from {file_path}")
 
+    # Run a saved scenario headless at max speed on a worker thread and print its final metrics when done
+    def precheck_parameters(self):
+        file_path, _ = QFileDialog.getOpenFileName(None, "Pre-check Scenario", "", "JSON Files (*.json)")
+        if not file_path:
+            return
+        with open(file_path, "r") as f:
+            params = json.load(f)
+        self._precheck_worker = PrecheckWorker(params, seed=self.get_seed())
+        self._precheck_worker.metrics_ready.connect(
+            lambda metrics, secs: self._on_precheck_done(params, metrics, secs))
+        self._precheck_worker.failed.connect(lambda error: print(f"Pre-check failed: {error}"))
+        self._precheck_worker.finished.connect(lambda: self.precheck_button.setEnabled(True))
+        self.precheck_button.setEnabled(False)
+        self._precheck_worker.start()
+
+    def _on_precheck_done(self, params, metrics, secs):
+        print(f"Pre-check of '{params.get('scenario_name', '')}' ({params.get('time_limit', '00:00')}) "
+              f"took {secs:.2f}s")
+        for key, value in metrics.items():
+            print(f"  {key}: {value}")
+
     # Ensure time input is formatted as mm:ss
     def format_time_input(self):
         text = self.time_limit_input.text().strip()
@@ -0,0 +1,24 @@
+# main_interface/precheck_worker.py
+import time
+from PyQt5.QtCore import QThread, pyqtSignal
+from simulation.engine import run_scenario
+
+
+class PrecheckWorker(QThread):
+    # Runs a saved scenario headless at max speed off the GUI thread (simulation.engine has no Qt in it)
+    metrics_ready = pyqtSignal(dict, float)     # final metrics, wall secs the run took
+    failed = pyqtSignal(str)
+
+    def __init__(self, params, seed=None):
+        super().__init__()
+        self.params = params
+        self.seed = seed
+
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            metrics = run_scenario(self.params, seed=self.seed)
+        except Exception as e:
+            self.failed.emit(f"{type(e).__name__}: {e}")
+            return
+        self.metrics_ready.emit(metrics, time.perf_counter() - t0)
@@ -0,0 +1,146 @@
+# main_interface/replay_controller.py
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QPushButton, QComboBox, QSlider, QLabel
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from tasks.frame_scheduler import FrameTimer
+
+# Playback speeds offered by the replay bar
+REPLAY_SPEEDS = (1, 2, 4, 8, 16, 32)
+
+
+# "mm:ss" (or "h:mm:ss") for a session time in secs
+def format_position(t):
+    m, s = divmod(int(t), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+# Parse "37:00", "1:05:30" or plain secs back to secs
+def parse_position(text):
+    secs = 0.0
+    for part in text.split(":"):
+        secs = secs * 60 + float(part)
+    return secs
+
+
+class ReplayController(QObject):
+    # Plays a SessionReplay into task widgets (their show_replay) and a MetricsManager, at any speed, one record
+    # at a time, or by seeking. Playback advances on the shared frame scheduler by real frame time x speed.
+    position_changed = pyqtSignal(float)
+    finished = pyqtSignal()
+
+    def __init__(self, replay, tasks, metrics_manager=None, parent=None):
+        super().__init__(parent)
+        self.replay = replay
+        self.tasks = tasks                  # task name -> task widget
+        self.metrics_manager = metrics_manager
+        self.speed = 1.0
+
+        self._timer = FrameTimer(self)
+        self._timer.timeout.connect(self._tick)
+
+    def is_playing(self):
+        return self._timer.isActive()
+
+    def play(self, speed=None):
+        if speed is not None:
+            self.speed = float(speed)
+        if self.replay.at_end():
+            self.seek(0.0)
+        self._timer.start()
+
+    def pause(self):
+        self._timer.stop()
+
+    def set_speed(self, speed):
+        self.speed = float(speed)
+
+    # Apply the next record only
+    def step(self):
+        self.pause()
+        if self.replay.step() is None:
+            self.finished.emit()
+        self._show()
+
+    # Jump to session time t; the dashboard graphs are rebuilt from the session's samples up to t
+    def seek(self, t):
+        self.replay.seek(t)
+        mm = self.metrics_manager
+        if mm:
+            mm.reset_metrics()
+            for prefix in mm.panels:
+                mm.load_graph(prefix, self.replay.graph_samples(prefix))
+        self._show()
+
+    def _tick(self, dt_ms):
+        state = self.replay.state
+        self.replay.advance_to(state.t + dt_ms / 1000.0 * self.speed)
+        self._show()
+        if self.replay.at_end():
+            self.pause()
+            self.finished.emit()
+
+    # Push what changed since the last frame to the dashboard and the task widgets
+    def _show(self):
+        state = self.replay.state
+        metrics, tasks = state.take_changes()
+        if metrics and self.metrics_manager:
+            self.metrics_manager.update_metrics(metrics, now=state.t)
+        for name in tasks:
+            task = self.tasks.get(name)
+            if task is not None:
+                task.show_replay(state.scene(name))
+        self.position_changed.emit(state.t)
+
+
+class ReplayBar(QWidget):
+    # Transport controls for a ReplayController: play/pause, step, speed and a position slider
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        duration = controller.replay.duration
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+
+        self.play_button = QPushButton("Play")
+        self.play_button.clicked.connect(self.toggle_play)
+        layout.addWidget(self.play_button)
+
+        self.step_button = QPushButton("Step")
+        self.step_button.clicked.connect(controller.step)
+        layout.addWidget(self.step_button)
+
+        self.speed_dropdown = QComboBox()
+        self.speed_dropdown.addItems([f"{s}x" for s in REPLAY_SPEEDS])
+        self.speed_dropdown.currentTextChanged.connect(lambda text: controller.set_speed(text.rstrip("x")))
+        layout.addWidget(self.speed_dropdown)
+
+        # Position in whole secs; dragging seeks live
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, int(duration) + 1)
+        self.slider.sliderMoved.connect(controller.seek)
+        layout.addWidget(self.slider, 1)
+
+        self.position_label = QLabel()
+        layout.addWidget(self.position_label)
+        self._total = format_position(duration)
+
+        controller.position_changed.connect(self._on_position)
+        controller.finished.connect(lambda: self.play_button.setText("Play"))
+        self._on_position(controller.replay.state.t)
+
+    def toggle_play(self):
+        if self.controller.is_playing():
+            self.controller.pause()
+            self.play_button.setText("Play")
+        else:
+            self.controller.play()
+            self.play_button.setText("Pause")
+
+    def _on_position(self, t):
+        if not self.slider.isSliderDown():
+            self.slider.blockSignals(True)
+            self.slider.setValue(int(t))
+            self.slider.blockSignals(False)
+        self.position_label.setText(f"{format_position(t)} / {self._total}")
@@ -0,0 +1,172 @@
+# main_interface/strip_chart.py
+import math
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QColor, QPainter, QPen, QFont, QFontMetrics, QPixmap, QPolygonF
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize
+
+from main_interface.time_series import GRAPH_WINDOW_S, history_limits, live_limits
+
+# Same look as the matplotlib graphs: background, line colours, legend labels
+BACKGROUND = QColor("#f9f9f9")
+LINES = (
+    (QColor("red"), "Errors Made"),
+    (QColor("green"), "Errors Corrected"),
+)
+
+# Axis limits of an empty graph (0-10 errors over the first 30 s)
+EMPTY_LIMITS = (0, 10, 0, GRAPH_WINDOW_S, 10, 5)
+
+
+class StripChart(QWidget):
+    # QPainter errors/corrections strip chart for one task (the "native" plot backend of MetricsManager; no matplotlib).
+    # Background, axis titles and legend are cached as a pixmap per size; the grid, frame and ticks depend on the
+    # axis range (which slides with every refresh of the live view) and are drawn each paint with the two polylines.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(200, 150)
+
+        self._series = ((), ())          # (errors, corrections) as ((t, ...), (v, ...)) pairs
+        self._limits = EMPTY_LIMITS      # (min_y, max_y, min_x, max_x, x tick step, y tick step)
+        self._background = None
+        self._background_key = None
+
+        self._tick_font = QFont(self.font()); self._tick_font.setPointSizeF(8)
+        self._label_font = QFont(self.font()); self._label_font.setPointSizeF(7)
+
+    def sizeHint(self):
+        return QSize(300, 250)
+
+    # Show both live RingSeries (30 s window), rescale the axes and repaint
+    def show_series(self, errors, corrections, elapsed):
+        self._series = (errors.xy(), corrections.xy())
+        self._limits = live_limits(errors, corrections, elapsed)
+        self.update()
+
+    # Show both SessionHistory objects over the whole session so far
+    def show_history(self, errors, corrections, elapsed):
+        self._series = (errors.xy(), corrections.xy())
+        self._limits = history_limits(errors, corrections, elapsed)
+        self.update()
+
+    # Empty graph with the default ranges
+    def clear(self):
+        self._series = ((), ())
+        self._limits = EMPTY_LIMITS
+        self.update()
+
+    # Plot area inside the widget (same margins as the matplotlib figure)
+    def _plot_rect(self):
+        w, h = self.width(), self.height()
+        return QRectF(w * 0.17, h * 0.12, w * 0.78, h * 0.68)
+
+    def _build_background(self):
+        # Everything that does not depend on the axis range: fill, axis titles and legend
+        w, h = self.width(), self.height()
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(max(1, int(w * dpr)), max(1, int(h * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(BACKGROUND)
+
+        r = self._plot_rect()
+        p = QPainter(pm)
+
+        # Axis titles, below the tick labels
+        title_top = r.bottom() + 4 + QFontMetrics(self._tick_font).height()
+        p.setFont(self._label_font)
+        fm = p.fontMetrics()
+        p.drawText(QRectF(r.left(), title_top, r.width(), fm.height()), Qt.AlignCenter, "Time (secs)")
+        p.save()
+        p.translate(fm.height() * 0.5 + 2, r.center().y())
+        p.rotate(-90)
+        p.drawText(QRectF(-r.height() / 2, -fm.height() / 2, r.height(), fm.height()), Qt.AlignCenter, "Errors")
+        p.restore()
+
+        # Legend centred above the axes
+        p.setRenderHint(QPainter.Antialiasing)
+        swatch, gap = 18, 10
+        widths = [swatch + 4 + fm.horizontalAdvance(text) for _, text in LINES]
+        box_w = sum(widths) + gap * (len(LINES) - 1) + 12
+        box_h = fm.height() + 6
+        box = QRectF(r.center().x() - box_w / 2, max(1.0, r.top() - box_h - 2), box_w, box_h)
+        p.setPen(QPen(QColor(204, 204, 204), 0.8))
+        p.setBrush(QColor(255, 255, 255, 204))
+        p.drawRoundedRect(box, 3, 3)
+        x = box.left() + 6
+        cy = box.center().y()
+        for (color, text), width in zip(LINES, widths):
+            p.setPen(QPen(color, 1.5))
+            p.drawLine(QPointF(x, cy), QPointF(x + swatch, cy))
+            p.setPen(Qt.black)
+            p.drawText(QRectF(x + swatch + 4, box.top(), width - swatch - 4, box_h), Qt.AlignLeft | Qt.AlignVCenter, text)
+            x += width + gap
+        p.end()
+        return pm
+
+    # Dashed grid, axes frame and tick labels for the current range
+    def _draw_axes(self, p, r, sx, sy):
+        min_y, max_y, min_x, max_x, x_step, y_step = self._limits
+        grid = QColor(176, 176, 176)
+        for step, major in ((x_step / 10, False), (x_step, True)):
+            if step * sx < 3:
+                continue
+            grid.setAlphaF(0.7 if major else 0.5)
+            p.setPen(QPen(grid, 0.5, Qt.DashLine))
+            for k in range(math.ceil(min_x / step), math.floor(max_x / step) + 1):
+                x = r.left() + (k * step - min_x) * sx
+                p.drawLine(QPointF(x, r.top()), QPointF(x, r.bottom()))
+        for step, major in ((y_step / 5, False), (y_step, True)):
+            if step * sy < 3:
+                continue
+            grid.setAlphaF(0.7 if major else 0.5)
+            p.setPen(QPen(grid, 0.5, Qt.DashLine))
+            for k in range(math.ceil(min_y / step), math.floor(max_y / step) + 1):
+                y = r.bottom() - (k * step - min_y) * sy
+                p.drawLine(QPointF(r.left(), y), QPointF(r.right(), y))
+
+        p.setPen(QPen(Qt.black, 0.8))
+        p.setBrush(Qt.NoBrush)
+        p.drawRect(r)
+
+        # Major tick labels
+        p.setFont(self._tick_font)
+        fm = p.fontMetrics()
+        for k in range(math.ceil(min_x / x_step), math.floor(max_x / x_step) + 1):
+            x = r.left() + (k * x_step - min_x) * sx
+            p.drawLine(QPointF(x, r.bottom()), QPointF(x, r.bottom() + 3))
+            p.drawText(QRectF(x - 20, r.bottom() + 4, 40, fm.height()), Qt.AlignHCenter | Qt.AlignTop, f"{k * x_step:g}")
+        for k in range(math.ceil(min_y / y_step), math.floor(max_y / y_step) + 1):
+            y = r.bottom() - (k * y_step - min_y) * sy
+            p.drawLine(QPointF(r.left() - 3, y), QPointF(r.left(), y))
+            p.drawText(QRectF(0, y - fm.height() / 2, r.left() - 5, fm.height()), Qt.AlignRight | Qt.AlignVCenter, f"{k * y_step:g}")
+
+    def resizeEvent(self, e):
+        self._background = None
+        super().resizeEvent(e)
+
+    def paintEvent(self, e):
+        key = (self.width(), self.height(), self.devicePixelRatioF())
+        if self._background is None or self._background_key != key:
+            self._background = self._build_background()
+            self._background_key = key
+
+        min_y, max_y, min_x, max_x = self._limits[:4]
+        r = self._plot_rect()
+        sx = r.width() / max(1e-9, max_x - min_x)
+        sy = r.height() / max(1e-9, max_y - min_y)
+        left, bottom = r.left(), r.bottom()
+
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._background)
+        self._draw_axes(p, r, sx, sy)
+
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setClipRect(r)
+        for (color, _), xy in zip(LINES, self._series):
+            if not xy or len(xy[0]) < 2:
+                continue
+            ts, vs = xy
+            p.setPen(QPen(color, 1.5))
+            p.drawPolyline(QPolygonF([QPointF(left + (t - min_x) * sx, bottom - (v - min_y) * sy)
+                                      for t, v in zip(ts, vs)]))
@@ -1,5 +1,6 @@
 # main_interface/task_manager.py
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from event_logger import get_logger
 from tasks.sorting_task import SortingTask
 from tasks.packaging_task import PackagingTask
 from tasks.inspection_task import InspectionTask
@@ -69,6 +70,10 @@ class TaskManager:
         params = msg.get("params", {})
         active = params.get("active", [])
 
+        # Record the Observer's session seed so this run can be replayed
+        if params.get("seed") is not None:
+            get_logger().log_metric("00:00", "general", "seed", params["seed"])
+
         # Update sounds if present
         if "sounds" in params:
             self.sounds_enabled.update(params["sounds"])
@@ -104,3 +109,22 @@ class TaskManager:
         for task in self.task_instances.values():
             if hasattr(task, "stop"):
                 task.stop()
+
+    # End-of-session summary of every enabled task that ran, by task name; ready as soon as the tasks are stopped
+    def session_summary(self):
+        summaries = {}
+        for name, task in self.task_instances.items():
+            summary = task.metrics_pub.summary
+            if getattr(task, "enabled", True) and summary.started:
+                summaries[name] = summary.result()
+        return summaries
+
+    # session_summary() of the tasks whose summary is not in the log yet; marks them logged for this session
+    def take_session_summary(self):
+        summaries = {}
+        for name, task in self.task_instances.items():
+            summary = task.metrics_pub.summary
+            if getattr(task, "enabled", True) and summary.started and not summary.logged:
+                summary.logged = True
+                summaries[name] = summary.result()
+        return summaries
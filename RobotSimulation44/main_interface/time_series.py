@@ -0,0 +1,219 @@
+# main_interface/time_series.py
+import math
+from array import array
+from collections import deque
+
+
+class RingSeries:
+    # Fixed-capacity (time, value) series for the live graphs: O(1) append and eviction, whatever the session length.
+    # Rows live in two typed ring arrays; rows are addressed by a running sequence number (slot = seq % capacity).
+    # Min/max over the most recent `extrema_window` points are kept in monotonic deques, so the y-range is O(1) too.
+    def __init__(self, capacity=1024, extrema_window=20):
+        self.capacity = int(capacity)
+        self.extrema_window = int(extrema_window)
+        self._t = array("d", bytes(8 * self.capacity))
+        self._v = array("d", bytes(8 * self.capacity))
+        self._head = 0   # seq of the oldest retained row
+        self._seq = 0    # seq the next row will get
+        self._min = deque()   # seqs, values increasing front -> back
+        self._max = deque()   # seqs, values decreasing front -> back
+
+    def __len__(self):
+        return self._seq - self._head
+
+    def clear(self):
+        self._head = self._seq = 0
+        self._min.clear(); self._max.clear()
+
+    def append(self, t, value):
+        # Add a row, overwriting the oldest one if the ring is full
+        if len(self) == self.capacity:
+            self._head += 1
+        seq = self._seq
+        slot = seq % self.capacity
+        self._t[slot] = t
+        self._v[slot] = value
+        self._seq = seq + 1
+
+        v = self._v
+        cap = self.capacity
+        while self._min and v[self._min[-1] % cap] >= value:
+            self._min.pop()
+        self._min.append(seq)
+        while self._max and v[self._max[-1] % cap] <= value:
+            self._max.pop()
+        self._max.append(seq)
+        self._trim_extrema()
+
+    def evict_before(self, t_min):
+        # Drop rows older than t_min (times are appended in order)
+        t = self._t
+        cap = self.capacity
+        while self._head < self._seq and t[self._head % cap] < t_min:
+            self._head += 1
+        self._trim_extrema()
+
+    def _trim_extrema(self):
+        lo = max(self._head, self._seq - self.extrema_window)
+        while self._min and self._min[0] < lo:
+            self._min.popleft()
+        while self._max and self._max[0] < lo:
+            self._max.popleft()
+
+    # Min/max of the last extrema_window values (None when empty)
+    def window_min(self):
+        return self._v[self._min[0] % self.capacity] if self._min else None
+
+    def window_max(self):
+        return self._v[self._max[0] % self.capacity] if self._max else None
+
+    def last(self):
+        return self._v[(self._seq - 1) % self.capacity] if len(self) else None
+
+    def _unwrap(self, arr):
+        # Retained rows oldest first, as one contiguous array
+        start = self._head % self.capacity
+        end = start + len(self)
+        if end <= self.capacity:
+            return arr[start:end]
+        return arr[start:] + arr[:end - self.capacity]
+
+    def times(self):
+        return self._unwrap(self._t)
+
+    def values(self):
+        return self._unwrap(self._v)
+
+    # (times, values) ready for Line2D.set_data
+    def xy(self):
+        return self.times(), self.values()
+
+
+class SessionHistory:
+    # Whole-session history of one value in bounded memory: min/max decimation into at most `buckets` time buckets.
+    # When the session outgrows the buckets, neighbouring pairs are merged and the bucket width doubles,
+    # so a 45-minute session costs the same memory (and the same number of plotted points) as a 2-minute one.
+    def __init__(self, buckets=256, bucket_secs=0.5):
+        self.buckets = int(buckets) & ~1   # even, so pairs always merge cleanly
+        self.initial_bucket_secs = float(bucket_secs)
+        self._alloc()
+
+    def _alloc(self):
+        n = self.buckets
+        self.bucket_secs = self.initial_bucket_secs
+        self._tmin = array("d", bytes(8 * n))
+        self._vmin = array("d", bytes(8 * n))
+        self._tmax = array("d", bytes(8 * n))
+        self._vmax = array("d", bytes(8 * n))
+        self._used = array("b", bytes(n))
+        self._count = 0   # buckets in use (index of the last touched bucket + 1)
+        self.lo = None
+        self.hi = None
+        self.end_time = 0.0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._alloc()
+
+    def append(self, t, value):
+        # Fold one sample into its bucket (times are appended in order)
+        i = int(t // self.bucket_secs)
+        while i >= self.buckets:
+            self._halve()
+            i = int(t // self.bucket_secs)
+        if not self._used[i]:
+            self._used[i] = 1
+            self._tmin[i] = self._tmax[i] = t
+            self._vmin[i] = self._vmax[i] = value
+        else:
+            if value < self._vmin[i]:
+                self._tmin[i], self._vmin[i] = t, value
+            if value > self._vmax[i]:
+                self._tmax[i], self._vmax[i] = t, value
+        self._count = max(self._count, i + 1)
+        self.lo = value if self.lo is None else min(self.lo, value)
+        self.hi = value if self.hi is None else max(self.hi, value)
+        self.end_time = t
+
+    def _halve(self):
+        # Merge bucket pairs (2k, 2k+1) into k and double the bucket width
+        for k in range(self.buckets // 2):
+            a, b = 2 * k, 2 * k + 1
+            used_a, used_b = self._used[a], self._used[b]
+            if used_a and used_b:
+                tmin, vmin = (self._tmin[a], self._vmin[a]) if self._vmin[a] <= self._vmin[b] else (self._tmin[b], self._vmin[b])
+                tmax, vmax = (self._tmax[a], self._vmax[a]) if self._vmax[a] >= self._vmax[b] else (self._tmax[b], self._vmax[b])
+            elif used_a or used_b:
+                src = a if used_a else b
+                tmin, vmin, tmax, vmax = self._tmin[src], self._vmin[src], self._tmax[src], self._vmax[src]
+            self._used[k] = 1 if (used_a or used_b) else 0
+            if self._used[k]:
+                self._tmin[k], self._vmin[k], self._tmax[k], self._vmax[k] = tmin, vmin, tmax, vmax
+        for k in range(self.buckets // 2, self.buckets):
+            self._used[k] = 0
+        self._count = (self._count + 1) // 2
+        self.bucket_secs *= 2
+
+    # Plot points (time order): each bucket contributes its min and max sample, so spikes survive decimation
+    def xy(self):
+        ts, vs = [], []
+        for i in range(self._count):
+            if not self._used[i]:
+                continue
+            if self._tmin[i] == self._tmax[i]:
+                ts.append(self._tmin[i]); vs.append(self._vmin[i])
+            elif self._tmin[i] < self._tmax[i]:
+                ts += (self._tmin[i], self._tmax[i]); vs += (self._vmin[i], self._vmax[i])
+            else:
+                ts += (self._tmax[i], self._tmin[i]); vs += (self._vmax[i], self._vmin[i])
+        return ts, vs
+
+
+# Width of the live graph window (secs)
+GRAPH_WINDOW_S = 30
+
+
+# (min_y, max_y) for a live graph: the last-20-point range of both series, rounded out to multiples of 5
+def graph_y_range(errors, corrections):
+    lows = [v for v in (errors.window_min(), corrections.window_min()) if v is not None]
+    highs = [v for v in (errors.window_max(), corrections.window_max()) if v is not None]
+    if not lows:
+        return 0, 10
+    return max(0, min(lows) // 5 * 5), (int(max(highs) / 5) + 1) * 5
+
+
+# Left edge of the live x window; scroll_step > 0 moves it in whole steps instead of continuously
+def graph_x_start(elapsed, scroll_step=0):
+    if scroll_step:
+        return max(0, math.ceil((elapsed - GRAPH_WINDOW_S) / scroll_step) * scroll_step)
+    return max(0, elapsed - GRAPH_WINDOW_S)
+
+
+# Axis limits handed to the graph widgets: (min_y, max_y, min_x, max_x, x tick step, y tick step)
+def live_limits(errors, corrections, elapsed, scroll_step=0):
+    min_y, max_y = graph_y_range(errors, corrections)
+    min_x = graph_x_start(elapsed, scroll_step)
+    return (min_y, max_y, min_x, min_x + GRAPH_WINDOW_S, 10, 5)
+
+
+# Smallest 1/2/5 x 10^n step that puts at most max_ticks ticks across span
+def nice_step(span, max_ticks=6):
+    raw = max(span, 1e-9) / max_ticks
+    base = 10 ** math.floor(math.log10(raw))
+    for m in (1, 2, 5, 10):
+        if m * base >= raw:
+            return max(1, m * base)
+    return max(1, 10 * base)
+
+
+# Limits for the whole-session view of two SessionHistory objects: 0..end of session, full value range
+def history_limits(errors, corrections, elapsed):
+    highs = [h.hi for h in (errors, corrections) if h.hi is not None]
+    max_x = max(GRAPH_WINDOW_S, elapsed)
+    x_step = nice_step(max_x)
+    hi = max(highs) if highs else 0
+    y_step = nice_step(max(hi, 10), 4)
+    y_step = max(5, y_step)
+    return (0, (int(hi / y_step) + 1) * y_step, 0, max_x, x_step, y_step)
@@ -84,7 +84,8 @@ class ObserverSystemWindow(QMainWindow):
                         "packaging": self.observer_control.get_params_for_task("packaging"),
                         "inspection": self.observer_control.get_params_for_task("inspection"),
                         "sounds": self.observer_control.get_sounds_enabled(), 
-                        "active": self.observer_control.get_active_tasks()
+                        "active": self.observer_control.get_active_tasks(),
+                        "seed": self.observer_control.session_seed
                     }
                 })
             )
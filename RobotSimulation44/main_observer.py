@@ -1,16 +1,42 @@
 # main_observer.py
 import sys, os
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QApplication
 from main_interface.unified_interface import ObserverSystemWindow
 from main_interface.task_manager import TaskManager
+from main_interface import metrics_manager
 from network.server import Server
+from network.metrics_delta import MetricsAssembler
+import event_logger
 from event_logger import get_logger
 from network.discovery import DiscoveryBroadcaster
+from simulation.summary import summary_rows
+
+# How long (ms) Stop/Complete waits for the User's task summaries before closing the session log without them
+SUMMARY_WAIT_MS = 3000
+
+
+class ObserverMessageBridge(QObject):
+    # Hands messages from the server thread to the GUI thread
+    metrics_received = pyqtSignal(dict)
+    summary_received = pyqtSignal(dict)
+
 
 def main():
     # Initialize QApplication
     app = QApplication(sys.argv)
 
+    # Optional graph backend override, e.g. --plot-backend=native on kiosks without matplotlib
+    for arg in sys.argv[1:]:
+        if arg.startswith("--plot-backend="):
+            metrics_manager.PLOT_BACKEND = arg.split("=", 1)[1]
+        # Session log format: csv (default) or binary (columnar .rslog, see session_format.py)
+        elif arg.startswith("--log-format="):
+            event_logger.LOG_FORMAT = arg.split("=", 1)[1]
+        # Also store every session in a SQLite database for cross-session queries (see session_store.py)
+        elif arg.startswith("--session-db="):
+            event_logger.SESSION_DB = arg.split("=", 1)[1]
+
     # Create TaskManager
     task_manager = TaskManager()
 
@@ -18,25 +44,92 @@ def main():
     observer_window = ObserverSystemWindow(task_manager)
     oc = observer_window.observer_control
 
-    # Handle incoming messages from User
+    # Totals per task rebuilt from the User's numbered metric deltas
+    assembler = MetricsAssembler()
+
+    # Latest end-of-session summary per task prefix
+    summaries = {}
+
+    # Session log waiting for the summaries of these task names (None: no Stop/Complete pending)
+    pending = {"tasks": None}
+    bridge = ObserverMessageBridge()
+
+    # Show and log a {key: value} batch of metrics
+    def show_metrics(data):
+        observer_window.metrics_manager.update_metrics(data)
+        log_metrics(data)
+
+    # Log a {key: value} batch of metrics
+    def log_metrics(data):
+        ts = oc.get_timestamp()
+        logger = get_logger()
+        # Log metrics per task
+        for key, value in data.items():
+            # Stats without a sample yet (e.g. no corrections so far)
+            if value is None:
+                continue
+            if key.startswith("sort_"):
+                task = "sorting"
+            elif key.startswith("pack_"):
+                task = "packaging"
+            elif key.startswith("insp_"):
+                task = "inspection"
+            else:
+                task = "general"
+            logger.log_metric(ts, task, key, value)
+
+    # Handle incoming messages from User (server thread: anything touching widgets goes through the bridge)
     def handle_message(msg):
-        # Update metrics if received
-        if msg.get("command") == "metrics":
-            data = msg.get("data", {})
-            observer_window.metrics_manager.update_metrics(data)
-            ts = oc.get_timestamp()
-            logger = get_logger()
-            # Log metrics per task
-            for key, value in data.items():
-                if key.startswith("sort_"):
-                    task = "sorting"
-                elif key.startswith("pack_"):
-                    task = "packaging"
-                elif key.startswith("insp_"):
-                    task = "inspection"
-                else:
-                    task = "general"
-                logger.log_metric(ts, task, key, value)
+        cmd = msg.get("command")
+        if cmd in ("metrics_delta", "metrics"):
+            bridge.metrics_received.emit(msg)
+        # End-of-session summary of one task, sent when it is stopped/completed
+        elif cmd == "summary":
+            summaries[msg.get("task")] = msg.get("data", {})
+            print(f"[Observer] Session summary {msg.get('task')}: {msg.get('data')}")
+            bridge.summary_received.emit(msg.get("data", {}))
+
+    # GUI thread: live metrics for the dashboard and the session log
+    def on_metrics(msg):
+        # Only what changed since the task's previous tick
+        # (one per task per tick: the dashboard gets the task's totals so its graph keeps moving)
+        if msg.get("command") == "metrics_delta":
+            changed = assembler.apply(msg)
+            observer_window.metrics_manager.update_metrics(assembler.totals(msg.get("task")))
+            log_metrics(changed)
+        # Full snapshot (older User builds)
+        else:
+            show_metrics(msg.get("data", {}))
+
+    bridge.metrics_received.connect(on_metrics)
+
+    # GUI thread: summary rows go into the session log still open for them; close it once all are in
+    def on_summary(data):
+        logger = get_logger()
+        ts = oc.get_timestamp()
+        for metric, value in summary_rows(data):
+            logger.log_metric(ts, data.get("task", "general"), metric, value)
+        if pending["tasks"] is not None:
+            pending["tasks"].discard(data.get("task"))
+            if not pending["tasks"]:
+                close_session_log()
+
+    bridge.summary_received.connect(on_summary)
+
+    # Close the session log now that the summaries are in (or SUMMARY_WAIT_MS passed)
+    def close_session_log():
+        if pending["tasks"] is None:
+            return
+        pending["tasks"] = None
+        path = get_logger().dump_csv()
+        if path:
+            print(f"[Observer] Metrics saved to {path}")
+            observer_window.log_button.setText(f"Log saved to {os.path.dirname(path)}")
+
+    # After Stop/Complete: keep the log open until the active tasks' summaries arrive
+    def await_summaries():
+        pending["tasks"] = set(oc.get_active_tasks())
+        QTimer.singleShot(SUMMARY_WAIT_MS, close_session_log)
 
     #Connection hooks
     def on_client_connect(addr):
@@ -67,6 +160,10 @@ def main():
         lambda active: server.send({"command": "update_active", "active": active})
     )
 
+    # A Start while the last session still waits for summaries closes its log first, so nothing of the new
+    # session (scenario, seed) lands in it
+    oc.start_requested.connect(close_session_log)
+
     # Start button: send start command with parameters
     oc.start_pressed.connect(
         lambda: server.send({
@@ -76,28 +173,23 @@ def main():
                 "packaging": oc.get_params_for_task("packaging"),
                 "inspection": oc.get_params_for_task("inspection"),
                 "sounds": oc.get_sounds_enabled(),
-                "active": oc.get_active_tasks()
+                "active": oc.get_active_tasks(),
+                "seed": oc.session_seed
             }
         })
     )
 
-    # Complete button (or timer expiry): send complete and save logs
+    # Complete button (or timer expiry): send complete and save logs once the summaries are in
     def complete_handler():
         server.send({"command": "complete"})
-        path = get_logger().dump_csv()
-        if path:
-            print(f"[Observer] Metrics saved to {path}")
-            observer_window.log_button.setText(f"Log saved to {os.path.dirname(path)}")
+        await_summaries()
 
     oc.complete_pressed.connect(complete_handler)
 
-    # Stop button: send stop and save logs
+    # Stop button: send stop and save logs once the summaries are in
     def stop_handler():
         server.send({"command": "stop"})
-        path = get_logger().dump_csv()
-        if path:
-            print(f"[Observer] Metrics saved to {path}")
-            observer_window.log_button.setText(f"Log saved to {os.path.dirname(path)}")
+        await_summaries()
 
     oc.stop_pressed.connect(stop_handler)
 
@@ -0,0 +1,81 @@
+# main_replay.py
+import sys
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
+from PyQt5.QtCore import Qt
+from main_interface.metrics_manager import MetricsManager
+from main_interface.replay_controller import ReplayController, ReplayBar, parse_position
+from simulation.replay import SessionReplay, load_records
+from tasks.sorting_task import SortingTask
+from tasks.packaging_task import PackagingTask
+from tasks.inspection_task import InspectionTask
+
+TASK_CLASSES = {
+    "sorting": SortingTask,
+    "packaging": PackagingTask,
+    "inspection": InspectionTask,
+}
+
+USAGE = ("usage: python main_replay.py <session.rslog|session.csv|sessions.db> "
+         "[--session=ID] [--at=mm:ss] [--speed=N] [--play]")
+
+
+def main():
+    # Review a logged session: python main_replay.py logs/session_20250101_120000.rslog --at=37:00
+    path = None
+    session_id = None
+    start_at = 0.0
+    speed = 1.0
+    autoplay = False
+    for arg in sys.argv[1:]:
+        if arg.startswith("--session="):
+            session_id = int(arg.split("=", 1)[1])
+        elif arg.startswith("--at="):
+            start_at = parse_position(arg.split("=", 1)[1])
+        elif arg.startswith("--speed="):
+            speed = float(arg.split("=", 1)[1].rstrip("x"))
+        elif arg == "--play":
+            autoplay = True
+        elif not arg.startswith("-"):
+            path = arg
+    if path is None:
+        print(USAGE)
+        sys.exit(1)
+
+    app = QApplication(sys.argv)
+
+    replay = SessionReplay(load_records(path, session_id))
+    print(f"[Replay] {path}: {len(replay.records)} records, {replay.duration:.1f}s")
+
+    window = QMainWindow()
+    window.setWindowTitle(f"Session Replay - {path}")
+    window.setGeometry(100, 100, 1200, 900)
+    window.setStyleSheet("QMainWindow { background-color: #1b2430; }")
+    main_widget = QWidget()
+    window.setCentralWidget(main_widget)
+    layout = QVBoxLayout(main_widget)
+    layout.setAlignment(Qt.AlignTop)
+
+    # One widget per task that has events in the log; they only render what the replay shows them
+    tasks = {}
+    for name in replay.tasks():
+        tasks[name] = TASK_CLASSES[name]()
+        layout.addWidget(tasks[name], 0, Qt.AlignHCenter)
+
+    metrics_manager = MetricsManager()
+    layout.addWidget(metrics_manager)
+
+    controller = ReplayController(replay, tasks, metrics_manager)
+    bar = ReplayBar(controller)
+    layout.addWidget(bar)
+    bar.speed_dropdown.setCurrentText(f"{speed:g}x")
+    controller.set_speed(speed)
+
+    controller.seek(start_at)
+    if autoplay:
+        bar.toggle_play()
+
+    window.show()
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    main()
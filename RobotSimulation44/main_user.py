@@ -15,6 +15,7 @@ class UserMessageBridge(QObject):
     start_tasks = pyqtSignal(dict)
     pause_tasks = pyqtSignal()
     stop_tasks = pyqtSignal()
+    complete_tasks = pyqtSignal()
 
 
 def main():
@@ -39,7 +40,9 @@ def main():
     bridge.update_active.connect(user_window.layout_controller.update_workspace)
     bridge.start_tasks.connect(task_manager.start_all_tasks)
     bridge.pause_tasks.connect(task_manager.pause_all_tasks)
-    bridge.stop_tasks.connect(task_manager.stop_all_tasks)
+    # Via the layout controller so the task summaries go into the session log before it is closed
+    bridge.stop_tasks.connect(user_window.layout_controller.stop_tasks)
+    bridge.complete_tasks.connect(user_window.layout_controller.complete_tasks)
 
     # Handle incoming messages from observer / server
     def handle_message(msg):
@@ -54,8 +57,8 @@ def main():
             bridge.pause_tasks.emit()
         elif cmd == "stop":
             bridge.stop_tasks.emit()
-        elif cmd == "complete":  
-            user_window.layout_controller.complete_tasks()
+        elif cmd == "complete":
+            bridge.complete_tasks.emit()
 
     # Listener is created here so we can reference it inside connect_to_observer
     listener = DiscoveryListener(on_found=lambda ip, port: connect_to_observer(ip, port))
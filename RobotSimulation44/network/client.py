@@ -3,6 +3,7 @@ import socket
 import threading
 import json
 import time
+from network.framing import MessageBuffer, encode
 
 class Client:
     def __init__(self, host="127.0.0.1", port=5000, on_message=None, reconnect_interval=2):
@@ -36,17 +37,20 @@ class Client:
                         self._send_raw(msg)
                     self._send_buffer.clear()
 
-                    # Listen for incoming messages
+                    # Listen for incoming messages (newline-delimited JSON, see network/framing.py)
+                    buffer = MessageBuffer()
                     while self.running:
                         data = s.recv(4096)
                         if not data:
                             break
-                        try:
-                            msg = json.loads(data.decode("utf-8"))
+                        for line in buffer.feed(data):
+                            try:
+                                msg = json.loads(line.decode("utf-8"))
+                            except (json.JSONDecodeError, UnicodeDecodeError):
+                                print("[Client] Invalid JSON received")
+                                continue
                             if self.on_message:
                                 self.on_message(msg)
-                        except json.JSONDecodeError:
-                            print("[Client] Invalid JSON received")
             except ConnectionRefusedError:
                 print("[Client] Connection refused, retrying...")
                 time.sleep(self.reconnect_interval)
@@ -57,7 +61,7 @@ class Client:
         # Send a message immediately to the server (internal use)
         if self.conn:
             try:
-                self.conn.sendall(json.dumps(msg).encode("utf-8"))
+                self.conn.sendall(encode(msg))
             except Exception as e:
                 print("[Client] Send failed:", e)
 
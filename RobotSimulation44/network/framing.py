@@ -0,0 +1,34 @@
+# network/framing.py
+import json
+
+# Messages on the TCP stream are newline-delimited JSON (json.dumps never writes a raw newline), so one recv()
+# holding several messages, or only part of one, is split back into whole messages.
+
+# A peer that never sends a newline cannot grow the buffer past this many bytes
+MAX_BUFFER_BYTES = 1 << 20
+
+
+def encode(msg):
+    return (json.dumps(msg) + "\n").encode("utf-8")
+
+
+class MessageBuffer:
+    # Collects recv() chunks; feed() returns the complete messages (raw bytes, one JSON document each) so far
+    def __init__(self):
+        self._pending = b""
+
+    def feed(self, data):
+        *lines, self._pending = (self._pending + data).split(b"\n")
+        # Older peers send one bare JSON document per send(): take the tail once it parses on its own
+        if self._pending and self._pending.rstrip().endswith(b"}"):
+            try:
+                json.loads(self._pending.decode("utf-8"))
+            except ValueError:
+                pass
+            else:
+                lines.append(self._pending)
+                self._pending = b""
+        if len(self._pending) > MAX_BUFFER_BYTES:
+            lines.append(self._pending)     # reported as invalid by the caller
+            self._pending = b""
+        return [line for line in lines if line.strip()]
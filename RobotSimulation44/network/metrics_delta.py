@@ -0,0 +1,103 @@
+# network/metrics_delta.py
+
+# Live metrics publish cadence (ms): at most one message per task per tick, whatever the pace
+PUBLISH_MS = 250
+
+# Every Nth message of a session carries every field, so an observer that missed one resyncs
+KEYFRAME_EVERY = 20
+
+# Whole-number counters ("<prefix>_<field>") sent as increments; every other field is sent as its new value
+COUNTER_FIELDS = ("total", "errors", "corrections")
+
+_MISSING = object()
+
+
+def _is_counter(key):
+    return key.partition("_")[2] in COUNTER_FIELDS
+
+
+class MetricsAggregator:
+    # Sending side of one task's live metrics. update() just records the latest values (cheap enough per box);
+    # take() turns everything that changed since the previous take() into one numbered message:
+    #   {"command": "metrics_delta", "task": prefix, "seq": n, "add": {counter: increment}, "set": {key: value}}
+    # Message 1 and every KEYFRAME_EVERY-th carry "full" (all values) instead of add/set. A tick with no changes
+    # still yields a message (no add/set): it moves the receiver's graphs on and shows a gap as soon as one happens.
+    def __init__(self, prefix, keyframe_every=KEYFRAME_EVERY):
+        self.prefix = prefix
+        self.keyframe_every = keyframe_every
+        self.reset()
+
+    # New session: numbering restarts at 1 and the next message is a keyframe
+    def reset(self):
+        self.values = {}    # key -> latest value
+        self._sent = {}     # key -> value as of the last message
+        self.seq = 0
+
+    def update(self, metrics):
+        self.values.update(metrics)
+
+    # {key: value} changed since the last message (possibly empty) plus the message itself
+    def take(self):
+        changed = {k: v for k, v in self.values.items() if self._sent.get(k, _MISSING) != v}
+
+        self.seq += 1
+        msg = {"command": "metrics_delta", "task": self.prefix, "seq": self.seq}
+        if self.seq == 1 or self.seq % self.keyframe_every == 0:
+            msg["full"] = dict(self.values)
+        else:
+            add, put = {}, {}
+            for key, value in changed.items():
+                prev = self._sent.get(key)
+                if _is_counter(key) and isinstance(prev, int) and isinstance(value, int):
+                    add[key] = value - prev
+                else:
+                    put[key] = value
+            if add:
+                msg["add"] = add
+            if put:
+                msg["set"] = put
+        self._sent.update(changed)
+        return changed, msg
+
+
+class MetricsAssembler:
+    # Receiving side: rebuilds each task's totals from the numbered deltas of its MetricsAggregator.
+    # A gap in the numbering (dropped or garbled message) leaves the counters unknown until the next keyframe.
+    def __init__(self):
+        self.values = {}    # task prefix -> {key: value}
+        self.seq = {}       # task prefix -> last applied seq
+        self.stale = set()  # task prefixes waiting for a keyframe
+
+    # Apply one metrics_delta message; returns the {key: value} totals it changed
+    def apply(self, msg):
+        task = msg.get("task")
+        seq = msg.get("seq", 0)
+        values = self.values.setdefault(task, {})
+
+        if "full" in msg:
+            if seq == 1:
+                values.clear()
+            changed = {k: v for k, v in msg["full"].items() if values.get(k, _MISSING) != v}
+            values.update(msg["full"])
+            self.stale.discard(task)
+            self.seq[task] = seq
+            return changed
+
+        if seq != self.seq.get(task, 0) + 1:
+            self.stale.add(task)
+        self.seq[task] = seq
+
+        changed = dict(msg.get("set", {}))
+        if task not in self.stale:
+            for key, inc in msg.get("add", {}).items():
+                changed[key] = values.get(key, 0) + inc
+        values.update(changed)
+        return changed
+
+    def totals(self, task):
+        return dict(self.values.get(task, {}))
+
+    def reset(self):
+        self.values.clear()
+        self.seq.clear()
+        self.stale.clear()
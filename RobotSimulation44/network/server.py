@@ -2,6 +2,7 @@
 import socket
 import threading
 import json
+from network.framing import MessageBuffer, encode
 
 class Server:
     def __init__(self, host="0.0.0.0", port=5000,
@@ -48,19 +49,22 @@ class Server:
                         self._send_raw(msg)
                     self._send_buffer.clear()
 
-                    # Communication loop with connected client
+                    # Communication loop with connected client (newline-delimited JSON, see network/framing.py)
+                    buffer = MessageBuffer()
                     with self.client_conn:
                         while self.running:
                             try:
                                 data = self.client_conn.recv(4096)
                                 if not data:
                                     break
-                                try:
-                                    msg = json.loads(data.decode("utf-8"))
+                                for line in buffer.feed(data):
+                                    try:
+                                        msg = json.loads(line.decode("utf-8"))
+                                    except (json.JSONDecodeError, UnicodeDecodeError):
+                                        print("[Server] Invalid JSON received")
+                                        continue
                                     if self.on_message:
                                         self.on_message(msg)
-                                except json.JSONDecodeError:
-                                    print("[Server] Invalid JSON received")
                             except ConnectionResetError:
                                 break
 
@@ -81,7 +85,7 @@ class Server:
         # Send JSON message to connected client directly
         if self.client_conn:
             try:
-                self.client_conn.sendall(json.dumps(msg).encode("utf-8"))
+                self.client_conn.sendall(encode(msg))
             except Exception as e:
                 print("[Server] Send failed:", e)
                 self.client_conn = None  # mark as closed
@@ -0,0 +1,263 @@
+# session_format.py
+import os, sys, csv, struct, time, zlib
+from array import array
+
+# Columnar session log (".rslog"), written by EventLogger when LOG_FORMAT = "binary".
+#   file   = header, then append-only chunks (a crash can only cut off the chunk being written)
+#   header = b"RSLOG\n" + u16 version
+#   chunk  = b"CHNK", u32 records, u32 new strings, u8 flags, u32 payload bytes, u32 crc32(payload)
+#   payload (zlib-compressed if flags & COMPRESSED) = the chunk's new strings (u16 length + utf-8 each),
+#            then each column of COLUMNS as one fixed-width little-endian array
+# A record is EventLogger's (channel, t, task, code, value, extra). task is an id in the file's string table;
+# code/value/extra are variants: a kind byte (NONE/INT/FLOAT/STR) plus the number or a string id. code is an
+# EV_* number or a metric name, so it fits an int32; value/extra also carry floats (latencies, rates), so they
+# keep one float64 (exact for ints up to 2**53) rather than a per-record column switch; zlib removes the
+# constant high bytes of small ints.
+MAGIC = b"RSLOG\n"
+VERSION = 2
+EXTENSION = ".rslog"
+
+COMPRESSED = 1
+
+NONE, INT, FLOAT, STR = 0, 1, 2, 3
+
+# (name, array typecode), in payload order; every record is 36 bytes before compression
+COLUMNS = (
+    ("t", "d"),
+    ("channel", "B"),
+    ("task", "I"),
+    ("code_kind", "B"),
+    ("code", "i"),
+    ("value_kind", "B"),
+    ("value", "d"),
+    ("extra_kind", "B"),
+    ("extra", "d"),
+)
+
+# Version 1 files (float64 code column) are still readable
+_COLUMNS_BY_VERSION = {1: COLUMNS[:4] + (("code", "d"),) + COLUMNS[5:], 2: COLUMNS}
+
+# A chunk is cut every CHUNK_RECORDS records, or by the first flush() once its oldest record is CHUNK_SECS old
+# (roughly the most a crash can lose); busy sessions fill whole chunks, quiet ones get one every CHUNK_SECS at most
+CHUNK_RECORDS = 4096
+CHUNK_SECS = 2.0
+
+_INT32 = (-2**31, 2**31 - 1)
+
+_HEADER = struct.Struct("<6sH")
+_CHUNK = struct.Struct("<4sIIBII")
+_STRLEN = struct.Struct("<H")
+_SWAP = sys.byteorder != "little"
+
+
+class SessionWriter:
+    # Appends records to a .rslog file chunk by chunk; same write/flush/close interface as EventLogger's CSV sink
+    def __init__(self, path, compress=True):
+        self.path = path
+        self.compress = compress
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._strings = {}          # string -> id
+        self._new_strings = []
+        self._columns = {name: array(code) for name, code in COLUMNS}
+        self._count = 0
+        self._chunk_started = None      # monotonic time of the first buffered record
+        if new_file:
+            self._f = open(path, "wb")
+            self._f.write(_HEADER.pack(MAGIC, VERSION))
+            return
+
+        # Reopened: carry on after the last complete chunk (dropping a torn one) with the same string table
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+        if len(head) == _HEADER.size and _HEADER.unpack(head) != (MAGIC, VERSION):
+            raise ValueError(f"{path} is not a version {VERSION} session log")
+        end = _HEADER.size
+        for new, _, end in _scan(path):
+            for s in new:
+                self._strings[s] = len(self._strings)
+        self._f = open(path, "r+b")
+        self._f.truncate(end)
+        self._f.seek(end)
+
+    def _sid(self, s):
+        sid = self._strings.get(s)
+        if sid is None:
+            sid = self._strings[s] = len(self._strings)
+            self._new_strings.append(s)
+        return sid
+
+    def _variant(self, v):
+        if v is None:
+            return NONE, 0.0
+        if isinstance(v, (bool, int)):
+            return INT, float(v)
+        if isinstance(v, float):
+            return FLOAT, v
+        return STR, float(self._sid(str(v)))
+
+    def write(self, records):
+        if self._chunk_started is None and records:
+            self._chunk_started = time.monotonic()
+        cols = self._columns
+        for channel, t, task, code, value, extra in records:
+            cols["t"].append(t)
+            cols["channel"].append(channel)
+            cols["task"].append(self._sid(task))
+            kind, num = self._variant(code)
+            if kind == FLOAT or not _INT32[0] <= num <= _INT32[1]:
+                kind, num = STR, float(self._sid(str(code)))
+            cols["code_kind"].append(kind)
+            cols["code"].append(int(num))
+            for name, v in (("value", value), ("extra", extra)):
+                kind, num = self._variant(v)
+                cols[name + "_kind"].append(kind)
+                cols[name].append(num)
+            self._count += 1
+            if self._count >= CHUNK_RECORDS:
+                self._write_chunk()
+                cols = self._columns
+        if self._chunk_started is not None and time.monotonic() - self._chunk_started >= CHUNK_SECS:
+            self._write_chunk()
+
+    def _write_chunk(self):
+        if not self._count:
+            return
+        parts = []
+        for s in self._new_strings:
+            b = s.encode("utf-8")[:0xFFFF]
+            parts.append(_STRLEN.pack(len(b)))
+            parts.append(b)
+        for name, _ in COLUMNS:
+            col = self._columns[name]
+            if _SWAP:
+                col.byteswap()
+            parts.append(col.tobytes())
+        payload = b"".join(parts)
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload, 6)
+            flags |= COMPRESSED
+        self._f.write(_CHUNK.pack(b"CHNK", self._count, len(self._new_strings), flags, len(payload),
+                                  zlib.crc32(payload)))
+        self._f.write(payload)
+
+        self._new_strings = []
+        self._columns = {name: array(code) for name, code in COLUMNS}
+        self._count = 0
+        self._chunk_started = None
+
+    # True once the buffered records are CHUNK_SECS old: a flush() is due even if no records came in since
+    def flush_due(self):
+        return self._chunk_started is not None and time.monotonic() - self._chunk_started >= CHUNK_SECS
+
+    # Push the chunks written so far to disk; buffered records wait for their chunk (see CHUNK_SECS)
+    def flush(self):
+        if self.flush_due():
+            self._write_chunk()
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self):
+        self._write_chunk()
+        self.flush()
+        self._f.close()
+
+
+# Yield (new strings, {column: array}) per complete chunk; stops quietly at a truncated or corrupt tail
+def read_chunks(path):
+    for strings, columns, _ in _scan(path):
+        yield strings, columns
+
+
+# read_chunks() plus the file offset just after each chunk
+def _scan(path):
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size or _HEADER.unpack(head)[0] != MAGIC:
+            raise ValueError(f"{path} is not a session log")
+        layout = _COLUMNS_BY_VERSION.get(_HEADER.unpack(head)[1])
+        if layout is None:
+            raise ValueError(f"{path} is a newer session log (version {_HEADER.unpack(head)[1]})")
+        while True:
+            raw = f.read(_CHUNK.size)
+            if len(raw) < _CHUNK.size:
+                return
+            magic, count, n_strings, flags, size, crc = _CHUNK.unpack(raw)
+            payload = f.read(size)
+            if magic != b"CHNK" or len(payload) < size or zlib.crc32(payload) != crc:
+                return
+            if flags & COMPRESSED:
+                payload = zlib.decompress(payload)
+
+            strings, pos = [], 0
+            for _ in range(n_strings):
+                (n,) = _STRLEN.unpack_from(payload, pos)
+                pos += _STRLEN.size
+                strings.append(payload[pos:pos + n].decode("utf-8"))
+                pos += n
+            columns = {}
+            for name, code in layout:
+                col = array(code)
+                nbytes = col.itemsize * count
+                col.frombytes(payload[pos:pos + nbytes])
+                if _SWAP:
+                    col.byteswap()
+                columns[name] = col
+                pos += nbytes
+            yield strings, columns, f.tell()
+
+
+# Whole session as one typed array per column plus the string table (what analysis code should load)
+def load_columns(path):
+    strings = []
+    columns = {}
+    for new, chunk in read_chunks(path):
+        strings.extend(new)
+        for name, col in chunk.items():
+            if name in columns:
+                columns[name].extend(col)
+            else:
+                columns[name] = col     # keeps the file version's typecode
+    return columns or {name: array(code) for name, code in COLUMNS}, strings
+
+
+def _decode(kind, num, strings):
+    if kind == INT:
+        return int(num)
+    if kind == FLOAT:
+        return num
+    if kind == STR:
+        return strings[int(num)]
+    return None
+
+
+# Yield EventLogger records (channel, t, task, code, value, extra) in file order
+def iter_records(path):
+    strings = []
+    for new, c in read_chunks(path):
+        strings.extend(new)
+        for i in range(len(c["t"])):
+            yield (c["channel"][i], c["t"][i], strings[c["task"][i]],
+                   _decode(c["code_kind"][i], c["code"][i], strings),
+                   _decode(c["value_kind"][i], c["value"][i], strings),
+                   _decode(c["extra_kind"][i], c["extra"][i], strings))
+
+
+# Convert a .rslog session to the CSV layout of the event log (timestamp, task, metric, count); returns the CSV path
+def export_csv(path, csv_path=None):
+    from event_logger import FIELDNAMES, csv_row
+    if csv_path is None:
+        csv_path = os.path.splitext(path)[0] + ".csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        w.writeheader()
+        w.writerows(csv_row(r) for r in iter_records(path))
+    return csv_path
+
+
+# python session_format.py <session.rslog> [out.csv]
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python session_format.py <session.rslog> [out.csv]")
+        sys.exit(1)
+    print(export_csv(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None))
@@ -0,0 +1,147 @@
+# session_store.py
+import os, json, socket, sqlite3
+from datetime import datetime
+
+# SQLite store shared by every session of a study (EventLogger fills it when SESSION_DB is set).
+# One row per session; its events and metric samples reference it, so cross-session questions
+# ("p90 correction latency of every sorting session last month") are a single indexed query.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    params TEXT NOT NULL,           -- ObserverControl parameters as JSON
+    saved_at TEXT NOT NULL,
+    UNIQUE (name, params)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,       -- local wall time, ISO 8601
+    ended_at TEXT,
+    station TEXT,                   -- host name of the machine that logged it
+    log_path TEXT,                  -- the session's CSV/.rslog file
+    scenario_id INTEGER REFERENCES scenarios(id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    t REAL NOT NULL,                -- monotonic secs since the session started
+    channel INTEGER NOT NULL,       -- event_logger.CH_*
+    task TEXT NOT NULL,
+    code INTEGER NOT NULL,          -- event_logger.EV_*
+    value,
+    extra
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    t REAL NOT NULL,
+    label TEXT,                     -- observer timer label ("mm:ss")
+    task TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions (started_at);
+CREATE INDEX IF NOT EXISTS idx_events_session ON events (session_id, task, t);
+CREATE INDEX IF NOT EXISTS idx_events_task ON events (task, code, session_id, t);
+CREATE INDEX IF NOT EXISTS idx_metrics_session ON metrics (session_id, task, metric, t);
+CREATE INDEX IF NOT EXISTS idx_metrics_task ON metrics (task, metric, t);
+"""
+
+# Same value as event_logger.CH_METRIC (not imported: event_logger imports this module)
+_CH_METRIC = 0
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class SessionStore:
+    # Thin wrapper over one SQLite file. Not thread-safe: EventLogger only uses it from its writer thread,
+    # one transaction per batch of records.
+    def __init__(self, path):
+        self.path = path
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")     # readers (analysis) don't block the logger
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    # Record a scenario (deduplicated by name and parameters); returns its id
+    def add_scenario(self, name, params):
+        text = json.dumps(params, sort_keys=True)
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO scenarios (name, params, saved_at) VALUES (?, ?, ?)",
+                              (name, text, _now()))
+            (scenario_id,) = self.conn.execute(
+                "SELECT id FROM scenarios WHERE name = ? AND params = ?", (name, text)).fetchone()
+        return scenario_id
+
+    def begin_session(self, log_path, scenario_id=None):
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO sessions (started_at, station, log_path, scenario_id) VALUES (?, ?, ?, ?)",
+                (_now(), socket.gethostname(), log_path, scenario_id))
+        return cur.lastrowid
+
+    # Link a session that has already begun to its scenario
+    def link_scenario(self, session_id, scenario_id):
+        with self.conn:
+            self.conn.execute("UPDATE sessions SET scenario_id = ? WHERE id = ?", (scenario_id, session_id))
+
+    def end_session(self, session_id):
+        with self.conn:
+            self.conn.execute("UPDATE sessions SET ended_at = ? WHERE id = ?", (_now(), session_id))
+
+    # Insert EventLogger records (channel, t, task, code, value, extra) in one transaction
+    def write(self, session_id, records):
+        events, metrics = [], []
+        for channel, t, task, code, value, extra in records:
+            if channel == _CH_METRIC:
+                metrics.append((session_id, t, extra, task, code, value))
+            else:
+                events.append((session_id, t, channel, task, code, value, extra))
+        with self.conn:
+            if events:
+                self.conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", events)
+            if metrics:
+                self.conn.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?)", metrics)
+
+    # Sessions, newest first: (id, started_at, ended_at, station, log_path, scenario name)
+    def sessions(self, since=None):
+        sql = ("SELECT s.id, s.started_at, s.ended_at, s.station, s.log_path, c.name "
+               "FROM sessions s LEFT JOIN scenarios c ON c.id = s.scenario_id")
+        args = ()
+        if since:
+            sql += " WHERE s.started_at >= ?"
+            args = (since,)
+        return self.conn.execute(sql + " ORDER BY s.started_at DESC", args).fetchall()
+
+    # A session's EventLogger records (channel, t, task, code, value, extra) in time order, e.g. for replay
+    def records(self, session_id):
+        return self.conn.execute(
+            "SELECT channel, t, task, code, value, extra FROM events WHERE session_id = ? "
+            "UNION ALL SELECT ?, t, task, metric, value, label FROM metrics WHERE session_id = ? ORDER BY 2",
+            (session_id, _CH_METRIC, session_id)).fetchall()
+
+    # (t, value) samples of one metric, e.g. metric_series(3, "sorting", "errors")
+    def metric_series(self, session_id, task, metric):
+        return self.conn.execute(
+            "SELECT t, value FROM metrics WHERE session_id = ? AND task = ? AND metric = ? ORDER BY t",
+            (session_id, task, metric)).fetchall()
+
+    # Last value of a metric in every session (e.g. "summary correction_rate"): [(session id, value)]
+    def final_values(self, task, metric):
+        # One index probe per session (idx_metrics_session), not a scan of every sample
+        rows = self.conn.execute(
+            "SELECT s.id, (SELECT value FROM metrics m WHERE m.session_id = s.id AND m.task = ? AND m.metric = ? "
+            "ORDER BY m.t DESC LIMIT 1) FROM sessions s ORDER BY s.id",
+            (task, metric)).fetchall()
+        return [row for row in rows if row[1] is not None]
+
+    # Number of events with a code per session: [(session id, count)]
+    def event_counts(self, task, code):
+        return self.conn.execute(
+            "SELECT session_id, COUNT(*) FROM events WHERE task = ? AND code = ? GROUP BY session_id",
+            (task, code)).fetchall()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1 @@
+# simulation/__init__.py
\ No newline at end of file
@@ -0,0 +1,171 @@
+# simulation/arm.py
+
+# Arm poses as (shoulder, elbow) degrees; -90 is directly up
+POSE_HOME = (-90.0, 0.0)
+POSE_PREP = (-92.0, -12.0)
+POSE_PICK = (-110.0, -95.0)
+POSE_LIFT = (-93.0, -10.0)
+
+# Quick 'pointing' poses toward each container's general direction
+PRESENT_POSES = {
+    "red":    (-200.0, -8.0),   # far left
+    "blue":   (-220.0, -10.0),  # left-mid
+    "green":  (-240.0, -12.0),  # slightly left of center
+    "purple": (60.0,  12.0),    # slightly right of center
+    "orange": (40.0,  10.0),    # right-mid
+    "teal":   (20.0,  8.0),     # far right
+}
+
+# Segment durations (ms) for each state of the pick cycle
+SEG_TO_PREP_MS = 120
+SEG_DESCEND_MS = 120
+SEG_HOLD_MS = 40
+SEG_LIFT_MS = 120
+SEG_PRESENT_MS = 200
+SEG_RETURN_MS = 200
+SEG_RETURN_EMPTY_MS = 160
+SEG_IDLE_PAUSE_MS = 40
+
+
+class ArmHooks:
+    # Task-specific behaviour of the pick cycle; the FSM calls these at state transitions
+    def arm_triggered(self):
+        # A box entered the grip window and a new cycle is starting
+        pass
+
+    def arm_grabbed(self):
+        # Gripper reached the box (end of descend)
+        pass
+
+    def arm_holding(self):
+        # Called every tick while holding/lifting (used to despawn the picked box)
+        pass
+
+    def arm_present_slot(self):
+        # Slot to present toward after lift, or None to return home empty-handed
+        return None
+
+    def arm_released(self, slot):
+        # Box dropped toward slot (end of present)
+        pass
+
+    def arm_cycle_done(self):
+        # Arm is back home
+        pass
+
+
+class ArmFSM:
+    # Arm pick cycle (approach -> descend -> hold -> lift -> present -> return) advanced by elapsed ms; no Qt, the RobotArmWidget renders shoulder/elbow/held
+    def __init__(self, hooks=None, present_poses=None, present_without_slot=False,
+                 touch_window_px=18, touch_cooldown_ms=120):
+        self.hooks = hooks or ArmHooks()
+        self.present_poses = dict(PRESENT_POSES if present_poses is None else present_poses)
+        self.present_without_slot = present_without_slot  # present toward lift pose even if no slot is known
+
+        # Trigger settings to touch every box
+        self.touch_window_px = touch_window_px
+        self.touch_cooldown_ms = touch_cooldown_ms
+
+        # Current pose + held box (colour name or None)
+        self.shoulder, self.elbow = POSE_HOME
+        self.held = None
+
+        self.reset()
+
+    def reset(self):
+        # Back to idle at home so we can fire immediately after a Stop
+        self.state = "idle"
+        self.now_ms = 0
+        self.last_touch_ms = -10000
+        self.seg_t = 0
+        self.seg_duration = 0
+        self.shoulder, self.elbow = POSE_HOME
+        self.seg_from = (self.shoulder, self.elbow)
+        self.seg_to = (self.shoulder, self.elbow)
+        self.held = None
+        self.present_target = None
+
+    def pose_present(self, slot):
+        return self.present_poses.get(slot, POSE_LIFT)
+
+    def _start_seg(self, to_angles, duration_ms):
+        self.seg_from = (self.shoulder, self.elbow)
+        self.seg_to = (float(to_angles[0]), float(to_angles[1]))
+        self.seg_duration = max(1, int(duration_ms))
+        self.seg_t = 0
+
+    def tick(self, dt_ms, belt, grip_x):
+        # Advance the cycle by dt_ms; returns True if the pose changed
+        self.now_ms += dt_ms
+
+        # If idle, only start a cycle when a box is near the gripper
+        if self.state == "idle":
+            near = belt.index_in_window(grip_x, self.touch_window_px) != -1
+            if near and (self.now_ms - self.last_touch_ms) >= self.touch_cooldown_ms:
+                self.last_touch_ms = self.now_ms
+                self.hooks.arm_triggered()
+                self.state = "to_prep"
+                self._start_seg(POSE_PREP, SEG_TO_PREP_MS)
+            else:
+                return False
+
+        # Advance interpolation for non-idle states
+        self.seg_t += dt_ms
+        t = min(1.0, self.seg_t / float(self.seg_duration))
+        s0, e0 = self.seg_from
+        s1, e1 = self.seg_to
+        self.shoulder = s0 + (s1 - s0) * t
+        self.elbow = e0 + (e1 - e0) * t
+
+        # Despawn slightly later than detection (only while interacting)
+        if self.state in ("hold", "lift"):
+            self.hooks.arm_holding()
+
+        # Segment complete -> next state; carry the overshoot so cycle length does not depend on frame rate
+        if t >= 1.0:
+            overshoot = self.seg_t - self.seg_duration
+            self._advance_state()
+            if self.state != "idle":
+                self.seg_t = overshoot
+        return True
+
+    def _advance_state(self):
+        state = self.state
+        if state == "to_prep":
+            self.state = "descend"
+            self._start_seg(POSE_PICK, SEG_DESCEND_MS)
+
+        elif state == "descend":
+            self.hooks.arm_grabbed()
+            self.state = "hold"
+            self._start_seg(POSE_PICK, SEG_HOLD_MS)
+
+        elif state == "hold":
+            self.state = "lift"
+            self._start_seg(POSE_LIFT, SEG_LIFT_MS)
+
+        elif state == "lift":
+            # Still move the arm towards the target container
+            slot = self.hooks.arm_present_slot()
+            if slot or self.present_without_slot:
+                self.present_target = slot
+                self.state = "present"
+                self._start_seg(self.pose_present(slot), SEG_PRESENT_MS)
+            else:
+                self.state = "return"
+                self.held = None
+                self._start_seg(POSE_HOME, SEG_RETURN_EMPTY_MS)
+
+        elif state == "present":
+            self.hooks.arm_released(self.present_target)
+            self.state = "return"
+            self.held = None
+            self._start_seg(POSE_HOME, SEG_RETURN_MS)
+
+        elif state == "return":
+            self.state = "idle_pause"
+            self.hooks.arm_cycle_done()
+            self._start_seg(POSE_HOME, SEG_IDLE_PAUSE_MS)
+
+        elif state == "idle_pause":
+            self.state = "idle"
@@ -0,0 +1,150 @@
+# simulation/belt.py
+from array import array
+from bisect import bisect_left
+
+from .palette import COLOR_CODES, color_code, color_name
+
+
+class Belt:
+    # Headless conveyor model: array-backed box store (spawn offset, palette colour code, intended code, id), advanced by speed * dt. ConveyorBeltWidget only renders one of these.
+    # Every box moves at the same speed, so a box is stored by the belt travel at its spawn: x = spawn_x + travel - offset.
+    # Boxes stay in spawn order (oldest = right-most first), which makes advance O(1) and culling/window queries a binary search.
+    def __init__(self, width=220.0, margin=12, inset=12, box_size=24, capacity=64):
+        self.width = float(width)   # belt widget width in px (kept in sync on resize)
+        self.margin = margin        # roller margin at each end
+        self.inset = inset          # keep boxes inside belt edges
+        self.box_size = box_size    # square box size in px
+
+        self.speed = 0.0            # pixels/second; + = move RIGHT
+        self.tread_phase = 0.0      # accumulates over time
+        self.travel = 0.0           # total belt travel (px) since creation
+
+        # Live boxes are rows [_head, _tail) of these typed arrays
+        self._offset = array("d", bytes(8 * capacity))
+        self._color = array("h", bytes(2 * capacity))
+        self._intended = array("h", bytes(2 * capacity))
+        self._id = array("q", bytes(8 * capacity))
+        self._head = 0
+        self._tail = 0
+        self._next_id = 0
+
+    def __len__(self):
+        return self._tail - self._head
+
+    # Geometry
+    def spawn_x(self):
+        return float(self.margin + self.inset)
+
+    def right_limit(self):
+        return self.width - self.margin - self.inset - self.box_size
+
+    # Live views (oldest first)
+    @property
+    def xs(self):
+        base = self.spawn_x() + self.travel
+        return [base - o for o in self._offset[self._head:self._tail]]
+
+    @property
+    def color_codes(self):
+        return self._color[self._head:self._tail]
+
+    @property
+    def colors(self):
+        return [color_name(c) for c in self.color_codes]
+
+    @property
+    def ids(self):
+        return self._id[self._head:self._tail]
+
+    def x_at(self, index):
+        return self.spawn_x() + self.travel - self._offset[self._head + index]
+
+    # Mutation
+    def _make_room(self):
+        # Slide live rows to the front, growing the arrays if they are mostly full
+        n = len(self)
+        size = len(self._offset) * 2 if n * 2 >= len(self._offset) else len(self._offset)
+        for name in ("_offset", "_color", "_intended", "_id"):
+            old = getattr(self, name)
+            new = old[self._head:self._tail]
+            new.extend(array(old.typecode, bytes(old.itemsize * (size - n))))
+            setattr(self, name, new)
+        self._head, self._tail = 0, n
+
+    def spawn(self, color, intended=None):
+        # Put a new box at the start of the belt; returns its id
+        if self._tail == len(self._offset):
+            self._make_room()
+        i = self._tail
+        self._offset[i] = self.travel
+        self._color[i] = color_code(color)
+        self._intended[i] = color_code(intended)
+        self._id[i] = box_id = self._next_id
+        self._next_id += 1
+        self._tail += 1
+        return box_id
+
+    def advance(self, dt):
+        # Move treads and boxes by dt seconds, dropping boxes that ran off the right end
+        dx = self.speed * dt
+        self.tread_phase = (self.tread_phase + dx) % 1000.0
+        self.travel += dx
+        if self._tail == self._head:
+            return
+        # x > right_limit  <=>  offset < travel + spawn_x - right_limit
+        cut = self.travel + self.spawn_x() - self.right_limit()
+        self._head = bisect_left(self._offset, cut, self._head, self._tail)
+
+    def remove(self, index):
+        # Remove one box; returns (actual colour, intended colour)
+        i = self._head + index
+        actual, intended = color_name(self._color[i]), color_name(self._intended[i])
+        if index == 0:
+            self._head += 1
+        else:
+            for arr in (self._offset, self._color, self._intended, self._id):
+                arr[i:self._tail - 1] = arr[i + 1:self._tail]
+            self._tail -= 1
+        return actual, intended
+
+    def clear(self):
+        self._head = self._tail = 0
+
+    # Queries
+    def index_in_window(self, center, half_width):
+        # Index of the first box within [center - half_width, center + half_width], or -1
+        if self._tail == self._head:
+            return -1
+        # First box at or left of the window's right edge; boxes further along are all to its right
+        hi = center + half_width
+        i = bisect_left(self._offset, self.travel + self.spawn_x() - hi, self._head, self._tail) - self._head
+        if i < len(self) and center - half_width <= self.x_at(i) <= hi:
+            return i
+        return -1
+
+    def first_index_past(self, x_cut):
+        # Index of the first box at or beyond x_cut, or -1 (the oldest box is the right-most)
+        if self._tail != self._head and self.x_at(0) >= x_cut:
+            return 0
+        return -1
+
+    def color_at(self, index):
+        if 0 <= index < len(self):
+            return color_name(self._color[self._head + index])
+        return None
+
+    def intended_at(self, index):
+        if 0 <= index < len(self):
+            return color_name(self._intended[self._head + index])
+        return None
+
+    def id_at(self, index):
+        if 0 <= index < len(self):
+            return self._id[self._head + index]
+        return None
+
+    def count_color(self, color):
+        code = COLOR_CODES.get(color)
+        if code is None:
+            return 0
+        return self.color_codes.count(code)
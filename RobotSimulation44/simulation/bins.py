@@ -0,0 +1,168 @@
+# simulation/bins.py
+
+
+class BinErrors:
+    # Misplaced-box records for sorting/inspection bins: the robot drops a box in the wrong bin, the user picks it (FIFO per bin) and places it
+    def __init__(self, slots=()):
+        self.errors = {}        # id -> {id, color, actual, current}
+        self.bin_errors = {}    # slot -> [ids] (oldest first)
+        self.start_times = {}   # id -> sim time (s) the error appeared
+        self.next_eid = 1
+        self.selected = None    # currently "picked up" error id (or None)
+
+        # Correction accuracy
+        self.total_corrections = 0
+        self.correct_corrections = 0
+
+        self.set_slots(slots)
+
+    def set_slots(self, slots):
+        # Reset per-bin error lists for the visible slots
+        self.bin_errors = {k: [] for k in slots}
+
+    def clear(self):
+        self.errors.clear()
+        self.start_times.clear()
+        for ids in self.bin_errors.values():
+            ids.clear()
+        self.selected = None
+
+    def reset_counters(self):
+        self.total_corrections = 0
+        self.correct_corrections = 0
+
+    def correction_rate(self):
+        if self.total_corrections > 0:
+            return (self.correct_corrections / self.total_corrections) * 100
+        return 0.0
+
+    def add(self, color, into, now):
+        # Create an error record living in the wrong bin; returns its id
+        eid = self.next_eid
+        self.next_eid += 1
+        self.errors[eid] = {"id": eid, "color": color, "actual": color, "current": into}
+        self.bin_errors.setdefault(into, []).append(eid)
+        self.start_times[eid] = now
+        return eid
+
+    def head(self, slot):
+        # Oldest unresolved error record in a bin (or None)
+        ids = self.bin_errors.get(slot, [])
+        return self.errors.get(ids[0]) if ids else None
+
+    def pick(self, slot):
+        # FIFO pick one error from the clicked bin; returns its record or None
+        ids = self.bin_errors.get(slot, [])
+        if not ids:
+            return None
+        eid = ids.pop(0)
+        rec = self.errors.get(eid)
+        if rec:
+            self.selected = eid
+        return rec
+
+    def selected_record(self):
+        if self.selected is None:
+            return None
+        return self.errors.get(self.selected)
+
+    def selected_slot(self):
+        # Slot of the currently selected (held) error, if any
+        rec = self.selected_record()
+        return rec['current'] if rec else None
+
+    def place(self, slot):
+        # Drop the held error into slot; the error is cleared either way. Returns (record, correct) or (None, False)
+        eid = self.selected
+        rec = self.errors.get(eid) if eid is not None else None
+        self.selected = None
+        if not rec:
+            return None, False
+
+        # Remove the error ID from the previous bin if it was still listed there
+        prev = rec['current']
+        if eid in self.bin_errors.get(prev, []):
+            self.bin_errors[prev].remove(eid)
+
+        rec['current'] = slot
+        self.total_corrections += 1
+        correct = slot == rec['actual']
+        if correct:
+            self.correct_corrections += 1
+
+        # Resolve (correct) or permanently fail (wrong) -- both clear the record
+        self.start_times.pop(eid, None)
+        if eid in self.bin_errors.get(slot, []):
+            self.bin_errors[slot].remove(eid)
+        del self.errors[eid]
+        return rec, correct
+
+    def head_age(self, slot, now):
+        # Age (s) of the oldest unresolved error in a bin, or 0
+        ids = self.bin_errors.get(slot, [])
+        started = self.start_times.get(ids[0]) if ids else None
+        return now - started if started is not None else 0.0
+
+    def oldest_age(self, now):
+        # Age (s) of the oldest unresolved error overall, or 0
+        if not self.start_times:
+            return 0.0
+        return now - min(self.start_times.values())
+
+
+class PackBin:
+    # One packaging container: capacity/count plus the queue of wrong colours that landed in it
+    def __init__(self, color):
+        self.color = color
+        self.capacity = 0
+        self.count = 0
+        self.error = False
+        self.fixed = False
+        self.mis_queue = []     # wrong actual colours, oldest first
+        self.mis_times = []     # sim time (s) each of those landed
+        self.err_start = None   # sim time (s) the latest wrong colour landed
+        self.fading = False
+        self.fade_left_ms = 0
+
+    @property
+    def mis_color(self):
+        return self.mis_queue[0] if self.mis_queue else None
+
+    def reset(self, capacity):
+        # Fresh container of the same colour
+        self.capacity = int(capacity)
+        self.count = 0
+        self.error = False
+        self.fixed = False
+        self.mis_queue = []
+        self.mis_times = []
+        self.err_start = None
+        self.fading = False
+        self.fade_left_ms = 0
+
+    def is_full(self):
+        return self.capacity > 0 and self.count >= self.capacity
+
+    def need(self, on_belt):
+        # How many more boxes of this colour still need to spawn to fill it
+        if self.capacity <= 0:
+            return 0
+        return max(0, self.capacity - self.count - on_belt)
+
+    def add_misplaced(self, actual, now):
+        self.mis_queue.append(actual)
+        self.mis_times.append(now)
+        self.error = True
+        self.fixed = False
+        self.err_start = now
+
+    def take_misplaced(self):
+        # Consume one mis-queued item; returns the colour it needed
+        needed = self.mis_queue.pop(0) if self.mis_queue else None
+        if self.mis_times:
+            self.mis_times.pop(0)
+        self.error = bool(self.mis_queue)
+        self.fixed = not self.mis_queue
+        if not self.error:
+            self.err_start = None
+        return needed
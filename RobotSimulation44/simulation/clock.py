@@ -0,0 +1,36 @@
+# simulation/clock.py
+import time
+
+
+class SimClock:
+    # Fixed-step sim time paced against the wall clock: speed=1 real time, N = N× faster, 0/None = as fast as possible.
+    # Steps are dt_ms whatever the speed (only the last step of a run is shortened to land on its end), so event
+    # ordering matches a real-time run of the same duration exactly.
+    def __init__(self, speed=1.0, dt_ms=16):
+        self.speed = float(speed) if speed else 0.0
+        self.dt_ms = int(dt_ms)
+        self.now_ms = 0
+
+    def now(self):
+        return self.now_ms / 1000.0
+
+    def is_unpaced(self):
+        return self.speed <= 0.0
+
+    def run(self, step, duration_ms):
+        # Call step(dt_ms) until duration_ms of sim time has passed; the last step is shortened to land exactly on the end
+        end_ms = self.now_ms + int(duration_ms)
+        wall0 = time.perf_counter()
+        sim0 = self.now_ms
+        while self.now_ms < end_ms:
+            dt = min(self.dt_ms, end_ms - self.now_ms)
+            step(dt)
+            self.now_ms += dt
+
+            if not self.is_unpaced():
+                # Sleep until the wall clock catches up with sim time / speed
+                due = (self.now_ms - sim0) / 1000.0 / self.speed
+                lag = due - (time.perf_counter() - wall0)
+                if lag > 0:
+                    time.sleep(lag)
+        return self.now_ms
@@ -0,0 +1,154 @@
+# simulation/engine.py
+import json
+import sys
+import time
+
+from .belt import Belt
+from .clock import SimClock
+from .inspection import InspectionSim
+from .models import InspectionModel, PackagingModel, SortingModel, to_prob
+from .packaging import PackagingSim
+from .rng import SessionRng
+from .sorting import SortingSim
+
+# Belt speed used by every task (px/s, left -> right)
+BELT_SPEED = 120
+
+# Default belt width for headless runs (roughly a 1080p task panel)
+DEFAULT_BELT_WIDTH = 860.0
+
+
+# Build one task's sim from its "start" params (same keys as ObserverControl.get_params_for_task)
+def build_sim(task_name, params=None, belt_width=DEFAULT_BELT_WIDTH, rng=None):
+    p = params or {}
+    pace = p.get("pace") or "slow"
+    rng = rng or SessionRng(p.get("seed"))
+    belt = Belt(width=belt_width)
+    belt.speed = BELT_SPEED
+
+    if task_name == "sorting":
+        model = SortingModel(pace=pace, bin_count=int(p.get("bin_count") or 6),
+                             error_rate=p.get("error_rate"), rng=rng)
+        sim = SortingSim(model=model, belt=belt)
+        sim.start(slots=model.colors, spawning=True)
+    elif task_name == "inspection":
+        model = InspectionModel(pace=pace, error_rate=p.get("error_rate"), rng=rng)
+        sim = InspectionSim(model=model, belt=belt)
+        sim.start(spawning=True)
+    elif task_name == "packaging":
+        bin_count = int(p.get("bin_count") or 6)
+        limit = p.get("limit") or "4 - 6"
+        slot_order = PackagingSim.slot_order_for(bin_count)
+        # Packaging keeps the raw rate, so normalise it here (live params are 0..1)
+        model = PackagingModel(pace=pace, error_rate=to_prob(p.get("error_rate")),
+                               bin_count=len(slot_order), rng=rng)
+        sim = PackagingSim(model=model, belt=belt)
+        sim.start(bin_count=bin_count, limit=limit, pace=pace)
+    else:
+        raise ValueError(f"Unknown task: {task_name}")
+    return sim
+
+
+class HeadlessSession:
+    # Runs the active tasks without Qt from the params dict the Observer sends with "start" (or a saved scenario)
+    def __init__(self, params=None, belt_width=DEFAULT_BELT_WIDTH):
+        self.params = params or {}
+        self.active = [t for t in self.params.get("active", []) if t in ("sorting", "packaging", "inspection")]
+        # One seed for the whole session; each task draws from its own named streams
+        self.rng = SessionRng(self.params.get("seed"))
+        self.seed = self.rng.seed
+        self.sims = {name: build_sim(name, self.params.get(name), belt_width, self.rng) for name in self.active}
+        self.clock = SimClock(speed=0)
+
+    @property
+    def now_ms(self):
+        return self.clock.now_ms
+
+    def step(self, dt_ms):
+        for sim in self.sims.values():
+            sim.step(dt_ms)
+
+    def run(self, duration_s, dt_ms=16, speed=0):
+        # Advance every sim for duration_s of sim time (speed: 1 = real time, N = N× faster, 0 = as fast as possible); returns merged live metrics
+        self.clock.speed = float(speed) if speed else 0.0
+        self.clock.dt_ms = int(dt_ms)
+        self.clock.run(self.step, duration_s * 1000)
+        return self.metrics()
+
+    def metrics(self):
+        merged = {}
+        for sim in self.sims.values():
+            merged.update(sim.model.metrics())
+        return merged
+
+    def stop(self):
+        for sim in self.sims.values():
+            sim.stop()
+
+
+# "mm:ss" -> seconds (same format as the Observer's time limit box)
+def parse_time_limit(text):
+    try:
+        m, s = map(int, str(text).strip().split(":"))
+        return m * 60 + s
+    except ValueError:
+        return 0
+
+
+# Convert a file written by ObserverControl.save_parameters into HeadlessSession params
+def scenario_params(saved):
+    params = {"active": [], "seed": saved.get("seed")}
+    for name in ("sorting", "packaging", "inspection"):
+        task = saved.get(name) or {}
+        if not task.get("enabled", False):
+            continue
+        params["active"].append(name)
+        p = dict(task)
+        p.pop("enabled", None)
+        # Saved scenarios store slider values (0..100); the live UI sends 0..1
+        p["error_rate"] = float(task.get("error_rate", 0)) / 100.0
+        params[name] = p
+    return params
+
+
+def load_scenario(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+# Pre-check a saved scenario: run its time limit (or duration_s) headless and return the final metrics
+def run_scenario(saved, duration_s=None, speed=0, dt_ms=16, seed=None):
+    if duration_s is None:
+        duration_s = parse_time_limit(saved.get("time_limit", "00:00"))
+    params = scenario_params(saved)
+    if seed is not None:
+        params["seed"] = seed
+    session = HeadlessSession(params)
+    metrics = session.run(duration_s, dt_ms=dt_ms, speed=speed)
+    metrics["seed"] = session.seed
+    session.stop()
+    return metrics
+
+
+# python -m simulation.engine scenario.json [speed] [duration_s] [seed]
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("usage: python -m simulation.engine scenario.json [speed (0 = max)] [duration_s] [seed]")
+        return 2
+    saved = load_scenario(argv[0])
+    speed = float(argv[1]) if len(argv) > 1 else 0
+    duration_s = float(argv[2]) if len(argv) > 2 and argv[2] != "-" else None
+    seed = int(argv[3]) if len(argv) > 3 else None
+
+    t0 = time.perf_counter()
+    metrics = run_scenario(saved, duration_s=duration_s, speed=speed, seed=seed)
+    wall = time.perf_counter() - t0
+    print(f"Scenario '{saved.get('scenario_name', '')}' finished in {wall:.2f}s wall time")
+    for k, v in metrics.items():
+        print(f"  {k}: {v}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
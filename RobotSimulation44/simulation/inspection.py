@@ -0,0 +1,20 @@
+# simulation/inspection.py
+from .models import InspectionModel
+from .sorting import SortingSim
+
+
+class InspectionSim(SortingSim):
+    # Headless inspection station: same pick cycle as sorting with two bins, LEFT = green, RIGHT = red
+    present_poses = {
+        "green": (-220.0, -10.0),  # left-mid
+        "red":   (40.0,  10.0),    # right-mid
+    }
+
+    def _default_model(self):
+        return InspectionModel()
+
+    def color_to_slot(self, color):
+        return "red" if color == "red" else "green"
+
+    def wrong_slot_for(self, slot):
+        return "red" if slot == "green" else "green"
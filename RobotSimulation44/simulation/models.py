@@ -0,0 +1,186 @@
+# simulation/models.py
+from .palette import COLOR_NAMES
+from .rng import SessionRng
+
+# All box/bin colours in fixed slot order
+ALL_COLORS = list(COLOR_NAMES)
+
+# Pace mapping: products per second drawn uniformly from (lo, hi)
+PACE_MAP = {
+    "slow":   (0.1, 0.3),
+    "medium": (0.3, 0.7),
+    "fast":   (0.7, 1.0),
+}
+
+
+# Active colours for a bin count (2, 4 or 6 bins)
+def colors_for_bins(bin_count):
+    if bin_count == 6:
+        return ["red", "blue", "green", "purple", "orange", "teal"]
+    elif bin_count == 4:
+        return ["blue", "green", "purple", "orange"]
+    elif bin_count == 2:
+        return ["green", "purple"]
+    return list(ALL_COLORS)
+
+
+# Clamp value to [lo, hi]
+def clamp(x, lo, hi):
+    return lo if x < lo else hi if x > hi else x
+
+
+# Convert various forms to 0..1 probability
+def to_prob(val):
+    """
+    Normalize different forms to a probability in [0,1]:
+    - numbers <=1 treated as probability
+    - numbers >1 treated as percent (divide by 100)
+    - strings like '10%' parsed as percent
+    """
+    if val is None:
+        return 0.0
+
+    # String input (e.g., "10%")
+    if isinstance(val, str):
+        s = val.strip()
+        if s.endswith('%'):
+            try:
+                return clamp(float(s[:-1]) / 100.0, 0.0, 1.0)
+            except ValueError:
+                return 0.0
+        # Plain number in a string
+        try:
+            f = float(s)
+            return clamp(f / 100.0 if f > 1.0 else f, 0.0, 1.0)
+        except ValueError:
+            return 0.0
+
+    # Numeric input
+    try:
+        f = float(val)
+    except Exception:
+        return 0.0
+
+    return clamp(f / 100.0 if f > 1.0 else f, 0.0, 1.0)
+
+
+class TaskModel:
+    # Counters, error roll and spawn pacing shared by a task's worker thread and the headless engine
+    prefix = "task"
+
+    def __init__(self, pace="slow", error_rate=None, rng=None):
+        self.pace = pace if pace in PACE_MAP else "slow"
+        self.error_rate_prob = to_prob(error_rate)
+
+        # Seeded streams: decisions (GUI thread / sim) and spawning (worker thread) never share one
+        session = rng or SessionRng()
+        self.seed = session.seed
+        self.rng = session.stream(self.prefix)
+        self.spawn_rng = session.stream(f"{self.prefix}.spawn")
+
+        # Counters
+        self.total = 0
+        self.correct = 0
+        self.errors = 0
+
+    # Update error rate live (0..1 prob, N>1 treated as percent, or "N%")
+    def set_error_rate(self, val):
+        self.error_rate_prob = to_prob(val)
+
+    # Seconds until the next box spawns, based on pace
+    def next_spawn_delay(self):
+        products_per_sec = self.spawn_rng.uniform(*PACE_MAP[self.pace])
+        return 1.0 / max(1e-6, products_per_sec)
+
+    # Determine if the robot makes an error on this box
+    def roll_error(self):
+        return self.rng.random() < self.error_rate_prob
+
+    # Random pick used by the sims (wrong bins, batch colours)
+    def choice(self, seq):
+        return self.rng.choice(seq)
+
+    # Count one handled box
+    def record(self, is_error, color=None):
+        if is_error:
+            self.errors += 1
+        else:
+            self.correct += 1
+        self.total += 1
+
+    # Live metrics dict keyed by task prefix
+    def metrics(self):
+        p = self.prefix
+        return {
+            f"{p}_total": self.total,
+            f"{p}_errors": self.errors,
+            f"{p}_error_rate": (self.errors / self.total) * 100 if self.total else 0
+        }
+
+
+class SortingModel(TaskModel):
+    prefix = "sort"
+
+    def __init__(self, pace="slow", bin_count=6, error_rate=None, rng=None):
+        super().__init__(pace, error_rate, rng)
+        self.bin_count = bin_count
+        self.colors = colors_for_bins(bin_count)
+
+    def next_color(self):
+        return self.spawn_rng.choice(self.colors)
+
+
+class InspectionModel(TaskModel):
+    prefix = "insp"
+
+    def __init__(self, pace="slow", error_rate=None, rng=None):
+        super().__init__(pace, error_rate, rng)
+        self.colors = ["green", "red"]  # Two bins for inspection
+        self.defects_missed = 0
+
+    def next_color(self):
+        return self.spawn_rng.choice(self.colors)
+
+    def record(self, is_error, color=None):
+        # Count missed defects for red (incorrect) boxes
+        if is_error and color == "red":
+            self.defects_missed += 1
+        super().record(is_error, color)
+
+
+class PackagingModel(TaskModel):
+    prefix = "pack"
+
+    def __init__(self, pace="slow", error_rate=0.0, bin_count=4, rng=None):
+        super().__init__(pace, error_rate, rng)
+        # Packaging keeps the raw rate (the UI slider already sends 0..1)
+        self.error_rate = float(error_rate or 0.0)
+        self.bin_count = int(bin_count) if bin_count is not None else 4
+
+        # Set active palette based on bin count
+        if self.bin_count >= 6:
+            self.colors = ["red", "blue", "green", "purple", "orange", "teal"]
+        elif self.bin_count in (2, 4):
+            self.colors = colors_for_bins(self.bin_count)
+        else:
+            self.colors = ["red", "blue", "green"][:max(1, self.bin_count)]
+
+    def roll_error(self):
+        return self.rng.random() < self.error_rate
+
+    # Pick container capacity
+    def pick_capacity(self, limit="4 - 6"):
+        if limit == "6":
+            return 6
+        elif limit == "5 - 6":
+            return self.rng.choice((5, 6))
+        else:  # "4 - 6"
+            return self.rng.choice((4, 5, 6))
+
+    # With probability=error_rate, pick a different active colour than intended
+    def spawn_color(self, intended, active_colors):
+        if self.roll_error():
+            wrong_choices = [c for c in active_colors if c != intended]
+            if wrong_choices:
+                return self.rng.choice(wrong_choices)
+        return intended
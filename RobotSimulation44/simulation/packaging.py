@@ -0,0 +1,396 @@
+# simulation/packaging.py
+from .arm import ArmFSM, ArmHooks
+from .belt import Belt
+from .bins import PackBin
+from .models import ALL_COLORS, PackagingModel, colors_for_bins
+from .stats import TaskStats
+
+# Drip spawn spacing (ms) per pace
+SPAWN_SPACING_MS = {"slow": 3000, "medium": 2000, "fast": 1000}
+
+# Full containers fade out over this long before requeueing the same colour
+FADE_MS = 2000
+
+
+class PackagingSim(ArmHooks):
+    # Headless packaging station: batch spawn planner, belt, arm pick cycle and per-colour containers. PackagingTask only renders it.
+    def __init__(self, model=None, belt=None, grip_ratio=0.44, despawn_offset_px=0):
+        self.model = model or PackagingModel()
+        self.belt = belt if belt is not None else Belt()
+        self.arm = ArmFSM(hooks=self, present_without_slot=True)
+
+        self.grip_ratio = grip_ratio
+        self.despawn_offset_px = despawn_offset_px
+
+        # All six containers once; `active` is the ordered visible list
+        self.bins = {c: PackBin(c) for c in ALL_COLORS}
+        self.active = [self.bins[c] for c in ALL_COLORS]
+        self.limit = "4 - 6"
+
+        # Sim time (ms) since start
+        self.now_ms = 0
+
+        # Drip spawner (repeating timer while a batch runs)
+        self.spawn_interval_ms = 1500
+        self._drip_on = False
+        self._drip_left_ms = 0
+        # gap between colour batches (ms); pending one-shot gap timers
+        self.batch_gap_ms = 3000
+        self._gap_timers = []
+
+        # Batch state (batch = spawn planner ONLY)
+        self.batch_active = False
+        self.batch_color = None
+        self.batch_remaining = 0
+
+        # Held box metadata
+        self.held_intended = None
+
+        # Selection state for click-to-fix
+        self.selected_source = None     # the bin we "picked" from
+        self.selected_expected = None   # wrong colour being carried
+
+        # Metrics for corrections
+        self.total_corrections = 0
+        self.correct_corrections = 0
+        self.stats = TaskStats(self.model.prefix)
+
+        # Records each pack: callable(is_error). None = count on the model.
+        self.packer = None
+
+        # Renderer callbacks (all optional)
+        self.on_grab = None     # ()
+        self.on_drop = None     # ()  arm reached the bin, before placement
+        self.on_packed = None   # (bin, actual, intended, is_error)
+        self.on_fade = None     # (bin)
+        self.on_requeue = None  # (bin)
+        self.on_batch = None    # (color, need)
+
+    def now(self):
+        return self.now_ms / 1000.0
+
+    def grip_x(self):
+        return self.belt.width * self.grip_ratio
+
+    def correction_rate(self):
+        if self.total_corrections > 0:
+            return (self.correct_corrections / self.total_corrections) * 100
+        return 0.0
+
+    # Decide the visible containers from bin_count
+    @staticmethod
+    def slot_order_for(bin_count):
+        bc = int(bin_count) if bin_count is not None else 6
+        if bc >= 6 or bc in (2, 4):
+            return colors_for_bins(min(bc, 6))
+        return ALL_COLORS[:max(1, bc)]
+
+    # Lifecycle
+    def start(self, bin_count=6, limit="4 - 6", pace=None):
+        self.limit = limit
+        self.now_ms = 0
+        self.arm.reset()
+        self.stats.reset()
+
+        slot_order = self.slot_order_for(bin_count)
+        self.active = [self.bins[c] for c in slot_order]
+
+        # Reset counts/caps for visible containers
+        for b in self.active:
+            b.reset(self.model.pick_capacity(limit))
+
+        # Force the drip timer on
+        self.spawn_interval_ms = SPAWN_SPACING_MS.get(pace, 500)
+        self._drip_on = False
+        self._gap_timers = []
+        self._drip_start()
+
+        self.held_intended = None
+        self.clear_selection()
+        self.belt.clear()
+
+        # Start the first batch (random colour that needs boxes)
+        self.ensure_batch()
+        return slot_order
+
+    def stop(self):
+        self._drip_stop()
+        self._gap_timers = []
+        self.batch_active = False
+        self.batch_color = None
+        self.batch_remaining = 0
+        self.clear_selection()
+        self.belt.clear()
+        self.arm.reset()
+        self.held_intended = None
+        self.total_corrections = 0
+        self.correct_corrections = 0
+
+    def tick(self, dt_ms):
+        # Advance spawn/fade timers and arm by dt_ms (the GUI belt widget moves the belt itself); returns True if the arm pose changed
+        self.now_ms += dt_ms
+
+        # Drip timer
+        if self._drip_on:
+            self._drip_left_ms -= dt_ms
+            while self._drip_on and self._drip_left_ms <= 0:
+                self._drip_left_ms += self.spawn_interval_ms
+                self.drip_tick()
+
+        # Batch gap one-shots
+        if self._gap_timers:
+            fired = 0
+            for i in range(len(self._gap_timers)):
+                self._gap_timers[i] -= dt_ms
+                if self._gap_timers[i] <= 0:
+                    fired += 1
+            if fired:
+                self._gap_timers = [t for t in self._gap_timers if t > 0]
+                for _ in range(fired):
+                    self.ensure_batch()
+
+        # Fading containers requeue once their fade finishes
+        for b in self.active:
+            if b.fading:
+                b.fade_left_ms -= dt_ms
+                if b.fade_left_ms <= 0:
+                    self.requeue(b)
+
+        return self.arm.tick(dt_ms, self.belt, self.grip_x())
+
+    def step(self, dt_ms):
+        # Headless step: belt, then timers and arm
+        self.belt.advance(dt_ms / 1000.0)
+        return self.tick(dt_ms)
+
+    # Drip timer helpers (QTimer semantics: start() is a no-op while running)
+    def _drip_start(self):
+        if not self._drip_on:
+            self._drip_on = True
+            self._drip_left_ms = self.spawn_interval_ms
+
+    def _drip_stop(self):
+        self._drip_on = False
+
+    def _end_batch(self, gap=True):
+        self.batch_active = False
+        self.batch_color = None
+        self.batch_remaining = 0
+        self._drip_stop()
+        if gap:
+            self._gap_timers.append(self.batch_gap_ms)
+
+    # Spawning & batches
+    def bin_for(self, color):
+        return next((b for b in self.active if b.color == color), None)
+
+    def need_for(self, color):
+        # How many more boxes of this colour we still need to spawn to fill its container
+        b = self.bin_for(color)
+        if not b:
+            return 0
+        return b.need(self.belt.count_color(color))
+
+    def pick_next_batch_color(self):
+        # Pick randomly among active colours that still need boxes
+        candidates = [b.color for b in self.active if self.need_for(b.color) > 0]
+        if not candidates:
+            return None
+        return self.model.choice(candidates)
+
+    def ensure_batch(self):
+        # Ensure there is a running batch; if none, pick a random colour that still needs boxes
+        if self.batch_active and self.need_for(self.batch_color) <= 0:
+            self._end_batch(gap=False)
+
+        if self.batch_active:
+            self._drip_start()
+            return
+
+        nxt = self.pick_next_batch_color()
+        if not nxt:
+            # No candidates yet; keep the timer running so we retry soon
+            self._drip_start()
+            return
+
+        need = self.need_for(nxt)
+        self.batch_color = nxt
+        self.batch_remaining = need      # informational
+        self.batch_active = need > 0
+        if self.batch_active:
+            self._drip_start()
+
+        if self.on_batch:
+            self.on_batch(self.batch_color, self.batch_remaining)
+
+    def drip_tick(self):
+        # Spawn one box for the current batch colour; with probability=error_rate it is a different (active) colour
+        if not self.batch_active or not self.batch_color:
+            self.ensure_batch()
+            return
+
+        if self.need_for(self.batch_color) <= 0:
+            # End this batch and add a small gap before next batch
+            self._end_batch()
+            return
+
+        intended = self.batch_color
+        actual = self.model.spawn_color(intended, [b.color for b in self.active])
+        self.belt.spawn(actual, intended)
+
+        # Informational decrement; actual "need" recalculated each tick
+        self.batch_remaining = max(0, self.batch_remaining - 1)
+
+        # If we've met the actual need, finish this batch and schedule the next after a small gap
+        if self.need_for(self.batch_color) <= 0:
+            self._end_batch()
+
+    # Packing
+    def pack_held(self):
+        # Place by intended colour (snapshotted at pick). Error if actual != intended
+        if not self.active:
+            return
+        if self.on_drop:
+            self.on_drop()
+
+        actual = self.arm.held
+        intended = self.held_intended
+        if intended is None:
+            return
+
+        # Destination bin by intended colour; skip placement if it is fading
+        target_idx, target = None, None
+        for i, b in enumerate(self.active):
+            if b.color == intended and not b.fading:
+                target_idx, target = i, b
+                break
+        if target is None:
+            self.held_intended = None
+            return
+
+        target.count += 1
+        is_error = actual != intended
+        if is_error:
+            target.add_misplaced(actual, self.now())
+
+        if self.packer is not None:
+            self.packer(is_error)
+        else:
+            self.model.record(is_error, actual)
+
+        if self.on_packed:
+            self.on_packed(target, actual, intended, is_error)
+
+        # Capacity / fade for THIS bin
+        if target.is_full() and not target.fading:
+            self.begin_fade(target_idx)
+
+        self.held_intended = None
+        self.ensure_batch()
+
+    # Fades
+    def begin_fade(self, idx):
+        if not (0 <= idx < len(self.active)):
+            return
+        b = self.active[idx]
+        if b.fading:
+            return
+        if idx == 0:
+            # Pause any batch; it is re-evaluated when the container requeues
+            self._drip_stop()
+            self.clear_selection()
+        b.fading = True
+        b.fade_left_ms = FADE_MS
+        if self.on_fade:
+            self.on_fade(b)
+
+    def cancel_fade(self, b):
+        # Stop an in-progress fade without requeueing
+        if not b or not b.fading:
+            return
+        b.fading = False
+        b.fade_left_ms = 0
+
+    def requeue(self, b):
+        # Reset the same container in-place with a re-rolled capacity
+        b.reset(self.model.pick_capacity(self.limit))
+        if self.on_requeue:
+            self.on_requeue(b)
+        self.ensure_batch()
+
+    # User corrections (two clicks: pick from an errored bin, then place onto a bin)
+    def clear_selection(self):
+        self.selected_source = None
+        self.selected_expected = None
+
+    def has_selection(self):
+        return self.selected_source is not None
+
+    def select(self, b):
+        # Start carrying the first wrong colour of an errored bin; returns True if picked
+        if b.error and b.mis_queue:
+            self.selected_source = b
+            self.selected_expected = b.mis_queue[0]
+            return True
+        return False
+
+    def place(self, target):
+        # Move one unit from the selected bin onto target. Returns (expected colour, correct) or (None, False)
+        source, expected = self.selected_source, self.selected_expected
+        self.clear_selection()
+        if source is None or expected is None:
+            return None, False
+
+        if source.count > 0:
+            source.count -= 1
+        target.count += 1
+        started = source.mis_times[0] if source.mis_times else None
+        source.take_misplaced()
+        self.stats.record_correction(started, self.now())
+
+        correct = target.color == expected
+        if correct:
+            self.correct_corrections += 1
+        self.total_corrections += 1
+
+        # If target hits capacity, fade it
+        if target.is_full() and not target.fading and target in self.active:
+            self.begin_fade(self.active.index(target))
+        return expected, correct
+
+    # Alarm helpers
+    def oldest_error_age(self):
+        # (any error?, age of the latest-stamped error in the oldest bin)
+        now = self.now()
+        oldest, found = 0.0, False
+        for b in self.active:
+            if b.error:
+                found = True
+                if b.err_start is not None:
+                    oldest = max(oldest, now - b.err_start)
+        return found, oldest
+
+    # Arm hooks
+    def arm_grabbed(self):
+        if self.on_grab:
+            self.on_grab()
+        # Snapshot actual + intended at pick
+        idx = self.belt.index_in_window(self.grip_x(), self.arm.touch_window_px)
+        if idx != -1:
+            actual = self.belt.color_at(idx)
+            if actual is not None:
+                self.arm.held = actual
+            # store intended for later placement (never fallback)
+            self.held_intended = self.belt.intended_at(idx)
+
+    def arm_holding(self):
+        idx = self.belt.first_index_past(self.grip_x() + self.despawn_offset_px)
+        if idx != -1:
+            self.belt.remove(idx)
+
+    def arm_present_slot(self):
+        # Aim toward the intended bin's direction (slot == intended colour)
+        return self.held_intended or self.batch_color
+
+    def arm_released(self, slot):
+        self.pack_held()
@@ -0,0 +1,21 @@
+# simulation/palette.py
+
+# Box colour codes shared by the belt, sims and renderers (index into COLOR_NAMES)
+RED, BLUE, GREEN, PURPLE, ORANGE, TEAL = range(6)
+NO_COLOR = -1
+
+# Code -> name, in fixed slot order (fixed: codes are stored in belt arrays and session logs)
+COLOR_NAMES = ("red", "blue", "green", "purple", "orange", "teal")
+
+# Name -> code
+COLOR_CODES = {name: code for code, name in enumerate(COLOR_NAMES)}
+
+
+# Code for a colour name (None or a name outside the palette -> NO_COLOR)
+def color_code(name):
+    return COLOR_CODES.get(name, NO_COLOR)
+
+
+# Name for a colour code (NO_COLOR -> None)
+def color_name(code):
+    return COLOR_NAMES[code] if code >= 0 else None
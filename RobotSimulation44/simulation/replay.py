@@ -0,0 +1,238 @@
+# simulation/replay.py
+import csv
+from bisect import bisect_right
+
+import session_format
+from event_logger import (CH_METRIC, CHANNEL_NAMES, EVENT_NAMES, EV_MISPLACED, EV_START, EV_STOP, EV_COMPLETE,
+                          EV_PICK, EV_DROP_OK, EV_DROP_WRONG)
+
+# Session secs between seek snapshots: a seek restores the one before the target and replays at most this much
+SNAPSHOT_SECS = 5.0
+
+# Session log task name -> dashboard metric prefix
+TASK_PREFIXES = {"sorting": "sort", "packaging": "pack", "inspection": "insp"}
+
+# Metric names the User app logs (MetricsPublisher log names and TaskStats.log_rows) -> "<prefix>_<field>" field.
+# The Observer logs the "<prefix>_*" keys themselves, which are used as they are.
+LOG_FIELDS = {
+    "boxes sorted": "total",
+    "boxes packed": "total",
+    "boxes inspected": "total",
+    "errors": "errors",
+    "errors corrected": "corrections",
+    "correction latency mean": "latency_mean",
+    "correction latency p50": "latency_p50",
+    "correction latency p90": "latency_p90",
+    "correction latency p99": "latency_p99",
+    "alarms": "alarm_count",
+    "time to clear alarm": "time_to_clear",
+    "alarm time": "alarm_time",
+}
+
+
+def _copy_scenes(scenes):
+    return {task: {"bins": {b: list(colours) for b, colours in scene["bins"].items()}, "held": scene["held"]}
+            for task, scene in scenes.items()}
+
+
+class ReplayState:
+    # What the session looked like at time t, rebuilt from its records: the dashboard metrics and, per task,
+    # the open errors in each bin (oldest first) and the box the user is holding. Sorting/inspection bins are the
+    # bin the box landed in; packaging bins are the container it was meant for.
+    def __init__(self):
+        self.t = 0.0
+        self.scenes = {}        # task -> {"bins": {bin: [box colours]}, "held": (colour, from bin) or None}
+        self.metrics = {}       # "<prefix>_<field>" -> value
+        self._changed_metrics = {}
+        self._changed_tasks = set()
+
+    def scene(self, task):
+        scene = self.scenes.get(task)
+        if scene is None:
+            scene = self.scenes[task] = {"bins": {}, "held": None}
+        return scene
+
+    def apply(self, record):
+        channel, t, task, code, value, extra = record
+        if channel == CH_METRIC:
+            key = self._metric_key(task, code)
+            if key is not None and self.metrics.get(key) != value:
+                self.metrics[key] = value
+                self._changed_metrics[key] = value
+            return
+        if task not in TASK_PREFIXES:
+            return
+
+        scene = self.scene(task)
+        if code in (EV_START, EV_STOP, EV_COMPLETE):
+            scene["bins"] = {}
+            scene["held"] = None
+        elif code == EV_MISPLACED:
+            scene["bins"].setdefault(extra, []).append(value)
+        elif code == EV_PICK:
+            errors = scene["bins"].get(extra)
+            if errors:
+                errors.pop(0)
+            scene["held"] = (value, extra)
+        elif code in (EV_DROP_OK, EV_DROP_WRONG):
+            scene["held"] = None
+        else:
+            return
+        self._changed_tasks.add(task)
+
+    @staticmethod
+    def _metric_key(task, name):
+        prefix = TASK_PREFIXES.get(task)
+        if prefix is None or not isinstance(name, str):
+            return None
+        if name.startswith(prefix + "_"):
+            return name
+        field = LOG_FIELDS.get(name)
+        return f"{prefix}_{field}" if field else None
+
+    # Metrics and tasks that changed since the last call: ({key: value}, {task names})
+    def take_changes(self):
+        metrics, self._changed_metrics = self._changed_metrics, {}
+        tasks, self._changed_tasks = self._changed_tasks, set()
+        return metrics, tasks
+
+    def snapshot(self):
+        return self.t, _copy_scenes(self.scenes), dict(self.metrics)
+
+    # Jump to a snapshot; everything counts as changed so views redraw from scratch
+    def restore(self, snap):
+        t, scenes, metrics = snap
+        self.t, self.scenes, self.metrics = t, _copy_scenes(scenes), dict(metrics)
+        self._changed_metrics = dict(self.metrics)
+        self._changed_tasks = set(self.scenes)
+
+
+class SessionReplay:
+    # Steps through a session's records in time order. Seeking uses a snapshot index built once on load
+    # (one ReplayState every SNAPSHOT_SECS), so jumping anywhere in a long session only re-applies a few seconds.
+    def __init__(self, records, snapshot_secs=SNAPSHOT_SECS):
+        self.records = sorted(records, key=lambda r: r[1])
+        self.times = [r[1] for r in self.records]
+        self.duration = self.times[-1] if self.times else 0.0
+        self.state = ReplayState()
+        self.pos = 0            # index of the next record to apply
+
+        # (time, record index, state before that record)
+        self.snapshots = []
+        # Dashboard graph samples per prefix: ([t], [(t, errors, corrections)]), one per errors/corrections change
+        self._graph = {}
+        state = ReplayState()
+        next_t = 0.0
+        for i, record in enumerate(self.records):
+            if record[1] >= next_t:
+                snap = state.snapshot()
+                while record[1] >= next_t:     # long quiet gaps share one snapshot
+                    self.snapshots.append((next_t, i, snap))
+                    next_t += snapshot_secs
+            state.apply(record)
+            state.t = record[1]
+            if record[0] == CH_METRIC:
+                key = ReplayState._metric_key(record[2], record[3]) or ""
+                prefix, _, field = key.partition("_")
+                if field in ("errors", "corrections"):
+                    times, samples = self._graph.setdefault(prefix, ([], []))
+                    if times and times[-1] == record[1]:    # errors and corrections logged together: one sample
+                        times.pop()
+                        samples.pop()
+                    times.append(record[1])
+                    samples.append((record[1], state.metrics.get(f"{prefix}_errors") or 0,
+                                    state.metrics.get(f"{prefix}_corrections") or 0))
+        if not self.snapshots:
+            self.snapshots.append((0.0, 0, state.snapshot()))
+        self._snapshot_times = [s[0] for s in self.snapshots]
+
+    # Task names that have scene events, in the session's order
+    def tasks(self):
+        names = []
+        for channel, _, task, _, _, _ in self.records:
+            if channel != CH_METRIC and task in TASK_PREFIXES and task not in names:
+                names.append(task)
+        return names
+
+    # Graph samples of a task prefix up to the current position
+    def graph_samples(self, prefix):
+        times, samples = self._graph.get(prefix, ((), ()))
+        return samples[:bisect_right(times, self.state.t)]
+
+    def at_end(self):
+        return self.pos >= len(self.records)
+
+    # Go to session time t (s)
+    def seek(self, t):
+        t = min(max(0.0, t), self.duration)
+        k = max(0, bisect_right(self._snapshot_times, t) - 1)
+        _, self.pos, snap = self.snapshots[k]
+        self.state.restore(snap)
+        self.advance_to(t)
+
+    # Apply every record up to session time t; returns how many were applied
+    def advance_to(self, t):
+        end = bisect_right(self.times, t, lo=self.pos)
+        for record in self.records[self.pos:end]:
+            self.state.apply(record)
+        n = end - self.pos
+        self.pos = end
+        self.state.t = min(max(self.state.t, t), self.duration)
+        return n
+
+    # Apply the next record (step-by-step review); returns it, or None at the end
+    def step(self):
+        if self.at_end():
+            return None
+        record = self.records[self.pos]
+        self.pos += 1
+        self.state.apply(record)
+        self.state.t = record[1]
+        return record
+
+
+# Records of a session: a .rslog or .csv session file, or session session_id of a SessionStore database
+def load_records(path, session_id=None):
+    if session_id is not None:
+        from session_store import SessionStore
+        store = SessionStore(path)
+        try:
+            return store.records(session_id)
+        finally:
+            store.close()
+    if path.endswith(session_format.EXTENSION):
+        return list(session_format.iter_records(path))
+    return _csv_records(path)
+
+
+def _number(text):
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+# Records back from a CSV session log. Event rows carry their session time; metric rows only the observer's
+# timer label, so they are placed at the time of the event before them.
+def _csv_records(path):
+    events = {f"{CHANNEL_NAMES[ch]} {name}": (ch, code)
+              for ch in CHANNEL_NAMES for code, name in EVENT_NAMES.items()}
+    records = []
+    t = 0.0
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            event = events.get(row["metric"])
+            if event is None:
+                records.append((CH_METRIC, t, row["task"], row["metric"], _number(row["count"]), row["timestamp"]))
+                continue
+            m, _, s = row["timestamp"].partition(":")
+            try:
+                t = int(m) * 60 + float(s)
+            except ValueError:
+                pass
+            value, _, extra = row["count"].partition(" ")
+            records.append((event[0], t, row["task"], event[1],
+                            _number(value) if value else None, _number(extra) if extra else None))
+    return records
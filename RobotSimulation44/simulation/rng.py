@@ -0,0 +1,17 @@
+# simulation/rng.py
+import random
+
+
+# Fresh session seed (non-reproducible source, only used when none is given)
+def new_seed():
+    return random.SystemRandom().randrange(2 ** 31)
+
+
+class SessionRng:
+    # Per-session RNG service: one seed, one independent random.Random stream per consumer.
+    # Streams are keyed by name so enabling another task (or thread timing between them) never shifts an existing stream.
+    def __init__(self, seed=None):
+        self.seed = int(seed) if seed is not None else new_seed()
+
+    def stream(self, name):
+        return random.Random(f"{self.seed}:{name}")
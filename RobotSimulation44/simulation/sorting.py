@@ -0,0 +1,178 @@
+# simulation/sorting.py
+from .arm import ArmFSM, ArmHooks
+from .belt import Belt
+from .bins import BinErrors
+from .models import ALL_COLORS, SortingModel
+from .stats import TaskStats
+
+
+class SortingSim(ArmHooks):
+    # Headless sorting station (belt + arm pick cycle + error bins). SortingTask only renders it; sims run without Qt for scenario validation.
+    present_poses = None  # default arm poses for the six sorting bins
+
+    def __init__(self, model=None, belt=None, grip_ratio=0.44, despawn_offset_px=0):
+        self.model = model or self._default_model()
+        self.belt = belt if belt is not None else Belt()
+        self.arm = ArmFSM(hooks=self, present_poses=self.present_poses)
+        self.slots = list(self.model.colors)
+        self.bins = BinErrors(self.slots)
+        self.stats = TaskStats(self.model.prefix)
+
+        self.grip_ratio = grip_ratio                # gripper detection X as a fraction of belt width
+        self.despawn_offset_px = despawn_offset_px  # +pixels to the RIGHT of detection; increase = disappears later
+
+        # Sim time (ms) since start
+        self.now_ms = 0
+
+        # Cycle state
+        self.target_slot = None             # container direction to "present" toward after lift
+        self.present_slot_override = None   # when the sort is incorrect, we aim here
+        self.pending_color = None           # colour captured exactly when the cycle starts
+
+        # Headless box spawning (the GUI spawns from the worker thread instead)
+        self.spawning = False
+        self._spawn_left_s = 0.0
+
+        # Decides each sort: callable(color) -> correct. None = roll on the model.
+        self.sorter = None
+
+        # Renderer callbacks (all optional)
+        self.on_grab = None     # ()
+        self.on_sorted = None   # (color, into, correct, eid or None)
+        self.on_drop = None     # (color, slot)
+
+    def _default_model(self):
+        return SortingModel()
+
+    # Seconds since start (error timestamps use this)
+    def now(self):
+        return self.now_ms / 1000.0
+
+    def grip_x(self):
+        # Single source of truth for the gripper's detection X
+        return self.belt.width * self.grip_ratio
+
+    # Lifecycle
+    def start(self, slots=None, spawning=False):
+        if slots is not None:
+            self.slots = list(slots)
+        self.bins.set_slots(self.slots)
+        self.now_ms = 0
+        self.arm.reset()
+        self.target_slot = None
+        self.present_slot_override = None
+        self.pending_color = None
+        self.spawning = spawning
+        self._spawn_left_s = 0.0
+        self.stats.reset()
+
+    def stop(self):
+        self.spawning = False
+        self.belt.clear()
+        self.arm.reset()
+        self.bins.clear()
+        self.bins.reset_counters()
+
+    def tick(self, dt_ms):
+        # Advance spawner and arm by dt_ms (the GUI belt widget moves the belt itself); returns True if the arm pose changed
+        self.now_ms += dt_ms
+        if self.spawning:
+            self._spawn_left_s -= dt_ms / 1000.0
+            while self._spawn_left_s <= 0.0:
+                self.spawn(self.model.next_color())
+                self._spawn_left_s += self.model.next_spawn_delay()
+        return self.arm.tick(dt_ms, self.belt, self.grip_x())
+
+    def step(self, dt_ms):
+        # Headless step: belt, then spawner and arm
+        self.belt.advance(dt_ms / 1000.0)
+        return self.tick(dt_ms)
+
+    def spawn(self, color):
+        self.belt.spawn(color)
+
+    # Belt helpers
+    def color_in_window(self):
+        # Colour of the first box currently inside the detection window (or None)
+        idx = self.belt.index_in_window(self.grip_x(), self.arm.touch_window_px)
+        return self.belt.color_at(idx)
+
+    def color_to_slot(self, color):
+        # Map a box colour to the slot name matching the containers
+        return color if color in ALL_COLORS else None
+
+    def wrong_slot_for(self, slot):
+        # Pick a wrong bin (used when the sort is incorrect)
+        candidates = [s for s in self.slots if s != slot]
+        return self.model.choice(candidates) if candidates else slot
+
+    # Sorting decision
+    def sort_box(self, color):
+        if self.sorter is not None:
+            correct = bool(self.sorter(color))
+        else:
+            is_error = self.model.roll_error()
+            self.model.record(is_error, color)
+            correct = not is_error
+
+        if correct:
+            into = color
+            eid = None
+        else:
+            # Determine which wrong bin it was placed in and leave an error record there
+            into = self.present_slot_override or self.wrong_slot_for(color)
+            eid = self.bins.add(color, into, self.now())
+        self.present_slot_override = into
+
+        if self.on_sorted:
+            self.on_sorted(color, into, correct, eid)
+        return correct
+
+    # User corrections
+    def pick_error(self, slot):
+        return self.bins.pick(slot)
+
+    def place_error(self, slot):
+        started = self.bins.start_times.get(self.bins.selected)
+        rec, correct = self.bins.place(slot)
+        if rec:
+            self.stats.record_correction(started, self.now())
+        return rec, correct
+
+    # Arm hooks
+    def arm_triggered(self):
+        # Lock colour & slot at trigger time
+        self.pending_color = self.color_in_window()
+        self.target_slot = self.color_to_slot(self.pending_color) if self.pending_color else None
+
+    def arm_grabbed(self):
+        # Trigger sorting only when arm reaches box
+        color = self.color_in_window()
+        if self.on_grab:
+            self.on_grab()
+        if color:
+            self.sort_box(color)
+
+        # Capture held box colour
+        c = self.color_in_window() or self.pending_color
+        if c is not None:
+            self.arm.held = c
+            self.target_slot = self.color_to_slot(c)
+
+    def arm_holding(self):
+        # Remove a box after it passes the cutoff (independent of detection)
+        idx = self.belt.first_index_past(self.grip_x() + self.despawn_offset_px)
+        if idx != -1:
+            self.belt.remove(idx)
+
+    def arm_present_slot(self):
+        return self.present_slot_override or self.target_slot
+
+    def arm_released(self, slot):
+        if slot and self.arm.held and self.on_drop:
+            self.on_drop(self.arm.held, slot)
+
+    def arm_cycle_done(self):
+        self.target_slot = None
+        self.pending_color = None
+        self.present_slot_override = None
@@ -0,0 +1,147 @@
+# simulation/stats.py
+import math
+
+
+class QuantileSketch:
+    # Streaming quantiles in bounded memory (log-bucketed histogram, DDSketch-style): every value is counted in
+    # bucket ceil(log_gamma(x)), so any quantile is within rel_accuracy of the true sample. Mean/min/max are exact.
+    def __init__(self, rel_accuracy=0.01, max_buckets=512, min_value=1e-3):
+        self.rel_accuracy = rel_accuracy
+        self.gamma = (1 + rel_accuracy) / (1 - rel_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.min_value = min_value     # values at or below this count as zero
+        self.clear()
+
+    def clear(self):
+        self.buckets = {}   # bucket index -> count
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        x = float(x)
+        self.count += 1
+        self.total += x
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+        if x <= self.min_value:
+            self.zeros += 1
+            return
+        k = math.ceil(math.log(x) / self._log_gamma)
+        self.buckets[k] = self.buckets.get(k, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            # Out of room: fold the two lowest buckets together (only the small-value tail loses accuracy)
+            lo, nxt = sorted(self.buckets)[:2]
+            self.buckets[nxt] += self.buckets.pop(lo)
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q):
+        # Value at quantile q (0..1), or None when empty
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return self.min
+        for k in sorted(self.buckets):
+            seen += self.buckets[k]
+            if rank < seen:
+                estimate = 2 * self.gamma ** k / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+
+class TaskStats:
+    # Human-performance statistics for one task, built incrementally from sim time (s):
+    # correction latency (error appeared -> user placed it), time-to-clear (error that set off the alarm appeared ->
+    # user cleared the alarm, one sample per alarm) and alarm time.
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.latency = QuantileSketch()
+        self.time_to_clear = QuantileSketch()
+        self.on_alarm = None    # optional (started, secs): alarm went off (oldest error age) / stopped (episode length)
+        self.reset()
+
+    def reset(self):
+        self.latency.clear()
+        self.time_to_clear.clear()
+        self.alarm_count = 0
+        self.alarm_time = 0.0       # total secs the alarm was sounding (closed episodes)
+        self._alarm_since = None
+        self._alarm_error_since = None  # when the error that set off the running alarm appeared
+        self.version = 0            # bumped on every change, so callers can skip unchanged snapshots
+
+    def record_correction(self, started, now):
+        if started is None:
+            return
+        self.latency.add(max(0.0, now - started))
+        self.version += 1
+
+    def alarm_started(self, oldest_age, now):
+        # The alarm went off because the oldest open error is oldest_age secs old
+        if self._alarm_since is not None:
+            return
+        self._alarm_since = now
+        self._alarm_error_since = now - oldest_age
+        self.alarm_count += 1
+        self.version += 1
+        if self.on_alarm:
+            self.on_alarm(True, oldest_age)
+
+    def alarm_stopped(self, now, cleared=True):
+        # cleared=False: the task was stopped/completed with errors still open, so the alarm was never cleared
+        if self._alarm_since is None:
+            return
+        episode = max(0.0, now - self._alarm_since)
+        self.alarm_time += episode
+        if cleared:
+            self.time_to_clear.add(max(0.0, now - self._alarm_error_since))
+        self._alarm_since = None
+        self._alarm_error_since = None
+        self.version += 1
+        if self.on_alarm:
+            self.on_alarm(False, episode)
+
+    def total_alarm_time(self, now):
+        # Alarm secs including a still-running episode
+        running = now - self._alarm_since if self._alarm_since is not None else 0.0
+        return self.alarm_time + max(0.0, running)
+
+    def metrics(self, now=None):
+        # "<prefix>_*" keys in secs (None until there is a sample), same style as TaskModel.metrics
+        p = self.prefix
+        lat = self.latency
+
+        def r(v):
+            return round(v, 3) if v is not None else None
+
+        return {
+            f"{p}_latency_n": lat.count,
+            f"{p}_latency_mean": r(lat.mean()),
+            f"{p}_latency_p50": r(lat.quantile(0.50)),
+            f"{p}_latency_p90": r(lat.quantile(0.90)),
+            f"{p}_latency_p99": r(lat.quantile(0.99)),
+            f"{p}_alarm_count": self.alarm_count,
+            f"{p}_time_to_clear": r(self.time_to_clear.mean()),
+            f"{p}_alarm_time": r(self.total_alarm_time(now) if now is not None else self.alarm_time),
+        }
+
+    def log_rows(self, now=None):
+        # (metric name, value) rows for the session log, skipping stats that have no sample yet
+        m = self.metrics(now)
+        p = self.prefix
+        rows = (
+            ("correction latency mean", m[f"{p}_latency_mean"]),
+            ("correction latency p50", m[f"{p}_latency_p50"]),
+            ("correction latency p90", m[f"{p}_latency_p90"]),
+            ("correction latency p99", m[f"{p}_latency_p99"]),
+            ("alarms", m[f"{p}_alarm_count"]),
+            ("time to clear alarm", m[f"{p}_time_to_clear"]),
+            ("alarm time", m[f"{p}_alarm_time"]),
+        )
+        return [(name, value) for name, value in rows if value is not None]
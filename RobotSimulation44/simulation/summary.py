@@ -0,0 +1,56 @@
+# simulation/summary.py
+
+
+class TaskSummary:
+    # End-of-session report for one task, kept current from the same "<prefix>_*" live metrics the dashboard gets
+    # (counters, rates, latency and alarm stats are already running totals), so it is ready the moment a run ends,
+    # however long the session was, without re-reading the log.
+    def __init__(self, prefix, task_name):
+        self.prefix = prefix
+        self.task_name = task_name
+        self.reset()
+
+    def reset(self):
+        self.started = False
+        self.logged = False     # summary rows already written to this session's log
+        self.duration_s = 0.0   # sim secs since the task started
+        self.latest = {}
+
+    # Fold in the task's live metrics at sim time now (s)
+    def update(self, metrics, now):
+        self.started = True
+        self.latest.update(metrics)
+        self.duration_s = max(self.duration_s, now)
+
+    def result(self):
+        p = self.prefix
+        m = self.latest
+
+        def r(v, nd=3):
+            return round(v, nd) if v is not None else None
+
+        total = m.get(f"{p}_total", 0)
+        minutes = self.duration_s / 60.0
+        return {
+            "task": self.task_name,
+            "duration_s": round(self.duration_s, 1),
+            "total": total,
+            "errors": m.get(f"{p}_errors", 0),
+            "corrections": m.get(f"{p}_corrections", 0),
+            "error_rate": r(m.get(f"{p}_error_rate", 0.0), 1),
+            "correction_rate": r(m.get(f"{p}_correction_rate", 0.0), 1),
+            "throughput_per_min": r(total / minutes, 2) if minutes > 0 else 0.0,
+            "latency_mean": m.get(f"{p}_latency_mean"),
+            "latency_p50": m.get(f"{p}_latency_p50"),
+            "latency_p90": m.get(f"{p}_latency_p90"),
+            "latency_p99": m.get(f"{p}_latency_p99"),
+            "alarm_count": m.get(f"{p}_alarm_count", 0),
+            "time_to_clear": m.get(f"{p}_time_to_clear"),
+            "alarm_time": m.get(f"{p}_alarm_time", 0.0),
+        }
+
+
+# (metric name, value) rows of a summary for the session log, skipping stats that never got a sample
+def summary_rows(summary):
+    return [(f"summary {field}", value) for field, value in summary.items()
+            if field != "task" and value is not None]
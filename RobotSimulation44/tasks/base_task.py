@@ -1,11 +1,60 @@
 ﻿# tasks/base_task.py
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QSizePolicy, QFrame, QGridLayout, QApplication
-from PyQt5.QtGui import QColor, QPainter, QPen, QBrush, QLinearGradient
-from PyQt5.QtCore import Qt, QPoint, QPointF, QRectF, QTimer, pyqtProperty
+from PyQt5.QtGui import QColor, QPainter, QPen, QBrush, QLinearGradient, QPixmap, QPainterPath, QPolygonF
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRectF, pyqtProperty
+from simulation.belt import Belt
+from simulation.palette import COLOR_CODES, COLOR_NAMES, RED
+from .frame_scheduler import FrameTimer, get_frame_scheduler
+from collections import OrderedDict
+import random
+
+
+# Box colours by name (belt boxes, held boxes, flying/drag boxes and error flashes)
+BOX_HEX = {
+    "red":    "#c82828",
+    "blue":   "#2b4a91",
+    "green":  "#1f7a3a",
+    "purple": "#6a1b9a",
+    "orange": "#c15800",
+    "teal":   "#b8efe6",
+}
+
+
+_HEX_TO_NAME = {v: k for k, v in BOX_HEX.items()}
+
+
+# (QColor, fill brush, outline pen) per palette code, built once and shared by every painter
+_BOX_STYLES = {}
+
+
+def _box_style(code):
+    style = _BOX_STYLES.get(code)
+    if style is None:
+        name = COLOR_NAMES[code] if 0 <= code < len(COLOR_NAMES) else "red"
+        c = QColor(BOX_HEX.get(name, BOX_HEX["red"]))
+        style = _BOX_STYLES[code] = (c, QBrush(c), QPen(c.darker(200), 1))
+    return style
+
+
+# Cached QColor for a box colour name or palette code (unknown names fall back to red); treat as read-only
+def box_qcolor(color):
+    code = color if isinstance(color, int) else COLOR_CODES.get(color, RED)
+    return _box_style(code)[0]
+
+
+# Transparent pixmap for a cached paint layer (widget size by default, at the widget's device pixel ratio)
+def layer_pixmap(widget, w=None, h=None):
+    w = widget.width() if w is None else w
+    h = widget.height() if h is None else h
+    dpr = widget.devicePixelRatioF()
+    pm = QPixmap(max(1, int(w * dpr)), max(1, int(h * dpr)))
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(Qt.transparent)
+    return pm
 
 
 class ConveyorBeltWidget(QWidget):
-    # Realistic conveyor with rollers, belt gradient, treads, and rails. Includes non-blocking tread animation and red boxes.
+    # Realistic conveyor with rollers, belt gradient, treads, and rails. Includes non-blocking tread animation and coloured boxes. Box state lives in a headless simulation.Belt.
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(220, 120)
@@ -20,88 +69,81 @@ class ConveyorBeltWidget(QWidget):
         self.rail        = QColor(120, 120, 122)
         self.tread       = QColor(90, 90, 92, 180)
 
-        # Animation state
-        self._belt_speed = 0.0      # pixels/second; + = move RIGHT
-        self._tread_phase = 0.0     # accumulates over time
-        self._belt_timer = QTimer(self)
-        self._belt_timer.timeout.connect(self._tick_belt)
+        # Belt model (box positions/colours, tread phase, speed)
+        self.belt = Belt(width=self.width())
+        # Cached rollers/belt body and rails/bolts pixmaps (rebuilt on resize)
+        self._static_layers = None
 
-        # Moving boxes
-        self._boxes = []            # list of x positions (float)
-        self._box_colors = []       # empty list for various colours of boxes
-        self._box_inset = 12        # keep boxes inside belt edges
-        self._box_size = 24         # square box size in px
+        # Fallback colour picks; tasks swap in their seeded session stream on start
+        self.rng = random.Random()
+
+        # Animation runs on the shared frame scheduler (every frame)
+        self._belt_timer = FrameTimer(self)
+        self._belt_timer.timeout.connect(self._tick_belt)
 
     # Public API
     def enable_motion(self, enable: bool):
         # Start or stop the belt tread and box animation timer
         if enable and not self._belt_timer.isActive():
-            self._belt_timer.start(16)  # ~60 FPS
+            self._belt_timer.start()
         elif not enable and self._belt_timer.isActive():
             self._belt_timer.stop()
 
     @pyqtProperty(float)
     def beltSpeed(self):
-        return self._belt_speed
+        return self.belt.speed
 
     def setBeltSpeed(self, v: float):
-        self._belt_speed = float(v)
+        self.belt.speed = float(v)
 
-    def spawn_box(self, color=None, error=False):
-        # Spawn a new box at the start of the belt
-        import random
+    def spawn_box(self, color=None, error=False, intended=None):
+        # Spawn a new box at the start of the belt (colour name or palette code; QColor accepted for old callers)
         if color is None:
-            color = random.choice([
-                QColor("#c82828"),  # red
-                QColor("#2b4a91"),  # blue
-                QColor("#1f7a3a"),  # green
-                QColor("#6a1b9a"),  # purple
-                QColor("#c15800"),  # orange
-                QColor("#b8efe6"),  # teal
-            ])
-        elif isinstance(color, str):
-            color_map = {
-                "red": QColor("#c82828"),
-                "blue": QColor("#2b4a91"),
-                "green": QColor("#1f7a3a"),
-                "purple": QColor("#6a1b9a"),
-                "orange": QColor("#c15800"),
-                "teal": QColor("#b8efe6")
-            }
-            color = color_map.get(color.lower(), QColor("#c82828"))
-
-        x0 = 12 + self._box_inset
-        self._boxes.append(float(x0))
-        self._box_colors.append(color)
+            color = self.rng.choice(list(BOX_HEX))
+        elif isinstance(color, QColor):
+            color = _HEX_TO_NAME.get(color.name().lower(), "red")
+        elif isinstance(color, int):
+            color = COLOR_NAMES[color] if 0 <= color < len(COLOR_NAMES) else "red"
+        else:
+            color = str(color).lower()
+            if color not in BOX_HEX:
+                color = "red"
+
+        self.belt.spawn(color, intended)
         self.update()
 
-    # Internals
-    def _tick_belt(self):
-        # Update tread animation and advance boxes
-        dt = 0.016
-
-        self._tread_phase = (self._tread_phase + self._belt_speed * dt) % 1000.0
-
-        if self._boxes:
-            dx = self._belt_speed * dt
-            w = self.width()
-            right_limit = w - 12 - self._box_inset - self._box_size
-            next_boxes, next_colors = [], []
-            for x, c in zip(self._boxes, self._box_colors):
-                x2 = x + dx
-                if x2 <= right_limit:
-                    next_boxes.append(x2)
-                    next_colors.append(c)
-            self._boxes = next_boxes
-            self._box_colors = next_colors
+    def clear_boxes(self):
+        self.belt.clear()
+        self.update()
 
+    # Internals
+    def resizeEvent(self, e):
+        self.belt.width = float(self.width())
+        self._static_layers = None
+        super().resizeEvent(e)
+
+    def _tick_belt(self, dt_ms):
+        # Update tread animation and advance boxes by the real frame time; repaint with the rest of the frame
+        self.belt.advance(dt_ms / 1000.0)
+        get_frame_scheduler().request_update(self)
+
+    def invalidate_cache(self):
+        # Drop the cached static layers (call after changing the palette)
+        self._static_layers = None
         self.update()
 
-    def paintEvent(self, e):
-        # Draw conveyor, treads, rollers, boxes, and rails
-        p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
+    def _belt_geometry(self):
+        h = self.height()
+        belt_height = max(28, int(h*0.38))
+        return 12, belt_height, (h - belt_height) / 2
+
+    def _build_static_layers(self):
+        # Rollers + belt body (under the treads/boxes) and rails + bolts (over them); rebuilt only on resize
         w, h = self.width(), self.height()
-        margin = 12
+        margin, belt_height, belt_top = self._belt_geometry()
+
+        under = layer_pixmap(self)
+        p = QPainter(under); p.setRenderHint(QPainter.Antialiasing)
 
         # End rollers
         roller_r = max(16, int(h*0.18))
@@ -111,8 +153,6 @@ class ConveyorBeltWidget(QWidget):
         p.drawEllipse(QPointF(w - margin - roller_r, h/2), roller_r, roller_r)
 
         # Belt body
-        belt_height = max(28, int(h*0.38))
-        belt_top = (h - belt_height) / 2
         grad = QLinearGradient(0, belt_top, 0, belt_top + belt_height)
         grad.setColorAt(0.0, self.belt_top)
         grad.setColorAt(0.5, self.belt_mid)
@@ -120,37 +160,76 @@ class ConveyorBeltWidget(QWidget):
         p.setBrush(QBrush(grad))
         p.setPen(QPen(QColor(20,20,20), 2))
         p.drawRoundedRect(QRectF(margin, belt_top, w - 2*margin, belt_height), 8, 8)
+        p.end()
 
-        # Treads
-        p.setPen(QPen(self.tread, 1.2))
-        step = 12
-        phase = self._tread_phase % step
-        # Inset so lines don't hang over the rounded ends
-        start_x = int(margin + 25 + phase - step)
-        for x in range(start_x, int(w - margin), step):
-            p.drawLine(x, belt_top + 4, x - 10, belt_top + belt_height - 4)
-
-        # Boxes (drawn on belt, under rails)
-        if self._boxes:
-            box_h = min(self._box_size, max(8, belt_height - 8))
-            box_w = box_h
-            y = belt_top + (belt_height - box_h)/2
-            for x, c in zip(self._boxes, self._box_colors):
-                p.setPen(QPen(c.darker(200), 1))
-                p.setBrush(QBrush(c))
-                p.drawRoundedRect(QRectF(x, y, box_w, box_h), 3, 3)
+        over = layer_pixmap(self)
+        p = QPainter(over); p.setRenderHint(QPainter.Antialiasing)
 
         # Rails and bolts
         rail_pen = QPen(self.rail, 2)
         p.setPen(rail_pen)
         p.setBrush(Qt.NoBrush)
-        p.drawLine(margin + 4, belt_top - 6, w - margin - 4, belt_top - 6)
-        p.drawLine(margin + 4, belt_top + belt_height + 6, w - margin - 4, belt_top + belt_height + 6)
+        p.drawLine(QPointF(margin + 4, belt_top - 6), QPointF(w - margin - 4, belt_top - 6))
+        p.drawLine(QPointF(margin + 4, belt_top + belt_height + 6), QPointF(w - margin - 4, belt_top + belt_height + 6))
         p.setBrush(QBrush(QColor(160,160,165))); p.setPen(Qt.NoPen)
         bolt_step = 28
         for x in range(int(margin + 10), int(w - margin - 10), bolt_step):
             p.drawEllipse(QPointF(x, belt_top - 6), 1.8, 1.8)
             p.drawEllipse(QPointF(x, belt_top + belt_height + 6), 1.8, 1.8)
+        p.end()
+
+        # Tread strip: one period wider than the belt, shifted by the phase each frame
+        step = 12
+        treads = layer_pixmap(self, w + step, h)
+        p = QPainter(treads); p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(self.tread, 1.2))
+        # Inset so lines don't hang over the rounded ends
+        for x in range(int(margin + 25 - step), int(w - margin + step), step):
+            p.drawLine(QPointF(x, belt_top + 4), QPointF(x - 10, belt_top + belt_height - 4))
+        p.end()
+
+        # Clip parallel to the slanted treads so a tread is shown whole or not at all (starts left of w - margin)
+        y0, y1 = belt_top + 4, belt_top + belt_height - 4
+        right = w - margin - 0.5
+        slant = 10.0 / max(1.0, y1 - y0)
+        clip = QPainterPath()
+        clip.addPolygon(QPolygonF([QPointF(0, 0), QPointF(right + slant * y0, 0),
+                                   QPointF(right - slant * (h - y0), h), QPointF(0, h)]))
+
+        self._static_layers = (under, over, treads, clip)
+        return self._static_layers
+
+    def paintEvent(self, e):
+        # Blit the cached static layers; only treads and boxes are drawn per frame
+        under, over, treads, clip = self._static_layers or self._build_static_layers()
+        p = QPainter(self)
+        p.drawPixmap(0, 0, under)
+        margin, belt_height, belt_top = self._belt_geometry()
+
+        # Treads (cached strip shifted by the whole-pixel phase)
+        p.save()
+        p.setClipPath(clip)
+        p.drawPixmap(int(self.belt.tread_phase % 12), 0, treads)
+        p.restore()
+        p.setRenderHint(QPainter.Antialiasing)
+
+        # Boxes (drawn on belt, under rails)
+        if len(self.belt):
+            box_h = min(self.belt.box_size, max(8, belt_height - 8))
+            box_w = box_h
+            y = belt_top + (belt_height - box_h)/2
+            for x, code in zip(self.belt.xs, self.belt.color_codes):
+                _, brush, pen = _box_style(code)
+                p.setPen(pen)
+                p.setBrush(brush)
+                p.drawRoundedRect(QRectF(x, y, box_w, box_h), 3, 3)
+
+        p.drawPixmap(0, 0, over)
+
+
+# Arm sprites are rendered at poses quantized to this many degrees, and at most this many are kept per arm
+ARM_ANGLE_STEP = 0.5
+ARM_SPRITE_CACHE = 48
 
 
 class RobotArmWidget(QWidget):
@@ -184,6 +263,13 @@ class RobotArmWidget(QWidget):
         self.held_box_visible = False
         self.held_box_color = QColor(200, 40, 40)
 
+        # Render caches: base/tower layer, and arm sprites keyed by quantized pose + held box (LRU). Only poses
+        # painted twice in a row (arm at rest) get a sprite; while the arm moves it is drawn directly.
+        self._base_layer = None
+        self._base_key = None
+        self._sprites = OrderedDict()
+        self._last_pose = None
+
     def _joint(self, p, r_outer=16, r_inner=8):
         # Draw a joint
         p.setPen(QPen(QColor(40, 40, 45), 2))
@@ -222,11 +308,9 @@ class RobotArmWidget(QWidget):
 
         return QPoint(int(x2), int(y2))
 
-    def paintEvent(self, e):
-        p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height(); m = 10
-
-        # Base & tower
+    def _geometry(self):
+        # Base/tower rects and the shoulder origin for the current size
+        w, h = self.width(), self.height()
         base_h = max(12, int(h * 0.08))
         base_w = max(120, int(w * 0.38))
         base_rect = QRectF((w - base_w) / 2.0, h - base_h - 6, base_w, base_h)
@@ -234,12 +318,33 @@ class RobotArmWidget(QWidget):
         tower_w = max(28, int(base_w * 0.22))
         tower_rect = QRectF(base_rect.center().x() - tower_w / 2.0,
                             h - base_h - tower_h, tower_w, tower_h)
+        return base_h, base_rect, tower_rect
+
+    def _palette_key(self):
+        # Includes the DPR: after a move to a screen with another scale factor the pixmaps are rendered again
+        return (self.width(), self.height(), self.devicePixelRatioF(), self.c_arm.rgba(), self.c_arm_dark.rgba(),
+                self.c_joint.rgba(), self.c_base.rgba())
+
+    def invalidate_cache(self):
+        # Drop cached layers/sprites (size or palette changes are also detected on paint)
+        self._base_layer = None
+        self._base_key = None
+        self._sprites.clear()
+        self.update()
+
+    def _paint_base(self, p):
+        # Base & tower
+        base_h, base_rect, tower_rect = self._geometry()
         p.setBrush(QBrush(self.c_base))
         p.setPen(QPen(QColor(30, 30, 32), 2))
         p.drawRoundedRect(base_rect, base_h/2.5, base_h/2.5)
         p.setBrush(QBrush(self.c_base.darker(110)))
         p.drawRoundedRect(tower_rect, 6, 6)
 
+    def _paint_arm(self, p, shoulder, elbow, held_color):
+        w, h = self.width(), self.height(); m = 10
+        _, _, tower_rect = self._geometry()
+
         # Kinematics
         origin = QPointF(tower_rect.center().x(), tower_rect.top())
         avail_up = max(30.0, origin.y() - m)
@@ -251,12 +356,12 @@ class RobotArmWidget(QWidget):
         self._joint(p, r_outer=max(12.0, arm_t*0.9), r_inner=max(5.0, arm_t*0.45))
 
         p.save()
-        p.rotate(self.shoulder_angle)
+        p.rotate(shoulder)
         p.setBrush(QBrush(self.c_arm)); p.setPen(QPen(self.c_arm_dark, 2))
         p.drawRoundedRect(QRectF(0, -arm_t/2, L1, arm_t), arm_t/2.5, arm_t/2.5)
 
         p.translate(L1, 0); self._joint(p, r_outer=max(10.0, arm_t*0.8), r_inner=max(4.0, arm_t*0.4))
-        p.rotate(self.elbow_angle)
+        p.rotate(elbow)
         p.setBrush(QBrush(self.c_arm)); p.setPen(QPen(self.c_arm_dark, 2))
         p.drawRoundedRect(QRectF(0, -arm_t/2 + 1, L2, arm_t - 2), arm_t/2.7, arm_t/2.7)
 
@@ -265,13 +370,13 @@ class RobotArmWidget(QWidget):
         fL, fW = max(16.0, arm_t*0.9), max(4.0, arm_t*0.35)
 
         # Held box (drawn before fingers so grippers stay visible)
-        if getattr(self, "held_box_visible", False):
+        if held_color is not None:
             p.save()
             hb_len = 24.0   # box length along the gripper
             hb_thk = 24.0   # box thickness between fingers
             xc = fL * 0.55  # position around mid-finger
-            p.setPen(QPen(self.held_box_color.darker(200), 1))
-            p.setBrush(QBrush(self.held_box_color))
+            p.setPen(QPen(held_color.darker(200), 1))
+            p.setBrush(QBrush(held_color))
             p.drawRoundedRect(QRectF(xc - hb_len/2, -hb_thk/2, hb_len, hb_thk), 3, 3)
             p.restore()
 
@@ -283,6 +388,62 @@ class RobotArmWidget(QWidget):
         p.drawEllipse(QPointF(0, 0), cap_r, cap_r)
         p.restore(); p.restore()
 
+    def _arm_sprite(self, key):
+        # Rendered arm for a quantized pose + held colour, most recently used last
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+        shoulder, elbow, held_rgba = key
+        if len(self._sprites) >= ARM_SPRITE_CACHE:
+            # Recycle the least recently used pixmap (same size; a resize clears the cache)
+            _, sprite = self._sprites.popitem(last=False)
+            sprite.fill(Qt.transparent)
+        else:
+            sprite = layer_pixmap(self)
+        sp = QPainter(sprite); sp.setRenderHint(QPainter.Antialiasing)
+        self._paint_arm(sp, shoulder * ARM_ANGLE_STEP, elbow * ARM_ANGLE_STEP,
+                        None if held_rgba is None else QColor.fromRgba(held_rgba))
+        sp.end()
+        self._sprites[key] = sprite
+        return sprite
+
+    def paintEvent(self, e):
+        # Any size/DPR/palette change drops both caches
+        pkey = self._palette_key()
+        if pkey != self._base_key:
+            self._sprites.clear()
+            self._base_layer = layer_pixmap(self)
+            bp = QPainter(self._base_layer); bp.setRenderHint(QPainter.Antialiasing)
+            self._paint_base(bp)
+            bp.end()
+            self._base_key = pkey
+
+        held = self.held_box_color.rgba() if getattr(self, "held_box_visible", False) else None
+        key = (int(round(self.shoulder_angle / ARM_ANGLE_STEP)),
+               int(round(self.elbow_angle / ARM_ANGLE_STEP)), held)
+
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._base_layer)
+        moving = key != self._last_pose
+        self._last_pose = key
+        if moving and key not in self._sprites:
+            # Most poses of a move are painted once: rendering a widget-sized sprite to blit it would cost more
+            p.setRenderHint(QPainter.Antialiasing)
+            self._paint_arm(p, key[0] * ARM_ANGLE_STEP, key[1] * ARM_ANGLE_STEP,
+                            None if held is None else QColor.fromRgba(held))
+            return
+        p.drawPixmap(0, 0, self._arm_sprite(key))
+
+# Pre-rendered container bitmaps keyed by size, palette and border colour (LRU, shared by all containers);
+# room for every bin of all three tasks in all of its BIN_STATE_BORDERS
+_CONTAINER_BITMAPS = OrderedDict()
+CONTAINER_BITMAP_CACHE = 160
+
+# Border states a bin can flash or be highlighted in: any box colour (error flash) plus the amber pick highlight
+BIN_STATE_BORDERS = tuple(BOX_HEX.values()) + ("#ffbf00",)
+
+
 class StorageContainerWidget(QWidget):
     # Simple container box with rounded rect, lid seam, and ribs, per-instance palette so each task can override
     def __init__(self, parent=None):
@@ -306,9 +467,16 @@ class StorageContainerWidget(QWidget):
         self.fill_bottom = QColor("#bff0d3")
         self.rib = QColor(42, 122, 75, 120)
 
-    def paintEvent(self, e):
+        # Other border states (flash, highlight) rendered ahead of time whenever the size changes
+        self.prerender_borders = ()
+
+    def _state_key(self):
+        return (self.width(), self.height(), self.devicePixelRatioF(), self.border.rgba(),
+                self.fill_top.rgba(), self.fill_bottom.rgba(), self.rib.rgba())
+
+    def _render(self, pm):
         # Draw the container with lid seam and ribs
-        p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
+        p = QPainter(pm); p.setRenderHint(QPainter.Antialiasing)
         w, h = self.width(), self.height()
         m = max(10, int(min(w, h) * 0.08))
         r = QRectF(m, m, w - 2*m, h - 2*m)
@@ -321,13 +489,76 @@ class StorageContainerWidget(QWidget):
 
         seam_y = r.top() + r.height() * 0.22
         p.setPen(QPen(self.border.darker(115), 1.2))
-        p.drawLine(r.left() + 8, seam_y, r.right() - 8, seam_y)
+        p.drawLine(QPointF(r.left() + 8, seam_y), QPointF(r.right() - 8, seam_y))
 
         p.setPen(QPen(self.rib, 2))
         rib_top = seam_y + r.height() * 0.06; rib_bottom = r.bottom() - 8
         for t in (0.30, 0.50, 0.70):
             x = r.left() + r.width() * t
-            p.drawLine(x, rib_top, x, rib_bottom)
+            p.drawLine(QPointF(x, rib_top), QPointF(x, rib_bottom))
+        p.end()
+
+    def _bitmap(self):
+        # Pre-rendered container for the current size/palette/border, shared by every container that looks the same
+        key = self._state_key()
+        pm = _CONTAINER_BITMAPS.get(key)
+        if pm is None:
+            pm = layer_pixmap(self)
+            self._render(pm)
+            _CONTAINER_BITMAPS[key] = pm
+            if len(_CONTAINER_BITMAPS) > CONTAINER_BITMAP_CACHE:
+                _CONTAINER_BITMAPS.popitem(last=False)
+        else:
+            _CONTAINER_BITMAPS.move_to_end(key)
+        return pm
+
+    def prerender(self, *borders):
+        # Render the given border states (e.g. normal, flash, highlight) ahead of time for the current size
+        current = self.border
+        for border in borders:
+            self.border = QColor(border)
+            self._bitmap()
+        self.border = current
+
+    def resizeEvent(self, e):
+        # New size: render the normal and known flash/highlight states now, not on the first flash
+        super().resizeEvent(e)
+        if self.prerender_borders:
+            self.prerender(self.border, *self.prerender_borders)
+
+    def paintEvent(self, e):
+        # Blit the bitmap for the current border state (normal / flash / highlight)
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._bitmap())
+
+
+# Show a replayed scene (simulation.replay) on a task's bins: each bin's oldest open error as a steady border +
+# badge, the bin the user is picking from highlighted. Shared by the sorting and inspection tasks, which keep their
+# bins in _slot_to_widget/_badges/_orig_borders and highlight with _highlight_bin.
+def show_bin_replay(task, scene):
+    bins = scene.get("bins", {})
+    held = scene.get("held")
+    for slot, w in task._slot_to_widget.items():
+        badge = task._badges.get(slot)
+        errors = bins.get(slot)
+        if held and held[1] == slot:
+            task._highlight_bin(slot, True)
+        else:
+            w.border = box_qcolor(errors[0]) if errors else task._orig_borders.get(slot, w.border)
+            w.update()
+        if not badge:
+            continue
+        if errors:
+            q = box_qcolor(errors[0])
+            badge.setStyleSheet(
+                "color: white; "
+                f"background: {q.name()}; "
+                f"border: 2px solid {q.darker(130).name()}; "
+                "border-radius: 20px; font-weight: 800; font-size: 24px;"
+            )
+            badge.show()
+        else:
+            badge.hide()
 
 
 class BaseTask(QWidget):
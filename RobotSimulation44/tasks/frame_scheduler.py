@@ -0,0 +1,127 @@
+# tasks/frame_scheduler.py
+import math
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+# Longest single step handed to subscribers (ms); a longer frame is split so the arm never skips the grip window
+MAX_STEP_MS = 20.0
+
+# Longest stall caught up on (ms); anything beyond (debugger, sleep/resume) is dropped rather than replayed
+MAX_CATCHUP_MS = 1000.0
+
+
+class FrameScheduler(QObject):
+    # One ~60 fps timer shared by every task and widget. Subscribers get the real elapsed dt (ms, monotonic clock);
+    # widgets queued with request_update() are repainted once, after all subscribers have run.
+    def __init__(self, interval_ms=16):
+        super().__init__()
+        self._subscribers = []
+        self._dirty = []
+
+        self._last = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_frame)
+
+    def interval(self):
+        return self._timer.interval()
+
+    # callback(dt_ms) every frame; the shared timer only runs while someone is subscribed
+    def subscribe(self, callback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+        if not self._timer.isActive():
+            self._last = time.perf_counter()
+            self._timer.start()
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+        if not self._subscribers and self._timer.isActive():
+            self._timer.stop()
+
+    # Queue a repaint for the end of this frame (deduplicated); repaint now if no frames are running
+    def request_update(self, widget):
+        if not self._timer.isActive():
+            widget.update()
+            return
+        if widget not in self._dirty:
+            self._dirty.append(widget)
+
+    def _on_frame(self):
+        now = time.perf_counter()
+        dt_ms = min((now - self._last) * 1000.0, MAX_CATCHUP_MS)
+        self._last = now
+
+        # Catch up after a stall (plot redraw, CSV dump) in bounded steps so pace is kept under load
+        steps = max(1, int(math.ceil(dt_ms / MAX_STEP_MS)))
+        step_ms = dt_ms / steps
+        for _ in range(steps):
+            for callback in list(self._subscribers):
+                callback(step_ms)
+
+        dirty, self._dirty = self._dirty, []
+        for widget in dirty:
+            widget.update()
+
+
+class FrameTimer(QObject):
+    # QTimer-style handle on the shared scheduler (start/stop/isActive/setInterval);
+    # timeout carries the real ms elapsed since the previous timeout
+    timeout = pyqtSignal(float)
+
+    def __init__(self, parent=None, interval_ms=None):
+        super().__init__(parent)
+        self._interval = interval_ms
+        self._active = False
+        self._elapsed = 0.0     # ms towards the next timeout (keeps the remainder past the last one)
+        self._since = 0.0       # real ms since the last timeout
+
+    # None/0 = every frame
+    def setInterval(self, interval_ms):
+        self._interval = interval_ms
+
+    def interval(self):
+        return self._interval or get_frame_scheduler().interval()
+
+    def isActive(self):
+        return self._active
+
+    def start(self, interval_ms=None):
+        if interval_ms is not None:
+            self._interval = interval_ms
+        self._elapsed = self._since = 0.0
+        if not self._active:
+            self._active = True
+            get_frame_scheduler().subscribe(self._on_frame)
+
+    def stop(self):
+        if self._active:
+            self._active = False
+            get_frame_scheduler().unsubscribe(self._on_frame)
+
+    def _on_frame(self, dt_ms):
+        self._elapsed += dt_ms
+        self._since += dt_ms
+        # Anything up to one frame interval fires on every (catch-up) step
+        interval = self._interval or 0
+        if interval > get_frame_scheduler().interval():
+            if self._elapsed < interval:
+                return
+            # Keep the overshoot so the period doesn't slip by up to a frame per timeout; a backlog (capped like
+            # the scheduler's catch-up) fires on the following frames
+            self._elapsed = min(self._elapsed - interval, MAX_CATCHUP_MS)
+        else:
+            self._elapsed = 0.0
+        since, self._since = self._since, 0.0
+        self.timeout.emit(since)
+
+
+# Singleton scheduler instance
+__singleton = None
+def get_frame_scheduler():
+    global __singleton
+    if __singleton is None:
+        __singleton = FrameScheduler()
+    return __singleton
@@ -2,12 +2,15 @@
 from PyQt5.QtGui import QColor
 from PyQt5.QtCore import Qt, QTimer, QEvent, QPropertyAnimation, QRect
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QSizePolicy, QLabel
-from .base_task import BaseTask, StorageContainerWidget
+from .base_task import BaseTask, StorageContainerWidget, BIN_STATE_BORDERS, box_qcolor, show_bin_replay
+from .frame_scheduler import FrameTimer, get_frame_scheduler
 from .inspection_logic import InspectionWorker
-from event_logger import get_logger
-import random
-import time
+from .metrics_publisher import MetricsPublisher
 from audio_manager import AudioManager
+from event_logger import (get_logger, EV_PLACED, EV_MISPLACED, EV_START, EV_STOP, EV_COMPLETE,
+                          EV_PICK, EV_DROP_OK, EV_DROP_WRONG, EV_CLICK_EMPTY)
+from simulation.inspection import InspectionSim
+from simulation.rng import SessionRng
 
 
 class InspectionTask(BaseTask):
@@ -76,23 +79,28 @@ class InspectionTask(BaseTask):
             w._slot = slot
             w.installEventFilter(self)
 
-        # Initialize error tracking
-        self._errors = {}
-        self._bin_errors = {k: [] for k in self._slot_to_widget.keys()}
-        self._next_eid = 1
-        self._selected_error = None
+        # Headless inspection sim (arm pick cycle + error tracking); this widget only renders it
+        self.sim = InspectionSim(belt=self.conveyor.belt)
+        self.sim.on_grab = lambda: self.play_sound("robotic_arm")
+        self.sim.on_sorted = self._on_box_sorted
+        self.sim.on_drop = self._on_box_dropped
+        self.sim.stats.on_alarm = lambda started, secs: get_logger().log_alarm("inspection", started, secs)
+
+        # Live metrics go out on a fixed cadence; counters are pulled from the sim, not pushed per box
+        self.metrics_pub = MetricsPublisher(
+            self, "insp", "inspection", self._live_metrics,
+            {"total": "boxes inspected", "errors": "errors", "corrections": "errors corrected"},
+        )
 
         # Original border colors
         self._orig_borders = {k: w.border for k, w in self._slot_to_widget.items()}
-        self._slot_color_map = {
-            "green": QColor("#1f7a3a"),
-            "red":   QColor("#c82828"),
-        }
+        for w in self._slot_to_widget.values():
+            w.prerender_borders = BIN_STATE_BORDERS
 
         # Drag ghost for error correction
         self._drag_label = None        # QLabel that follows mouse
         self._drag_color = None        # QColor of the carried box
-        self._drag_timer = QTimer(self)
+        self._drag_timer = FrameTimer(self)
         self._drag_timer.setInterval(16)   # ~60fps
         self._drag_timer.timeout.connect(self._update_drag_ghost)
 
@@ -102,7 +110,7 @@ class InspectionTask(BaseTask):
 
         # Flashing
         self._flash_on = False
-        self._flash_timer = QTimer(self)
+        self._flash_timer = FrameTimer(self)
         self._flash_timer.setInterval(350)
         self._flash_timer.timeout.connect(self._flash_tick)
 
@@ -116,38 +124,11 @@ class InspectionTask(BaseTask):
         self._box_timer = QTimer(self)
         self._box_timer.timeout.connect(self.conveyor.spawn_box)
 
-        # Arm "touch a box" animation
-        self._pick_timer = QTimer(self)
+        # Arm "touch a box" animation (advances self.sim)
+        self._pick_timer = FrameTimer(self)
         self._pick_timer.setInterval(16)
         self._pick_timer.timeout.connect(self._tick_pick)
 
-        # FSM state
-        self._pick_state = "idle"
-        self._pick_t = 0
-        self._pick_duration = 0
-        self._pick_from = (self.arm.shoulder_angle, self.arm.elbow_angle)
-        self._pick_to = (self.arm.shoulder_angle, self.arm.elbow_angle)
-
-        # Trigger settings
-        self._now_ms = 0
-        self._last_touch_time_ms = -10000
-        self._touch_window_px = 18
-        self._touch_cooldown_ms = 120
-
-        # Despawn offset
-        self._despawn_offset_px = 0
-
-        # Target slot for present
-        self._target_slot = None
-        self._present_slot_override = None
-        self._pending_color = None
-
-        # For Reaction time
-        self._error_start_times = {}
-        # For correction accuracy
-        self._total_corrections = 0
-        self._correct_corrections = 0
-
         # Worker
         self.worker = None
 
@@ -156,23 +137,21 @@ class InspectionTask(BaseTask):
         self._alarm_active = False
 
     # Called by the observer GUI
-    def start(self, pace=None, error_rate=None, error_rate_percent=None):
+    def start(self, pace=None, error_rate=None, error_rate_percent=None, seed=None):
         # Guard: only run if this task is enabled
         if not getattr(self, "enabled", True):
             return
 
+        # Seeded session RNG (the Observer sends one seed per run; None = fresh seed)
+        self.rng = SessionRng(seed)
+        self.conveyor.rng = self.rng.stream("inspection.belt")
+
         # Belt motion
         self.conveyor.setBeltSpeed(120)
         self.conveyor.enable_motion(True)
 
         # reset trigger state so we can fire immediately after a Stop
-        self._now_ms = 0
-        self._last_touch_time_ms = -10000
-        self._pick_state = "idle"
-        self._pick_t = 0
-        self._target_slot = None
-        self._present_slot_override = None
-        self._pending_color = None
+        self.sim.start()
 
         # reset metrics when new task is started
         if hasattr(self, "metrics_manager"):
@@ -180,8 +159,7 @@ class InspectionTask(BaseTask):
 
         # Start arm pick monitor
         if not self._pick_timer.isActive():
-            sh, el = self._pose_home()
-            self._set_arm(sh, el)
+            self._sync_arm()
             self._pick_timer.start()
 
         # Start flashing timer
@@ -193,16 +171,21 @@ class InspectionTask(BaseTask):
             self.worker = InspectionWorker(
                 pace=pace,
                 error_rate=error_rate,
-                error_rate_percent=error_rate_percent
+                error_rate_percent=error_rate_percent,
+                rng=self.rng
             )
             self.worker.box_spawned.connect(self.spawn_box_from_worker)
-            self.worker.box_sorted.connect(self._on_box_sorted)
-            self.worker.metrics_live.connect(self._on_metrics_live)
             self.worker.start()
         elif not self.worker.isRunning():
             self.worker.running = True
             if not self.worker.isRunning():
                 self.worker.start()
+
+        # The sim rolls each inspection on the worker (counters + live metrics)
+        self.sim.model = self.worker.model
+        self.sim.sorter = self.worker.sort_box
+        self.metrics_pub.start()
+        get_logger().log_user("inspection", EV_START, pace, error_rate)
     
         # Playing conveyor sound
         self.play_sound("conveyor")
@@ -221,13 +204,14 @@ class InspectionTask(BaseTask):
         #Stop conveyor sound and alarm
         self.audio.stop_alarm()
         self.audio.stop_conveyor()
+        self.sim.stats.alarm_stopped(self.sim.now(), cleared=False)
+
+        # Final metrics tick before the sim clears its counters
+        self.metrics_pub.stop()
+        get_logger().log_user("inspection", EV_COMPLETE)
 
         # Clear all boxes from the conveyor
-        if hasattr(self.conveyor, "_boxes"):
-            self.conveyor._boxes.clear()
-        if hasattr(self.conveyor, "_box_colors"):
-            self.conveyor._box_colors.clear()
-        self.conveyor.update()
+        self.conveyor.clear_boxes()
 
         # Reset borders and hide badges
         for slot, w in self._slot_to_widget.items():
@@ -236,26 +220,21 @@ class InspectionTask(BaseTask):
         for b in self._badges.values():
             b.hide()
 
-        # Return arm to home
-        sh, el = self._pose_home()
-        self._set_arm(sh, el)
-        self.arm.held_box_visible = False
-        self.arm.update()
-
         # Clear highlight if any selection
-        if self._selected_error is not None:
+        if self.sim.bins.selected is not None:
             for slot in self._slot_to_widget.keys():
                 self._highlight_bin(slot, False)
-            self._selected_error = None
+        self._end_drag_box()
 
         # Stop worker logic
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker = None
+        self.sim.sorter = None
 
-        # Reset correction counters
-        self._total_corrections = 0
-        self._correct_corrections = 0
+        # Return arm to home; clears errors, selection and correction counters
+        self.sim.stop()
+        self._sync_arm()
 
     def stop(self):
         # Stop motions
@@ -270,13 +249,14 @@ class InspectionTask(BaseTask):
         # Stop conveyor sound and alarm
         self.audio.stop_alarm()
         self.audio.stop_conveyor()
+        self.sim.stats.alarm_stopped(self.sim.now(), cleared=False)
+
+        # Final metrics tick before the sim clears its counters
+        self.metrics_pub.stop()
+        get_logger().log_user("inspection", EV_STOP)
 
         # Clear all boxes from the conveyor
-        if hasattr(self.conveyor, "_boxes"):
-            self.conveyor._boxes.clear()
-        if hasattr(self.conveyor, "_box_colors"):
-            self.conveyor._box_colors.clear()
-        self.conveyor.update()
+        self.conveyor.clear_boxes()
 
         # Reset borders and hide badges
         for slot, w in self._slot_to_widget.items():
@@ -285,231 +265,47 @@ class InspectionTask(BaseTask):
         for b in self._badges.values():
             b.hide()
 
-        # Return arm to home
-        sh, el = self._pose_home()
-        self._set_arm(sh, el)
-        self.arm.held_box_visible = False
-        self.arm.update()
-
         # Clear highlight if any selection
-        if self._selected_error is not None:
+        if self.sim.bins.selected is not None:
             for slot in self._slot_to_widget.keys():
                 self._highlight_bin(slot, False)
-            self._selected_error = None
+        self._end_drag_box()
 
         # Stop worker logic
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker = None
+        self.sim.sorter = None
+
+        # Return arm to home; clears errors, selection and correction counters
+        self.sim.stop()
+        self._sync_arm()
 
         # Reset metrics
         if hasattr(self, "metrics_manager"):
             self.metrics_manager.reset_metrics()
 
-        # Reset correction counters
-        self._total_corrections = 0
-        self._correct_corrections = 0
-
-    # Arm pick cycle (approach -> descend -> hold -> lift -> present -> return)
-    def _pose_home(self):
-        return (-90.0, -0.0)
-
-    def _pose_prep(self):
-        return (-92.0, -12.0)
-
-    def _pose_pick(self):
-        return (-110.0, -95.0)
-
-    def _pose_lift(self):
-        return (-93.0, -10.0)
-
-    # Quick 'pointing' poses toward each containers general direction
-    # (arm rotation from base, elbow rotation)
-    # -90 is directly up
-    def _pose_present(self, slot):
-        poses = {
-            "green": (-220.0, -10.0), # left-mid
-            "red":   (40.0,  10.0),   # right-mid
-        }
-        return poses.get(slot, self._pose_lift())
-
-    def _set_arm(self, shoulder, elbow):
-        self.arm.shoulder_angle = float(shoulder)
-        self.arm.elbow_angle = float(elbow)
-        self.arm.update()
-
-    def _start_seg(self, to_angles, duration_ms):
-        self._pick_from = (self.arm.shoulder_angle, self.arm.elbow_angle)
-        self._pick_to = (float(to_angles[0]), float(to_angles[1]))
-        self._pick_duration = max(1, int(duration_ms))
-        self._pick_t = 0
-
-    def _tick_pick(self):
-        # global time
-        self._now_ms += self._pick_timer.interval()
-        
-        # If idle, only start a cycle when a box is near the gripper
-        if self._pick_state == "idle":
-            if self._box_near_grip() and (self._now_ms - self._last_touch_time_ms) >= self._touch_cooldown_ms:
-                self._last_touch_time_ms = self._now_ms
-                
-                # Lock color & slot at trigger time
-                self._pending_color = self._color_of_box_in_window()
-                self._target_slot = self._color_to_slot(self._pending_color) if self._pending_color else None
-                self._pick_state = "to_prep"
-                self._start_seg(self._pose_prep(), 120)
-            else:
-                return
-            
-        # advance interpolation for non-idle states
-        self._pick_t += self._pick_timer.interval()
-        t = min(1.0, self._pick_t / float(self._pick_duration))
-        s0, e0 = self._pick_from
-        s1, e1 = self._pick_to
-        s = s0 + (s1 - s0) * t
-        e = e0 + (e1 - e0) * t
-        self._set_arm(s, e)
-
-        # Despawn slightly later than detection (only while interacting)
-        if self._pick_state in ("hold", "lift"):
-            self._despawn_if_past_cutoff()
-            
-        # segment complete -> next state
-        if t >= 1.0:
-            if self._pick_state == "to_prep":
-                self._pick_state = "descend"
-                self._start_seg(self._pose_pick(), 120)
-
-            elif self._pick_state == "descend":
-                # Trigger sorting only when arm reaches box
-                nearest_color = self._color_of_box_in_window()
-                if nearest_color and self.worker:
-                    hex_color = nearest_color.name() if hasattr(nearest_color, "name") else nearest_color
-                    COLOR_MAP = {"#c82828": "red", "#1f7a3a": "green"}
-                    self.worker.sort_box(COLOR_MAP.get(hex_color, "green"))
-
-                # play robotic arm audio
-                self.play_sound("robotic_arm")
-
-                self._pick_state = "hold"
-                # Capture held box color
-                c = self._color_of_box_in_window() or self._pending_color
-                if c is not None:
-                    self.arm.held_box_color = c
-                    self.arm.held_box_visible = True
-                    self._target_slot = self._color_to_slot(c)
-                    self.arm.update()
-                self._start_seg(self._pose_pick(), 40)
-
-            elif self._pick_state == "hold":
-                self._pick_state = "lift"
-                self._start_seg(self._pose_lift(), 120)
-
-            elif self._pick_state == "lift":
-                # Still move the arm towards the target container
-                slot_to_use = self._present_slot_override or self._target_slot
-                if slot_to_use:
-                    self._pick_state = "present"
-                    self._start_seg(self._pose_present(slot_to_use), 200)
-                else:
-                    self._pick_state = "return"
-                    self.arm.held_box_visible = False
-                    self.arm.update()
-                    self._start_seg(self._pose_home(), 160)
-
-            elif self._pick_state == "present":
-                # Animate flying box at the moment of drop
-                slot_to_use = self._present_slot_override or self._target_slot
-                if slot_to_use:
-                    target_widget = self._slot_to_widget.get(slot_to_use)
-                    if target_widget and getattr(self.arm, "held_box_color", None):
-                        self._animate_flying_box(self.arm.held_box_color, target_widget)
-                        
-                # Hide held box and return arm
-                self._pick_state = "return"
-                self.arm.held_box_visible = False
-                self.arm.update()
-                self._start_seg(self._pose_home(), 200)
-
-            elif self._pick_state == "return":
-                self._pick_state = "idle_pause"
-                self._target_slot = None
-                self._pending_color = None
-                self._present_slot_override = None
-                self._start_seg(self._pose_home(), 40)
-
-            elif self._pick_state == "idle_pause":
-                self._pick_state = "idle"
-
-    # Helpers
-    def _grip_x(self):
-        # Single source of truth for the gripper's detection X (edit here to shift detection) 
-        return self.conveyor.width() * 0.44 # Change this value to increate/decrease the position where the robot arm picks up a box
-
-    def _box_near_grip(self):
-        # Detection-only: True if any box is within the window around the gripper 
-        boxes = getattr(self.conveyor, "_boxes", None)
-        if not boxes:
-            return False
-        grip_x = self._grip_x()  # unified detection X
-        w = self._touch_window_px
-        for x in boxes:
-            if (grip_x - w) <= x <= (grip_x + w):
-                return True
-        return False
-
-    def _despawn_if_past_cutoff(self):
-        # Remove a box after it passes the later cutoff (independent of detection) 
-        boxes = getattr(self.conveyor, "_boxes", None)
-        if not boxes:
-            return
-        # Get the list of box colors
-        colors = getattr(self.conveyor, "_box_colors", None)
-        
-        # Use the same detection X as the gripper trigger
-        detect_x = self._grip_x()
-        cutoff_x = detect_x + self._despawn_offset_px # set offset to 0 so the box disappears as soon as its touched
-        
-        # Find the first box that has passed the cutoff point
-        hit_index = -1
-        for i, x in enumerate(boxes):
-            if x >= cutoff_x:
-                hit_index = i
-                break
-        
-        # Remove the box and its color if a cutoff was detected
-        if hit_index != -1:
-            del boxes[hit_index]
-            if isinstance(colors, list) and hit_index < len(colors):
-                del colors[hit_index]
-            self.conveyor.update()
-            
-    # Helper to get nearest box color
-    def _color_of_box_in_window(self):
-        # Return the QColor of the first box currently inside the detection window (or None) 
-        boxes = getattr(self.conveyor, "_boxes", None)
-        cols = getattr(self.conveyor, "_box_colors", None)
-        if not boxes or not cols:
-            return None
-        grip_x = self._grip_x()  # unified detection X
-        w = self._touch_window_px
-        for i, x in enumerate(boxes):
-            if (grip_x - w) <= x <= (grip_x + w):
-                if i < len(cols):
-                    return cols[i]
-        return None
-    
-    # Map a QColor to a slot name matching the containers
-    def _color_to_slot(self, qcolor):
-        try:
-            key = qcolor.name().lower()
-        except Exception:
-            return None
-        if key == "#c82828":
-            return "red"
-        if key == "#1f7a3a":
-            return "green"
-        return "green"
+    # Arm pick cycle (approach -> descend -> hold -> lift -> present -> return) runs in self.sim
+    def _sync_arm(self):
+        # Mirror the sim's arm pose and held box onto the arm widget
+        arm = self.sim.arm
+        self.arm.shoulder_angle = float(arm.shoulder)
+        self.arm.elbow_angle = float(arm.elbow)
+        self.arm.held_box_visible = arm.held is not None
+        if arm.held is not None:
+            self.arm.held_box_color = box_qcolor(arm.held)
+        get_frame_scheduler().request_update(self.arm)
+
+    def _tick_pick(self, dt_ms):
+        # Advance the sim by the real frame time from the shared scheduler
+        if self.sim.tick(dt_ms):
+            self._sync_arm()
+
+    def _on_box_dropped(self, color, slot):
+        # Animate flying box at the moment of drop
+        target_widget = self._slot_to_widget.get(slot)
+        if target_widget:
+            self._animate_flying_box(box_qcolor(color), target_widget)
 
     def _animate_flying_box(self, color, target_widget):
         # Spawn a temporary box at the gripper and animate it flying into the container 
@@ -569,10 +365,7 @@ class InspectionTask(BaseTask):
 
     def _current_selected_slot(self):
         # Return the slot of the currently selected (held) error, if any
-        if self._selected_error is None:
-            return None
-        rec = self._errors.get(self._selected_error)
-        return rec['current'] if rec else None
+        return self.sim.bins.selected_slot()
 
 
     # Drag ghost helpers
@@ -649,30 +442,26 @@ class InspectionTask(BaseTask):
     def _apply_flash_colors(self):
         # Apply flashing borders per-bin based on oldest unresolved error, and update badges, Alarm starts only if an error has been active for >=2s, and stops when all are cleared 
         selected_slot = self._current_selected_slot()
+        bins = self.sim.bins
         for slot, w in self._slot_to_widget.items():
-            ids = self._bin_errors.get(slot, [])
             badge = self._badges.get(slot)
 
-            if ids:
-                head = ids[0]
-                rec = self._errors.get(head)
-                if rec:
-                    # Border flashing color (based on error color)
-                    flash_q = self._slot_color_map.get(rec['color'], self._orig_borders.get(slot, w.border))
-                    if slot != selected_slot:  # selection highlight takes priority
-                        w.border = flash_q if self._flash_on else self._orig_borders.get(slot, w.border)
-                        w.update()
-
-                    if badge:
-                        q = self._slot_color_map.get(rec['color'])
-                        if q:
-                            badge.setStyleSheet(
-                                "color: white; "
-                                f"background: {q.name()}; "
-                                f"border: 2px solid {q.darker(130).name()}; "
-                                "border-radius: 20px; font-weight: 800; font-size: 24px;"
-                            )
-                            badge.show()
+            rec = bins.head(slot)
+            if rec:
+                # Border flashing color (based on error color)
+                q = box_qcolor(rec['color'])
+                if slot != selected_slot:  # selection highlight takes priority
+                    w.border = q if self._flash_on else self._orig_borders.get(slot, w.border)
+                    w.update()
+
+                if badge:
+                    badge.setStyleSheet(
+                        "color: white; "
+                        f"background: {q.name()}; "
+                        f"border: 2px solid {q.darker(130).name()}; "
+                        "border-radius: 20px; font-weight: 800; font-size: 24px;"
+                    )
+                    badge.show()
             else:
                 # No errors -> restore original + hide badge
                 if w.border != self._orig_borders.get(slot, w.border) and slot != selected_slot:
@@ -682,106 +471,84 @@ class InspectionTask(BaseTask):
                     badge.hide()
 
         # Alarm logic
-        if self._errors and not self._alarm_active:
-            oldest_age = 0.0  # track age of the oldest unresolved error
-            for eid, start in self._error_start_times.items():
-                age = time.time() - start
-                if age > oldest_age:
-                    oldest_age = age
+        if bins.errors and not self._alarm_active:
+            # track age of the oldest unresolved error
+            oldest_age = bins.oldest_age(self.sim.now())
             if oldest_age >= 2.0:
                 # wait until 2s old error
                 self.play_sound("alarm")
                 self._alarm_active = True
-        elif not self._errors and self._alarm_active:
+                self.sim.stats.alarm_started(oldest_age, self.sim.now())
+        elif not bins.errors and self._alarm_active:
             self.audio.stop_alarm()
             self._alarm_active = False
+            self.sim.stats.alarm_stopped(self.sim.now())
 
     def _flash_tick(self):
         self._flash_on = not self._flash_on
         self._apply_flash_colors()
 
+    # Show a replayed scene (simulation.replay): each bin's oldest open error as a steady border + badge, the bin
+    # the user is picking from highlighted. Renders only; the sim, alarm and logger are not touched.
+    def show_replay(self, scene):
+        show_bin_replay(self, scene)
+
     def _on_container_clicked(self, slot):
         # === CASE 1: Not holding anything, attempt to PICK from this bin ===
-        if self._selected_error is None:
-            ids = self._bin_errors.get(slot, [])
-            if not ids:
-                print(f"(Inspection Task: No errors in {slot} to pick up)")
-                return
-
+        if self.sim.bins.selected is None:
             # FIFO pick one error from the clicked bin
-            eid = ids.pop(0)
-            rec = self._errors.get(eid)
+            rec = self.sim.pick_error(slot)
             if not rec:
+                print(f"(Inspection Task: No errors in {slot} to pick up)")
+                get_logger().log_user("inspection", EV_CLICK_EMPTY, slot)
                 return
 
-            self._selected_error = eid
+            get_logger().log_user("inspection", EV_PICK, rec['color'], slot)
             self._highlight_bin(slot, True)
-            print(f"Inspection Task: Picked error #{eid}: {rec['color']} currently in {slot}. "
+            print(f"Inspection Task: Picked error #{rec['id']}: {rec['color']} currently in {slot}. "
                   f"Click the correct container ({rec['actual']}).")
 
             # Spawn ghost box
-            q = self._slot_color_map.get(rec['color'])
-            if q:
-                self._start_drag_box(q)
-                
+            self._start_drag_box(box_qcolor(rec['color']))
+
             # Update flashing/badges immediately (selected bin stops flashing)
             self._apply_flash_colors()
             return
         
         # === CASE 2: Holding an error, drop it into clicked bin ===
-        eid = self._selected_error
-        rec = self._errors.get(eid)
+        held = self.sim.bins.selected_record()
+        if held:
+            # Remove highlight from previous bin
+            self._highlight_bin(held['current'], False)
+
+        rec, correct = self.sim.place_error(slot)
         if not rec:
-            self._selected_error = None
             self._end_drag_box()
             self._apply_flash_colors()
             return
-        
-        # Remove highlight from previous bin
-        self._highlight_bin(rec['current'], False)
-        prev = rec['current']
-        new_slot = slot
-        
-        # Remove the error ID from the previous bin if it was still listed there
-        try:
-            if eid in self._bin_errors.get(prev, []):
-                self._bin_errors[prev].remove(eid)
-        except ValueError:
-            pass
 
-        rec['current'] = new_slot
-        self._total_corrections += 1
+        get_logger().log_user("inspection", EV_DROP_OK if correct else EV_DROP_WRONG, rec['color'], slot)
 
-        if new_slot == rec['actual']:
+        if correct:
             # Correct placement  resolve error
-            self._correct_corrections += 1
-            self._error_start_times.pop(eid, None)
-            print(f"Inspection Task: Resolved error #{eid}: moved {rec['color']} to {new_slot}")
-            
-            # Remove from error lists
-            if eid in self._errors:
-                del self._errors[eid]
+            print(f"Inspection Task: Resolved error #{rec['id']}: moved {rec['color']} to {slot}")
                 
             # Play correct chime
             self.play_sound("correct_chime")
             
             # Stop alarm if no errors remain
-            if not self._errors and self._alarm_active:
+            if not self.sim.bins.errors and self._alarm_active:
                 self.audio.stop_alarm()
                 self._alarm_active = False
+                self.sim.stats.alarm_stopped(self.sim.now())
         else:
             # Wrong placement  treat as permanently failed, clear the error too
-            self._error_start_times.pop(eid, None)
-            print(f"Inspection Task: Error #{eid} placed incorrectly in {new_slot} and cleared (was {rec['actual']})")
-            # Remove error record
-            if eid in self._errors:
-                del self._errors[eid]
+            print(f"Inspection Task: Error #{rec['id']} placed incorrectly in {slot} and cleared (was {rec['actual']})")
                 
             # Play incorrect chime here
             self.play_sound("incorrect_chime")
 
-        # End drag + deselect
-        self._selected_error = None
+        # End drag
         self._end_drag_box()
         
         # Refresh flashing + badges
@@ -793,32 +560,15 @@ class InspectionTask(BaseTask):
         error = box_data["error"]
         self.conveyor.spawn_box(color=color, error=error)
 
-    def _on_box_sorted(self, color, correct):
-        # Only allow recognized colors to be processed
-        assert color in {"green", "red"}
-
+    def _on_box_sorted(self, color, into, correct, eid):
+        # Sim callback: the inspection was decided and (if wrong) an error record now lives in `into`
+        get_logger().log_robot("inspection", EV_PLACED if correct else EV_MISPLACED, color, into)
         if correct:
             # If sorting is correct, show the correct slot highlight and play correct chime
-            self._present_slot_override = color
-            into = color
             msg = f"Inspection Task: sorted {color} into {into} - correct"
             print(msg)
             self.play_sound("correct_chime")
         else:
-            # If sorting is incorrect, determine which wrong bin it was placed in
-            wrong = "red" if color == "green" else "green"
-            self._present_slot_override = wrong
-            into = wrong
-            
-            # create an error record living in the wrong bin
-            eid = self._next_eid
-            self._next_eid += 1
-            rec = {"id": eid, "color": color, "actual": color, "current": into}
-            self._errors[eid] = rec
-            self._bin_errors[into].append(eid)
-            
-            # Record pickup time
-            self._error_start_times[eid] = time.time()
             msg = f"Inspection Task: sorted {color} into {into} - error (expected {color})"
             print(msg)
             
@@ -830,31 +580,13 @@ class InspectionTask(BaseTask):
             # Update flashing/badges immediately so the bin shows this (oldest) error color
             self._apply_flash_colors()
 
-    def _on_metrics_live(self, metrics):
-        # Always include correction fields
-        metrics['insp_correction_rate'] = (
-            (self._correct_corrections / self._total_corrections) * 100
-            if self._total_corrections > 0 else 0.0
-        )
-        metrics['insp_corrections'] = self._correct_corrections
-
-        # Update local metrics manager
-        if hasattr(self, "metrics_manager") and self.metrics_manager:
-            self.metrics_manager.update_metrics(metrics)
-
-        # Log to Observer
-        oc = getattr(self, "observer_control", None)
-        if oc:
-            ts = oc.get_timestamp()
-            logger = get_logger()
-            logger.log_metric(ts, "inspection", "boxes inspected", metrics.get("insp_total", 0))
-            logger.log_metric(ts, "inspection", "errors", metrics.get("insp_errors", 0))
-            logger.log_metric(ts, "inspection", "errors corrected", self._correct_corrections)
-
-        # Forward over network
-        client = getattr(self, "network_client", None)
-        if client:
-            client.send({"command": "metrics", "data": metrics})
+    # Current live metrics for the publisher (model counters plus correction and latency/alarm stats)
+    def _live_metrics(self):
+        metrics = self.sim.model.metrics()
+        metrics['insp_correction_rate'] = self.sim.bins.correction_rate()
+        metrics['insp_corrections'] = self.sim.bins.correct_corrections
+        metrics.update(self.sim.stats.metrics(self.sim.now()))
+        return metrics
 
 
     def play_sound(self, sound_name):
@@ -0,0 +1,76 @@
+# tasks/metrics_publisher.py
+from PyQt5.QtCore import QObject
+
+from .frame_scheduler import FrameTimer
+from event_logger import get_logger
+from network.metrics_delta import PUBLISH_MS, MetricsAggregator
+from simulation.summary import TaskSummary
+
+
+class MetricsPublisher(QObject):
+    # Live metrics of one task, published on a fixed cadence instead of per box: every PUBLISH_MS the task's
+    # counters are collected, and only what changed goes to the local dashboard, the session log and the network.
+    # The dashboard gets the full snapshot every tick (its graph advances even when nothing changed).
+    # collect() returns the task's current "<prefix>_*" metrics; log_names maps a field to its session log name.
+    # Every tick also feeds the task's end-of-session summary, so it is complete as soon as stop() returns.
+    def __init__(self, task, prefix, task_name, collect, log_names, interval_ms=PUBLISH_MS):
+        super().__init__(task)
+        self.task = task
+        self.task_name = task_name          # "sorting", "packaging", ... in the session log
+        self.collect = collect
+        self.log_names = log_names          # e.g. {"total": "boxes sorted", "errors": "errors"}
+        self.aggregator = MetricsAggregator(prefix)
+        self.summary = TaskSummary(prefix, task_name)
+        self._stats_logged = None
+
+        self._timer = FrameTimer(self, interval_ms)
+        self._timer.timeout.connect(self.publish)
+
+    # Session start: fresh numbering, first message is a keyframe
+    def start(self):
+        self.aggregator.reset()
+        self.summary.reset()
+        self._stats_logged = None
+        self._timer.start()
+
+    # Session end: send whatever changed since the last tick plus the summary, then go quiet
+    def stop(self):
+        if not self._timer.isActive():
+            return
+        self._timer.stop()
+        self.publish()
+
+        client = getattr(self.task, "network_client", None)
+        if client:
+            client.send({"command": "summary", "task": self.aggregator.prefix, "data": self.summary.result()})
+
+    def publish(self, *_):
+        metrics = self.collect()
+        self.summary.update(metrics, self.task.sim.now())
+        self.aggregator.update(metrics)
+        changed, msg = self.aggregator.take()
+
+        # Update local metrics manager
+        mm = getattr(self.task, "metrics_manager", None)
+        if mm:
+            mm.update_metrics(metrics)
+
+        # Log to Observer (changed counters only, plus the stats rows when the stats moved)
+        oc = getattr(self.task, "observer_control", None)
+        if oc and changed:
+            ts = oc.get_timestamp()
+            logger = get_logger()
+            for key, value in changed.items():
+                name = self.log_names.get(key.partition("_")[2])
+                if name:
+                    logger.log_metric(ts, self.task_name, name, value)
+            stats = getattr(self.task.sim, "stats", None)
+            if stats is not None and stats.version != self._stats_logged:
+                self._stats_logged = stats.version
+                for name, value in stats.log_rows(self.task.sim.now()):
+                    logger.log_metric(ts, self.task_name, name, value)
+
+        # Forward over network
+        client = getattr(self.task, "network_client", None)
+        if client:
+            client.send(msg)
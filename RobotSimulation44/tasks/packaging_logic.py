@@ -1,6 +1,7 @@
 # tasks/packaging_logic.py
-import time, random
+import time
 from PyQt5.QtCore import QThread, pyqtSignal
+from simulation.models import PackagingModel
 
 class PackagingWorker(QThread):
     """
@@ -10,37 +11,17 @@ class PackagingWorker(QThread):
     # Signals to GUI
     box_spawned = pyqtSignal(dict)      # {"color": <"red"|"blue"|...>}
     metrics_ready = pyqtSignal(dict)    # End-of-run summary
-    metrics_live = pyqtSignal(dict)     # Live metrics
     container_should_fade = pyqtSignal(str, int, int, float)  # Mode, count, capacity, seconds
 
-    def __init__(self, pace="slow", error_rate=0.0, bin_count=4):
+    def __init__(self, pace="slow", error_rate=0.0, bin_count=4, rng=None):
         super().__init__()
         self.pace = pace or "slow"
-        self.error_rate = float(error_rate or 0.0)
-        self.bin_count = int(bin_count) if bin_count is not None else 4
         self.running = True
 
-        # Set active palette based on bin count
-        if self.bin_count >= 6:
-            self.colors = ["red", "blue", "green", "purple", "orange", "teal"]
-        elif self.bin_count == 4:
-            self.colors = ["blue", "green", "purple", "orange"]
-        elif self.bin_count == 2:
-            self.colors = ["green", "purple"]
-        else:
-            self.colors = ["red", "blue", "green"][:max(1, self.bin_count)]
-
-        # Pace mapping for delays
-        self.pace_map = {
-            "slow":   (0.1, 0.3),
-            "medium": (0.3, 0.7),
-            "fast":   (0.7, 1.0),
-        }
-
-        # Metrics
-        self.total = 0
-        self.errors = 0
-        self.correct = 0
+        # Metrics, active palette and error roll (shared with the headless sim)
+        self.model = PackagingModel(self.pace, error_rate, bin_count, rng=rng)
+        self.bin_count = self.model.bin_count
+        self.colors = self.model.colors
         self.start_time = time.time()
 
         # Container state
@@ -52,36 +33,41 @@ class PackagingWorker(QThread):
         # The UI tells us which color is active via begin_container(color=...)
         self._cur_color = "green"
 
+    # Counters live on the model
+    @property
+    def total(self):
+        return self.model.total
+
+    @property
+    def errors(self):
+        return self.model.errors
+
+    @property
+    def correct(self):
+        return self.model.correct
+
+    @property
+    def error_rate(self):
+        return self.model.error_rate
+
     # Main thread loop
     def run(self):
-        lo, hi = self.pace_map.get(self.pace, (0.3, 0.7))
         while self.running:
             # The UI drip spawns; we only exist for pacing metrics and signals
             # Emit a heartbeat with pace—this keeps telemetry flowing even if unused
-            rate = max(1e-6, random.uniform(lo, hi))
-            time.sleep(1.0 / rate)
+            time.sleep(self.model.next_spawn_delay())
 
         # Emit end-of-thread metrics
         elapsed = max(1e-6, time.time() - self.start_time)
-        self.metrics_ready.emit({
-            "pack_total": self.total,
-            "pack_errors": self.errors,
-            "pack_error_rate": (self.errors / self.total) * 100 if self.total else 0
-        })
+        self.metrics_ready.emit(self.model.metrics())
 
     # Stop thread
     def stop(self):
         self.running = False
 
-    # Pick container capacity
-    @staticmethod
-    def pick_capacity(limit="4 - 6"):
-        if limit == "6":
-            return 6
-        elif limit == "5 - 6":
-            return random.choice((5, 6))
-        else:  # "4 - 6"
-            return random.choice((4, 5, 6))
+    # Pick container capacity (seeded stream on the model)
+    def pick_capacity(self, limit="4 - 6"):
+        return self.model.pick_capacity(limit)
 
     # Begin new container: UI tells us a fresh leftmost container is active (and its color)
     def begin_container(self, capacity: int, color: str = None):
@@ -99,19 +85,7 @@ class PackagingWorker(QThread):
         We maintain metrics and *suggest* a fade when count reaches capacity.
         """
         self._cur_count += 1
-        self.total += 1
-
-        if is_error:
-            self.errors += 1
-        else:
-            self.correct += 1
-
-        # Emit live metrics
-        self.metrics_live.emit({
-            "pack_total": self.total,
-            "pack_errors": self.errors,
-            "pack_error_rate": (self.errors / self.total) * 100 if self.total else 0
-        })
+        self.model.record(is_error)
 
         # Suggest container fade when full
         if not self._fired and self._cur_capacity > 0 and self._cur_count >= self._cur_capacity:
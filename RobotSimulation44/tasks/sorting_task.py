@@ -2,11 +2,16 @@
 from PyQt5.QtGui import QColor
 from PyQt5.QtCore import Qt, QTimer, QEvent, QPropertyAnimation, QRect
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QSizePolicy, QLabel, QLabel
-from .base_task import BaseTask, StorageContainerWidget
+from .base_task import BaseTask, StorageContainerWidget, BIN_STATE_BORDERS, box_qcolor, show_bin_replay
+from .frame_scheduler import FrameTimer, get_frame_scheduler
 from .sorting_logic import SortingWorker
+from .metrics_publisher import MetricsPublisher
 from audio_manager import AudioManager
-import random
-from event_logger import get_logger 
+from event_logger import (get_logger, EV_PLACED, EV_MISPLACED, EV_START, EV_STOP, EV_COMPLETE,
+                          EV_PICK, EV_DROP_OK, EV_DROP_WRONG, EV_CLICK_EMPTY)
+from simulation.models import colors_for_bins
+from simulation.rng import SessionRng
+from simulation.sorting import SortingSim
 
 
 class SortingTask(BaseTask):
@@ -104,30 +109,30 @@ class SortingTask(BaseTask):
         # Drag ghost for error correction
         self._drag_label = None        # QLabel that follows mouse
         self._drag_color = None        # QColor of the carried box
-        self._drag_timer = QTimer(self)
+        self._drag_timer = FrameTimer(self)
         self._drag_timer.setInterval(16)   # ~60fps
         self._drag_timer.timeout.connect(self._update_drag_ghost)
 
-        # Error move model
-        self._errors = {}                                # id -> {id,color,actual,current}
-        self._bin_errors = {k: [] for k in self._slot_to_widget.keys()}  # slot -> [ids]
-        self._next_eid = 1
-        self._selected_error = None                      # currently “picked up” error id (or None)
+        # Headless sorting sim (arm pick cycle + error bins); this widget only renders it
+        self.sim = SortingSim(belt=self.conveyor.belt)
+        self.sim.on_grab = lambda: self.play_sound("robotic_arm")
+        self.sim.on_sorted = self._on_box_sorted
+        self.sim.on_drop = self._on_box_dropped
+        self.sim.stats.on_alarm = lambda started, secs: get_logger().log_alarm("sorting", started, secs)
+
+        # Live metrics go out on a fixed cadence; counters are pulled from the sim, not pushed per box
+        self.metrics_pub = MetricsPublisher(
+            self, "sort", "sorting", self._live_metrics,
+            {"total": "boxes sorted", "errors": "errors", "corrections": "errors corrected"},
+        )
+
         # Alarm state
         self._alarm_active = False
 
         # Save original borders so we can highlight & restore
         self._orig_borders = {k: w.border for k, w in self._slot_to_widget.items()}
-
-        # Color map for error colors
-        self._slot_color_map = {
-            "red": QColor("#c82828"),
-            "blue": QColor("#2b4a91"),
-            "green": QColor("#1f7a3a"),
-            "purple": QColor("#6a1b9a"),
-            "orange": QColor("#c15800"),
-            "teal": QColor("#b8efe6"),
-        }
+        for w in self._slot_to_widget.values():
+            w.prerender_borders = BIN_STATE_BORDERS
 
         # Exclamation badges (one per bin)
         self._badges = {}
@@ -135,7 +140,7 @@ class SortingTask(BaseTask):
 
         # Flashing outline timer for bins with errors
         self._flash_on = False
-        self._flash_timer = QTimer(self)
+        self._flash_timer = FrameTimer(self)
         self._flash_timer.setInterval(350)   # speed of flash
         self._flash_timer.timeout.connect(self._flash_tick)
 
@@ -153,49 +158,24 @@ class SortingTask(BaseTask):
         self._box_timer = QTimer(self)
         self._box_timer.timeout.connect(self.conveyor.spawn_box)
 
-        # Arm "touch every box" animation (timer-driven)
-        self._pick_timer = QTimer(self)
+        # Arm "touch every box" animation (timer-driven, advances self.sim)
+        self._pick_timer = FrameTimer(self)
         self._pick_timer.setInterval(16)  # ~60 FPS
         self._pick_timer.timeout.connect(self._tick_pick)
 
-        # FSM state
-        self._pick_state = "idle"
-        self._pick_t = 0
-        self._pick_duration = 0
-        self._pick_from = (self.arm.shoulder_angle, self.arm.elbow_angle)
-        self._pick_to = (self.arm.shoulder_angle, self.arm.elbow_angle)
-
-        # Trigger settings to touch every box
-        self._now_ms = 0
-        self._last_touch_time_ms = -10000
-        self._touch_window_px = 18
-        self._touch_cooldown_ms = 120
-
-        # Despawn offset (independent of detection)
-        self._despawn_offset_px = 0  # +pixels to the RIGHT of detection; increase = disappears later
-
-        # remember which container direction to "present" toward after lift
-        self._target_slot = None  # one of: red/blue/green/purple/orange/teal
-        self._present_slot_override = None  # when worker says incorrect, we aim here
-
-        # capture color at trigger-time to avoid races
-        self._pending_color = None  # color captured exactly when the cycle starts
-
-        # For Reaction time
-        self._error_start_times = {}
-        # For Sorting correction accuracy
-        self._total_corrections = 0
-        self._correct_corrections = 0
-
         # initialize worker
         self.worker = None
 
     # Called by the observer GUI
-    def start(self, pace=None, bin_count=None, error_rate=None):
+    def start(self, pace=None, bin_count=None, error_rate=None, seed=None):
         # Guard: only run if this task is enabled
         if not getattr(self, "enabled", True):
             return
 
+        # Seeded session RNG (the Observer sends one seed per run; None = fresh seed)
+        self.rng = SessionRng(seed)
+        self.conveyor.rng = self.rng.stream("sorting.belt")
+
         # All bins in fixed order
         all_containers = {
             "red": self.container_red,
@@ -210,12 +190,8 @@ class SortingTask(BaseTask):
 
         # Worker already decides which colors are valid.
         # Just mirror that choice for container visibility.
-        if bin_count == 6:
-            slot_order = ["red", "blue", "green", "purple", "orange", "teal"]
-        elif bin_count == 4:
-            slot_order = ["blue", "green", "purple", "orange"]
-        elif bin_count == 2:
-            slot_order = ["green", "purple"]
+        if bin_count in (2, 4, 6):
+            slot_order = colors_for_bins(bin_count)
         else:
             slot_order = ["red", "blue", "green", "purple", "orange", "teal"][:bin_count]
 
@@ -226,21 +202,12 @@ class SortingTask(BaseTask):
         # Update slot -> widget mapping
         self._slot_to_widget = {name: all_containers[name] for name in slot_order}
 
-        # Reset per-bin error lists
-        self._bin_errors = {k: [] for k in self._slot_to_widget.keys()}
-
         # Belt motion
         self.conveyor.setBeltSpeed(120)   # left -> right
         self.conveyor.enable_motion(True)
 
-        # reset trigger state so we can fire immediately after a Stop
-        self._now_ms = 0
-        self._last_touch_time_ms = -10000
-        self._pick_state = "idle"
-        self._pick_t = 0
-        self._target_slot = None
-        self._present_slot_override = None
-        self._pending_color = None
+        # Reset per-bin error lists and trigger state so we can fire immediately after a Stop
+        self.sim.start(slot_order)
 
         # Reset metrics when new task is started
         if hasattr(self, "metrics_manager"):
@@ -251,8 +218,7 @@ class SortingTask(BaseTask):
 
         # Start arm pick monitor
         if not self._pick_timer.isActive():
-            sh, el = self._pose_home()
-            self._set_arm(sh, el)
+            self._sync_arm()
             self._pick_timer.start()
 
         # Start flashing timer
@@ -264,17 +230,22 @@ class SortingTask(BaseTask):
             self.worker = SortingWorker(
                 pace=pace,
                 bin_count=bin_count,
-                error_rate=error_rate
+                error_rate=error_rate,
+                rng=self.rng
             )
             self.worker.box_spawned.connect(self.spawn_box_from_worker)
-            self.worker.box_sorted.connect(self._on_box_sorted)
-            self.worker.metrics_live.connect(self._on_metrics_live)
             self.worker.start()
         elif not self.worker.isRunning():
             self.worker.running = True
             if not self.worker.isRunning():
                 self.worker.start()
 
+        # The sim rolls each sort on the worker (counters + live metrics)
+        self.sim.model = self.worker.model
+        self.sim.sorter = self.worker.sort_box
+        self.metrics_pub.start()
+        get_logger().log_user("sorting", EV_START, pace, error_rate)
+
 
     def complete(self):
         # Stop motions
@@ -289,13 +260,14 @@ class SortingTask(BaseTask):
         #Stop conveyor sound and alarm
         self.audio.stop_conveyor()
         self.audio.stop_alarm()
+        self.sim.stats.alarm_stopped(self.sim.now(), cleared=False)
+
+        # Final metrics tick before the sim clears its counters
+        self.metrics_pub.stop()
+        get_logger().log_user("sorting", EV_COMPLETE)
 
         # Clear all boxes from the conveyor
-        if hasattr(self.conveyor, "_boxes"):
-            self.conveyor._boxes.clear()
-        if hasattr(self.conveyor, "_box_colors"):
-            self.conveyor._box_colors.clear()
-        self.conveyor.update()
+        self.conveyor.clear_boxes()
 
         # Reset borders and hide badges
         for slot, w in self._slot_to_widget.items():
@@ -304,26 +276,21 @@ class SortingTask(BaseTask):
         for b in self._badges.values():
             b.hide()
 
-        # Return arm to home
-        sh, el = self._pose_home()
-        self._set_arm(sh, el)
-        self.arm.held_box_visible = False
-        self.arm.update()
-
         # Clear highlight if any selection
-        if self._selected_error is not None:
+        if self.sim.bins.selected is not None:
             for slot in self._slot_to_widget.keys():
                 self._highlight_bin(slot, False)
-            self._selected_error = None
+        self._end_drag_box()
 
         # Stop worker logic
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker = None
+        self.sim.sorter = None
 
-        # Reset correction counters
-        self._total_corrections = 0
-        self._correct_corrections = 0
+        # Return arm to home; clears errors, selection and correction counters
+        self.sim.stop()
+        self._sync_arm()
 
     def stop(self):
         # Stop motions
@@ -338,13 +305,14 @@ class SortingTask(BaseTask):
         # Stop conveyor sound and alarm
         self.audio.stop_conveyor()
         self.audio.stop_alarm()
+        self.sim.stats.alarm_stopped(self.sim.now(), cleared=False)
+
+        # Final metrics tick before the sim clears its counters
+        self.metrics_pub.stop()
+        get_logger().log_user("sorting", EV_STOP)
 
         # Clear all boxes from the conveyor
-        if hasattr(self.conveyor, "_boxes"):
-            self.conveyor._boxes.clear()
-        if hasattr(self.conveyor, "_box_colors"):
-            self.conveyor._box_colors.clear()
-        self.conveyor.update()
+        self.conveyor.clear_boxes()
 
         # Reset borders and hide badges
         for slot, w in self._slot_to_widget.items():
@@ -353,259 +321,48 @@ class SortingTask(BaseTask):
         for b in self._badges.values():
             b.hide()
 
-        # Return arm to home
-        sh, el = self._pose_home()
-        self._set_arm(sh, el)
-        self.arm.held_box_visible = False
-        self.arm.update()
-
         # Clear highlight if any selection
-        if self._selected_error is not None:
+        if self.sim.bins.selected is not None:
             for slot in self._slot_to_widget.keys():
                 self._highlight_bin(slot, False)
-            self._selected_error = None
+        self._end_drag_box()
 
         # Stop worker logic
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker = None
+        self.sim.sorter = None
+
+        # Return arm to home; clears errors, selection and correction counters
+        self.sim.stop()
+        self._sync_arm()
 
         # Reset metrics
         if hasattr(self, "metrics_manager"):
             self.metrics_manager.reset_metrics()
-        # Reset correction counters
-        self._total_corrections = 0
-        self._correct_corrections = 0
-
-
-    # Arm pick cycle (approach -> descend -> hold -> lift -> present -> return)
-    def _pose_home(self):
-        return (-90.0, -0.0)
-
-    def _pose_prep(self):
-        return (-92.0, -12.0)
-
-    def _pose_pick(self):
-        return (-110.0, -95.0)
-
-    def _pose_lift(self):
-        return (-93.0, -10.0)
-
-    # Quick 'pointing' poses toward each container’s general direction
-    # (arm rotation from base, elbow rotation)
-    # -90 is directly up
-    def _pose_present(self, slot):
-        poses = {
-            "red":    (-200.0, -8.0),   # far left
-            "blue":   (-220.0, -10.0),  # left-mid
-            "green":  (-240.0, -12.0),  # slightly left of center
-            "purple": (60.0,  12.0),    # slightly right of center
-            "orange": (40.0,  10.0),    # right-mid
-            "teal":   (20.0,  8.0),     # far right
-        }
-        return poses.get(slot, self._pose_lift())
-
-    def _set_arm(self, shoulder, elbow):
-        self.arm.shoulder_angle = float(shoulder)
-        self.arm.elbow_angle = float(elbow)
-        self.arm.update()
 
-    def _start_seg(self, to_angles, duration_ms):
-        self._pick_from = (self.arm.shoulder_angle, self.arm.elbow_angle)
-        self._pick_to = (float(to_angles[0]), float(to_angles[1]))
-        self._pick_duration = max(1, int(duration_ms))
-        self._pick_t = 0
-
-    def _tick_pick(self):
-        # global time
-        self._now_ms += self._pick_timer.interval()
-
-        # If idle, only start a cycle when a box is near the gripper
-        if self._pick_state == "idle":
-            if self._box_near_grip() and (self._now_ms - self._last_touch_time_ms) >= self._touch_cooldown_ms:
-                self._last_touch_time_ms = self._now_ms
-
-                # Lock color & slot at trigger time
-                self._pending_color = self._color_of_box_in_window()
-                self._target_slot = self._color_to_slot(self._pending_color) if self._pending_color else None
-
-                self._pick_state = "to_prep"
-                self._start_seg(self._pose_prep(), 120)  # fast move
-            else:
-                return
-
-        # advance interpolation for non-idle states
-        self._pick_t += self._pick_timer.interval()
-        t = min(1.0, self._pick_t / float(self._pick_duration))
-        s0, e0 = self._pick_from
-        s1, e1 = self._pick_to
-        s = s0 + (s1 - s0) * t
-        e = e0 + (e1 - e0) * t
-        self._set_arm(s, e)
-
-        # Despawn slightly later than detection (only while interacting)
-        if self._pick_state in ("hold", "lift"):
-            self._despawn_if_past_cutoff()
-
-        # segment complete -> next state
-        if t >= 1.0:
-            if self._pick_state == "to_prep":
-                self._pick_state = "descend"
-                self._start_seg(self._pose_pick(), 120)
-
-            elif self._pick_state == "descend":
-                # Trigger sorting only when arm reaches box
-                nearest_color = self._color_of_box_in_window()
-                self.play_sound("robotic_arm")
-                if nearest_color:
-                    hex_color = nearest_color.name() if hasattr(nearest_color, "name") else nearest_color
-                    COLOR_MAP = {
-                        "#c82828": "red",
-                        "#2b4a91": "blue",
-                        "#1f7a3a": "green",
-                        "#6a1b9a": "purple",
-                        "#c15800": "orange",
-                        "#b8efe6": "teal"
-                    }
-                    self.worker.sort_box(COLOR_MAP.get(hex_color, "unknown"))
-
-                self._pick_state = "hold"
-                # Capture held box color
-                c = self._color_of_box_in_window() or self._pending_color
-                if c is not None:
-                    self.arm.held_box_color = c
-                    self.arm.held_box_visible = True
-                    self._target_slot = self._color_to_slot(c)
-                    self.arm.update()
-                self._start_seg(self._pose_pick(), 40)
-
-            elif self._pick_state == "hold":
-                self._pick_state = "lift"
-                self._start_seg(self._pose_lift(), 120)
-
-            elif self._pick_state == "lift":
-                # Still move the arm towards the target container
-                slot_to_use = self._present_slot_override or self._target_slot
-                if slot_to_use:
-                    self._pick_state = "present"
-                    self._start_seg(self._pose_present(slot_to_use), 200)
-                else:
-                    self._pick_state = "return"
-                    self.arm.held_box_visible = False
-                    self.arm.update()
-                    self._start_seg(self._pose_home(), 160)
-
-            elif self._pick_state == "present":
-                # Animate flying box at the moment of drop
-                slot_to_use = self._present_slot_override or self._target_slot
-                if slot_to_use:
-                    target_widget = self._slot_to_widget.get(slot_to_use)
-                    if target_widget and getattr(self.arm, "held_box_color", None):
-                        self._animate_flying_box(self.arm.held_box_color, target_widget)
-
-                # Hide held box and return arm
-                self._pick_state = "return"
-                self.arm.held_box_visible = False
-                self.arm.update()
-                self._start_seg(self._pose_home(), 200)
-
-            elif self._pick_state == "return":
-                self._pick_state = "idle_pause"
-                self._target_slot = None
-                self._pending_color = None
-                self._present_slot_override = None
-                self._start_seg(self._pose_home(), 40)
-
-            elif self._pick_state == "idle_pause":
-                self._pick_state = "idle"
-
-    # Helpers
-    def _grip_x(self):
-        # Single source of truth for the gripper's detection X (edit here to shift detection) 
-        return self.conveyor.width() * 0.44 # Change this value to increate/decrease the position where the robot arm picks up a box
-
-    def _box_near_grip(self):
-        # Detection-only: True if any box is within the window around the gripper 
-        boxes = getattr(self.conveyor, "_boxes", None)
-        if not boxes:
-            return False
-        grip_x = self._grip_x()  # unified detection X
-        w = self._touch_window_px
-        for x in boxes:
-            if (grip_x - w) <= x <= (grip_x + w):
-                return True
-        return False
-
-    def _despawn_if_past_cutoff(self):
-        # Remove a box after it passes the later cutoff (independent of detection) 
-        boxes = getattr(self.conveyor, "_boxes", None)
-        if not boxes:
-            return
-        # Get the list of box colors
-        colors = getattr(self.conveyor, "_box_colors", None)
-
-        # Use the same detection X as the gripper trigger
-        detect_x = self._grip_x()
-        cutoff_x = detect_x + self._despawn_offset_px  # set offset to 0 so the box disappears as soon as its touched
-
-        # Find the first box that has passed the cutoff point
-        hit_index = -1
-        for i, x in enumerate(boxes):
-            if x >= cutoff_x:
-                hit_index = i
-                break
-        
-        # Remove the box and its color if a cutoff was detected
-        if hit_index != -1:
-            del boxes[hit_index]
-            if isinstance(colors, list) and hit_index < len(colors):
-                del colors[hit_index]
-            self.conveyor.update()
-
-    # Helper to get nearest box color
-    def _color_of_box_in_window(self):
-        # Return the QColor of the first box currently inside the detection window (or None) 
-        boxes = getattr(self.conveyor, "_boxes", None)
-        cols  = getattr(self.conveyor, "_box_colors", None)
-        if not boxes or not cols:
-            return None
-        grip_x = self._grip_x()  # unified detection X
-        w = self._touch_window_px
-        for i, x in enumerate(boxes):
-            if (grip_x - w) <= x <= (grip_x + w):
-                if i < len(cols):
-                    return cols[i]
-        return None
-    
-    # Map a QColor to a slot name matching the containers
-    def _color_to_slot(self, qcolor):
-        try:
-            key = qcolor.name().lower()
-        except Exception:
-            return None
-        if key == "#c82828":
-            return "red"
-        if key == "#2b4a91":
-            return "blue"
-        if key == "#1f7a3a":
-            return "green"
-        if key == "#6a1b9a":
-            return "purple"
-        if key == "#c15800":
-            return "orange"
-        if key == "#b8efe6":
-            return "teal"
-        return None
-    
-    # Pick a wrong bin (used when worker flags an incorrect sort)
-    def _wrong_slot_for(self, slot):
-        candidates = list(self._slot_to_widget.keys())
-        try:
-            candidates.remove(slot)
-        except ValueError:
-            pass
-        return random.choice(candidates) if candidates else slot
 
+    # Arm pick cycle (approach -> descend -> hold -> lift -> present -> return) runs in self.sim
+    def _sync_arm(self):
+        # Mirror the sim's arm pose and held box onto the arm widget
+        arm = self.sim.arm
+        self.arm.shoulder_angle = float(arm.shoulder)
+        self.arm.elbow_angle = float(arm.elbow)
+        self.arm.held_box_visible = arm.held is not None
+        if arm.held is not None:
+            self.arm.held_box_color = box_qcolor(arm.held)
+        get_frame_scheduler().request_update(self.arm)
+
+    def _tick_pick(self, dt_ms):
+        # Advance the sim by the real frame time from the shared scheduler
+        if self.sim.tick(dt_ms):
+            self._sync_arm()
+
+    def _on_box_dropped(self, color, slot):
+        # Animate flying box at the moment of drop
+        target_widget = self._slot_to_widget.get(slot)
+        if target_widget:
+            self._animate_flying_box(box_qcolor(color), target_widget)
 
     def _animate_flying_box(self, color, target_widget):
         # Spawn a temporary box at the gripper and animate it flying into the container 
@@ -662,10 +419,7 @@ class SortingTask(BaseTask):
 
     def _current_selected_slot(self):
         # Return the slot of the currently selected (held) error, if any 
-        if self._selected_error is None:
-            return None
-        rec = self._errors.get(self._selected_error)
-        return rec['current'] if rec else None
+        return self.sim.bins.selected_slot()
 
         # Drag ghost helpers
     def _start_drag_box(self, color: QColor):
@@ -744,42 +498,34 @@ class SortingTask(BaseTask):
         # Apply flashing borders per-bin based on oldest unresolved error, and update badges, Alarm starts only if an error has been active for >=2s, and stops when all are cleared 
         selected_slot = self._current_selected_slot()
         oldest_age = 0.0  # track age of the oldest unresolved error
+        bins = self.sim.bins
+        now = self.sim.now()
 
         for slot, w in self._slot_to_widget.items():
-            ids = self._bin_errors.get(slot, [])
             badge = self._badges.get(slot)
 
-            if ids:
-                head = ids[0]
-                rec = self._errors.get(head)
-                if rec:
-                    # Border flashing color (based on error color)
-                    flash_q = self._slot_color_map.get(
-                        rec['color'], self._orig_borders.get(slot, w.border)
+            rec = bins.head(slot)
+            if rec:
+                # Border flashing color (based on error color)
+                q = box_qcolor(rec['color'])
+                if slot != selected_slot:  # selection highlight takes priority
+                    w.border = q if self._flash_on else self._orig_borders.get(slot, w.border)
+                    w.update()
+
+                # Badge styling
+                if badge:
+                    badge.setStyleSheet(
+                        "color: white; "
+                        f"background: {q.name()}; "
+                        f"border: 2px solid {q.darker(130).name()}; "
+                        "border-radius: 20px; font-weight: 800; font-size: 24px;"
                     )
-                    if slot != selected_slot:  # selection highlight takes priority
-                        w.border = flash_q if self._flash_on else self._orig_borders.get(slot, w.border)
-                        w.update()
-
-                    # Badge styling
-                    if badge:
-                        q = self._slot_color_map.get(rec['color'])
-                        if q:
-                            badge.setStyleSheet(
-                                "color: white; "
-                                f"background: {q.name()}; "
-                                f"border: 2px solid {q.darker(130).name()}; "
-                                "border-radius: 20px; font-weight: 800; font-size: 24px;"
-                            )
-                            badge.show()
-
-                    # compute age of this error
-                    import time
-                    started = self._error_start_times.get(head)
-                    if started:
-                        age = time.time() - started
-                        if age > oldest_age:
-                            oldest_age = age
+                    badge.show()
+
+                # compute age of this error
+                age = bins.head_age(slot, now)
+                if age > oldest_age:
+                    oldest_age = age
             else:
                 # No errors -> restore original + hide badge
                 if w.border != self._orig_borders.get(slot, w.border) and slot != selected_slot:
@@ -789,115 +535,78 @@ class SortingTask(BaseTask):
                     badge.hide()
 
         # Alarm logic
-        if self._errors:
+        if bins.errors:
             if oldest_age >= 2.0 and not getattr(self, "_alarm_active", False):
                 self.play_sound("alarm")
                 self._alarm_active = True
+                self.sim.stats.alarm_started(oldest_age, now)
         else:
             if getattr(self, "_alarm_active", False):
                 self.audio.stop_alarm()
                 self._alarm_active = False
+                self.sim.stats.alarm_stopped(now)
 
     def _flash_tick(self):
         self._flash_on = not self._flash_on
         self._apply_flash_colors()
 
+    # Show a replayed scene (simulation.replay): each bin's oldest open error as a steady border + badge, the bin
+    # the user is picking from highlighted. Renders only; the sim, alarm and logger are not touched.
+    def show_replay(self, scene):
+        show_bin_replay(self, scene)
+
     def _on_container_clicked(self, slot):
         # === CASE 1: Not holding anything, attempt to PICK from this bin ===
-        if self._selected_error is None:
-            ids = self._bin_errors.get(slot, [])
-            if not ids:
-                print(f"(Sorting Task: No errors in {slot} to pick up)")
-                return
-
+        if self.sim.bins.selected is None:
             # FIFO pick one error from the clicked bin
-            eid = ids.pop(0)
-            rec = self._errors.get(eid)
+            rec = self.sim.pick_error(slot)
             if not rec:
+                print(f"(Sorting Task: No errors in {slot} to pick up)")
+                get_logger().log_user("sorting", EV_CLICK_EMPTY, slot)
                 return
 
-            self._selected_error = eid
+            get_logger().log_user("sorting", EV_PICK, rec['color'], slot)
             self._highlight_bin(slot, True)
-            msg = (f"Sorting Task: Picked error #{eid}: {rec['color']} currently in {slot}. "
+            msg = (f"Sorting Task: Picked error #{rec['id']}: {rec['color']} currently in {slot}. "
                    f"Click the correct container ({rec['actual']}).")
             print(msg)
 
             # Spawn ghost box
-            q = self._slot_color_map.get(rec['color'])
-            if q:
-                self._start_drag_box(q)
+            self._start_drag_box(box_qcolor(rec['color']))
 
             # Update flashing/badges immediately (selected bin stops flashing)
             self._apply_flash_colors()
             return
 
         # === CASE 2: Holding an error, drop it into clicked bin ===
-        eid = self._selected_error
-        rec = self._errors.get(eid)
+        held = self.sim.bins.selected_record()
+        if held:
+            # Remove highlight from previous bin
+            self._highlight_bin(held['current'], False)
+
+        rec, correct = self.sim.place_error(slot)
         if not rec:
-            self._selected_error = None
             self._end_drag_box()
             self._apply_flash_colors()
             return
 
-        # Remove highlight from previous bin
-        self._highlight_bin(rec['current'], False)
-        prev = rec['current']
-        new_slot = slot
-
-        # Remove the error ID from the previous bin if it was still listed there
-        try:
-            if eid in self._bin_errors.get(prev, []):
-                self._bin_errors[prev].remove(eid)
-        except ValueError:
-            pass
+        get_logger().log_user("sorting", EV_DROP_OK if correct else EV_DROP_WRONG, rec['color'], slot)
 
-        rec['current'] = new_slot
-        self._total_corrections += 1
-
-        if new_slot == rec['actual']:
+        if correct:
             # Correct placement — resolve error
-            self._correct_corrections += 1
-            import time
-            self._error_start_times.pop(eid, None)
-            print(f"Sorting Task: Resolved error #{eid}: moved {rec['color']} to {new_slot}")
-
-            # Remove from error lists
-            try:
-                if eid in self._bin_errors.get(new_slot, []):
-                    self._bin_errors[new_slot].remove(eid)
-            except ValueError:
-                pass
-            del self._errors[eid]
-
-            # Play correct chime
+            print(f"Sorting Task: Resolved error #{rec['id']}: moved {rec['color']} to {slot}")
             self.play_sound("correct_chime")
         else:
             # Wrong placement — treat as permanently failed, clear the error too
-            import time
-            self._error_start_times.pop(eid, None)
-            print(f"Sorting Task: Error #{eid} placed incorrectly in {new_slot} and cleared (was {rec['actual']})")
-
-            # Remove error record completely
-            try:
-                if eid in self._bin_errors.get(new_slot, []):
-                    self._bin_errors[new_slot].remove(eid)
-            except ValueError:
-                pass
-            if eid in self._errors:
-                del self._errors[eid]
-
-            # Play incorrect chime
+            print(f"Sorting Task: Error #{rec['id']} placed incorrectly in {slot} and cleared (was {rec['actual']})")
             self.play_sound("incorrect_chime")
 
-        # End drag + deselect
-        self._selected_error = None
+        # End drag
         self._end_drag_box()
 
         # Stop alarm if no errors remain
         try:
-            no_errors_left = not self._errors or all(len(v) == 0 for v in self._bin_errors.values())
-            if no_errors_left:
+            if not self.sim.bins.errors:
                 self.audio.stop_alarm()
         except Exception:
             pass
@@ -911,34 +620,15 @@ class SortingTask(BaseTask):
         color = box_data["color"]
         error = box_data["error"]
 
-    def _on_box_sorted(self, color, correct):
-        # Only allow recognized colors to be processed
-        valid = {"red", "blue", "green", "purple", "orange", "teal"}
-        if color not in valid:
-            return
-
+    def _on_box_sorted(self, color, into, correct, eid):
+        # Sim callback: the sort was decided and (if wrong) an error record now lives in `into`
+        get_logger().log_robot("sorting", EV_PLACED if correct else EV_MISPLACED, color, into)
         if correct:
             # If sorting is correct, show the correct slot highlight and play correct chime
-            self._present_slot_override = color
-            into = color
             msg = f"Sorting Task: sorted {color} into {into} - correct"
             print(msg)
             self.play_sound("correct_chime")
         else:
-            # If sorting is incorrect, determine which wrong bin it was placed in
-            wrong = self._present_slot_override or self._wrong_slot_for(color)
-            self._present_slot_override = wrong
-            into = wrong
-
-            # create an error record living in the wrong bin
-            eid = self._next_eid
-            self._next_eid += 1
-            rec = {"id": eid, "color": color, "actual": color, "current": into}
-            self._errors[eid] = rec
-            self._bin_errors[into].append(eid)
-            # Record pickup time
-            import time
-            self._error_start_times[eid] = time.time()
             msg = f"Sorting Task: sorted {color} into {into} - error (expected {color})"
             print(msg)
 
@@ -959,31 +649,13 @@ class SortingTask(BaseTask):
         self.conveyor.spawn_box(color=color, error=error)
 
 
-    def _on_metrics_live(self, metrics):
-        # Always include correction fields
-        metrics['sort_correction_rate'] = (
-            (self._correct_corrections / self._total_corrections) * 100
-            if self._total_corrections > 0 else 0.0
-        )
-        metrics['sort_corrections'] = self._correct_corrections
-
-        # Update local metrics manager
-        if hasattr(self, "metrics_manager") and self.metrics_manager:
-            self.metrics_manager.update_metrics(metrics)
-
-        # Log to Observer
-        oc = getattr(self, "observer_control", None)
-        if oc:
-            ts = oc.get_timestamp()
-            logger = get_logger()
-            logger.log_metric(ts, "sorting", "boxes sorted", metrics.get("sort_total", 0))
-            logger.log_metric(ts, "sorting", "errors", metrics.get("sort_errors", 0))
-            logger.log_metric(ts, "sorting", "errors corrected", self._correct_corrections)
-
-        # Forward over network
-        client = getattr(self, "network_client", None)
-        if client:
-            client.send({"command": "metrics", "data": metrics})
+    # Current live metrics for the publisher (model counters plus correction and latency/alarm stats)
+    def _live_metrics(self):
+        metrics = self.sim.model.metrics()
+        metrics['sort_correction_rate'] = self.sim.bins.correction_rate()
+        metrics['sort_corrections'] = self.sim.bins.correct_corrections
+        metrics.update(self.sim.stats.metrics(self.sim.now()))
+        return metrics
 
 
     def play_sound(self, sound_name):